@@ -0,0 +1,95 @@
+# animations.py
+"""
+Animații neblocante pentru feedback vizual, bazate pe after()
+"""
+from typing import Callable, List, Optional, Tuple
+import tkinter as tk
+
+# Un pas de animație: (întârziere în ms înainte de pas, acțiune)
+Step = Tuple[int, Callable[[], None]]
+
+class Animator:
+    """
+    Rulează o secvență de pași pe un widget cu after(), fără fire și fără sleep
+    
+    Doar o animație rulează la un moment dat: play() oprește animația
+    anterioară, iar cancel() o oprește fără a rula pașii rămași.
+    """
+    
+    def __init__(self, widget: tk.Widget):
+        self.widget = widget
+        self._steps: List[Step] = []
+        self._index = 0
+        self._loop = False
+        self._after_id: Optional[str] = None
+        self._on_done: Optional[Callable[[], None]] = None
+    
+    @property
+    def is_running(self) -> bool:
+        return self._after_id is not None
+    
+    @property
+    def loop(self) -> bool:
+        return self._loop
+    
+    def play(self, steps: List[Step], loop: bool = False,
+             on_done: Optional[Callable[[], None]] = None) -> None:
+        """Pornește o animație, înlocuind-o pe cea în curs"""
+        self.cancel()
+        if not steps:
+            return
+        self._steps = steps
+        self._index = 0
+        self._loop = loop
+        self._on_done = on_done
+        self._schedule()
+    
+    def cancel(self) -> None:
+        """Oprește animația în curs"""
+        if self._after_id is not None:
+            try:
+                self.widget.after_cancel(self._after_id)
+            except tk.TclError:
+                pass
+            self._after_id = None
+        self._steps = []
+        self._on_done = None
+    
+    def _schedule(self) -> None:
+        """Programează pasul curent"""
+        delay, _ = self._steps[self._index]
+        self._after_id = self.widget.after(delay, self._run_step)
+    
+    def _run_step(self) -> None:
+        """Execută pasul curent și îl programează pe următorul"""
+        _, action = self._steps[self._index]
+        action()
+        
+        self._index += 1
+        if self._index >= len(self._steps):
+            if not self._loop:
+                on_done = self._on_done
+                self._after_id = None
+                self._steps = []
+                self._on_done = None
+                if on_done:
+                    on_done()
+                return
+            self._index = 0
+        self._schedule()
+
+def blink_steps(on: Callable[[], None], off: Callable[[], None],
+                count: int, duration_ms: int) -> List[Step]:
+    """Pași pentru o clipire repetată: aprins, stins, de `count` ori"""
+    steps: List[Step] = []
+    for i in range(count):
+        steps.append((0 if i == 0 else duration_ms, on))
+        steps.append((duration_ms, off))
+    return steps
+
+def pulse_steps(on: Callable[[], None], off: Callable[[], None],
+                period_ms: int) -> List[Step]:
+    """Pași pentru un puls continuu (de rulat cu loop=True)"""
+    half = max(1, period_ms // 2)
+    # Ultimul pas doar așteaptă, ca pulsul următor să înceapă după o perioadă întreagă
+    return [(0, on), (half, off), (half, lambda: None)]
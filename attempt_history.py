@@ -0,0 +1,341 @@
+# attempt_history.py
+"""
+Istoricul încercărilor, păstrat pe coloane NumPy, cu agregări vectorizate
+"""
+import argparse
+import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+import numpy as np
+from config import AppConfig
+
+DAY_SECONDS = 24 * 60 * 60
+# Istoricul stă lângă cod, deci nu depinde de directorul curent
+DEFAULT_HISTORY_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), AppConfig.HISTORY_FILE)
+
+@dataclass
+class _View:
+    """Coloanele și numele la un moment dat, luate sub lacăt pentru o interogare"""
+    columns: Dict[str, np.ndarray]
+    names: Dict[str, List[str]]
+    ids: Dict[str, Dict[str, int]]
+
+class AttemptHistory:
+    """
+    Toate încercările tuturor pacienților, pe coloane
+    
+    Cuvintele, categoriile și pacienții sunt internați (un id întreg pentru
+    fiecare nume), iar coloanele cresc prin dublarea capacității. Timpii sunt
+    păstrați ca float64: în float32 o secundă Unix are o rezoluție de câteva
+    minute. Interogările folosesc doar operații NumPy pe coloane, fără bucle
+    Python peste încercări, pe o vedere luată sub lacăt: rândurile existente
+    nu se mai modifică, deci vederea rămâne validă chiar dacă append()
+    realocă între timp coloanele.
+    """
+    
+    COLUMNS = {
+        'word': np.int32,
+        'category': np.int32,
+        'patient': np.int32,
+        'similarity': np.float32,
+        'correct': np.bool_,
+        'timestamp': np.float64
+    }
+    
+    def __init__(self, path: Optional[str] = DEFAULT_HISTORY_FILE,
+                 initial_capacity: int = 1024):
+        self.path = path
+        self._lock = threading.Lock()
+        self._size = 0
+        self._columns = {name: np.empty(initial_capacity, dtype) for name, dtype in self.COLUMNS.items()}
+        self._names: Dict[str, List[str]] = {'word': [], 'category': [], 'patient': []}
+        self._ids: Dict[str, Dict[str, int]] = {'word': {}, 'category': {}, 'patient': {}}
+        # Salvarea în fundal: un singur fir, cererile din timpul unei salvări sunt comasate
+        self._save_lock = threading.Lock()
+        self._save_condition = threading.Condition()
+        self._save_requested = False
+        self._save_thread: Optional[threading.Thread] = None
+        
+        if path and os.path.exists(path):
+            self.load(path)
+    
+    def __len__(self) -> int:
+        return self._size
+    
+    def _intern(self, kind: str, name: str) -> int:
+        """Id-ul numelui, alocat la prima apariție"""
+        ids = self._ids[kind]
+        identifier = ids.get(name)
+        if identifier is None:
+            identifier = ids[name] = len(self._names[kind])
+            self._names[kind].append(name)
+        return identifier
+    
+    def _reserve(self, count: int) -> None:
+        """Mărește coloanele (dublând capacitatea) ca să încapă încă `count` rânduri"""
+        capacity = len(self._columns['word'])
+        needed = self._size + count
+        if needed <= capacity:
+            return
+        while capacity < needed:
+            capacity *= 2
+        for name, column in self._columns.items():
+            grown = np.empty(capacity, column.dtype)
+            grown[:self._size] = column[:self._size]
+            self._columns[name] = grown
+    
+    def append(self, word: str, similarity: float, correct: bool,
+               category: str = "", patient: str = AppConfig.DEFAULT_PATIENT,
+               timestamp: Optional[float] = None) -> None:
+        """Adaugă o încercare"""
+        with self._lock:
+            self._reserve(1)
+            row = self._size
+            self._columns['word'][row] = self._intern('word', word)
+            self._columns['category'][row] = self._intern('category', category)
+            self._columns['patient'][row] = self._intern('patient', patient)
+            self._columns['similarity'][row] = similarity
+            self._columns['correct'][row] = correct
+            self._columns['timestamp'][row] = time.time() if timestamp is None else timestamp
+            self._size += 1
+    
+    def extend(self, words: List[str], similarities, correct, timestamps,
+               category: str = "", patient: str = AppConfig.DEFAULT_PATIENT) -> None:
+        """Adaugă mai multe încercări ale aceluiași pacient, dintr-o categorie"""
+        count = len(words)
+        with self._lock:
+            self._reserve(count)
+            rows = slice(self._size, self._size + count)
+            self._columns['word'][rows] = [self._intern('word', word) for word in words]
+            self._columns['category'][rows] = self._intern('category', category)
+            self._columns['patient'][rows] = self._intern('patient', patient)
+            self._columns['similarity'][rows] = similarities
+            self._columns['correct'][rows] = correct
+            self._columns['timestamp'][rows] = timestamps
+            self._size += count
+    
+    def column(self, name: str) -> np.ndarray:
+        """Vedere (fără copiere) asupra coloanei, limitată la rândurile folosite"""
+        with self._lock:
+            return self._columns[name][:self._size]
+    
+    def _view(self) -> _View:
+        """Vederi asupra tuturor coloanelor, cu aceeași lungime, și numele de atunci"""
+        with self._lock:
+            return _View(
+                {name: column[:self._size] for name, column in self._columns.items()},
+                self._names,
+                self._ids
+            )
+    
+    @staticmethod
+    def _mask(view: _View, patient: Optional[str] = None, category: Optional[str] = None,
+              since: Optional[float] = None) -> Optional[np.ndarray]:
+        """Masca rândurilor care corespund filtrelor (None = toate rândurile)"""
+        mask = None
+        for kind, name in (('patient', patient), ('category', category)):
+            if name is None:
+                continue
+            identifier = view.ids[kind].get(name, -1)
+            selected = view.columns[kind] == identifier
+            mask = selected if mask is None else mask & selected
+        if since is not None:
+            selected = view.columns['timestamp'] >= since
+            mask = selected if mask is None else mask & selected
+        return mask
+    
+    @staticmethod
+    def _select(view: _View, name: str, mask: Optional[np.ndarray]) -> np.ndarray:
+        column = view.columns[name]
+        return column if mask is None else column[mask]
+    
+    def _grouped(self, view: _View, kind: str, mask: Optional[np.ndarray]) -> Tuple[np.ndarray, np.ndarray]:
+        """Numărul de încercări și de reușite pentru fiecare id de tipul dat"""
+        ids = self._select(view, kind, mask)
+        size = len(view.names[kind])
+        attempts = np.bincount(ids, minlength=size)
+        successes = np.bincount(ids, weights=self._select(view, 'correct', mask), minlength=size)
+        return attempts, successes
+    
+    def accuracy(self, patient: Optional[str] = None, category: Optional[str] = None,
+                 since: Optional[float] = None) -> Tuple[int, float]:
+        """Numărul de încercări și procentajul de reușită"""
+        view = self._view()
+        correct = self._select(view, 'correct', self._mask(view, patient, category, since))
+        if not len(correct):
+            return 0, 0.0
+        return int(len(correct)), float(correct.mean() * 100)
+    
+    def word_accuracy(self, patient: Optional[str] = None, category: Optional[str] = None,
+                      since: Optional[float] = None) -> Dict[str, Tuple[int, float]]:
+        """Pentru fiecare cuvânt încercat: (încercări, procentaj de reușită)"""
+        view = self._view()
+        attempts, successes = self._grouped(view, 'word', self._mask(view, patient, category, since))
+        tried = np.flatnonzero(attempts)
+        rates = successes[tried] / attempts[tried] * 100
+        words = view.names['word']
+        return {words[i]: (int(attempts[i]), float(rate)) for i, rate in zip(tried, rates)}
+    
+    def category_accuracy(self, patient: Optional[str] = None,
+                          since: Optional[float] = None) -> Dict[str, Tuple[int, float]]:
+        """Pentru fiecare categorie: (încercări, procentaj de reușită)"""
+        view = self._view()
+        attempts, successes = self._grouped(view, 'category', self._mask(view, patient, None, since))
+        tried = np.flatnonzero(attempts)
+        rates = successes[tried] / attempts[tried] * 100
+        categories = view.names['category']
+        return {categories[i]: (int(attempts[i]), float(rate)) for i, rate in zip(tried, rates)}
+    
+    def hardest_words(self, count: int = 10, min_attempts: int = AppConfig.HISTORY_MIN_ATTEMPTS,
+                      patient: Optional[str] = None, category: Optional[str] = None,
+                      since: Optional[float] = None) -> List[Tuple[str, int, float]]:
+        """Cuvintele cu cea mai mică reușită: (cuvânt, încercări, procentaj)"""
+        view = self._view()
+        attempts, successes = self._grouped(view, 'word', self._mask(view, patient, category, since))
+        eligible = np.flatnonzero(attempts >= min_attempts)
+        if not len(eligible):
+            return []
+        rates = successes[eligible] / attempts[eligible]
+        # La reușită egală, cuvântul cu mai multe încercări este mai greu
+        order = np.lexsort((-attempts[eligible], rates))[:count]
+        words = view.names['word']
+        return [(words[eligible[i]], int(attempts[eligible[i]]), float(rates[i] * 100)) for i in order]
+    
+    def rolling_accuracy(self, window: int = AppConfig.HISTORY_ROLLING_WINDOW,
+                         patient: Optional[str] = None,
+                         category: Optional[str] = None) -> np.ndarray:
+        """Procentajul de reușită pe ultimele `window` încercări, după fiecare încercare"""
+        view = self._view()
+        correct = self._select(view, 'correct', self._mask(view, patient, category))
+        if not len(correct):
+            return np.empty(0, np.float32)
+        totals = np.concatenate(([0], np.cumsum(correct, dtype=np.int64)))
+        ends = np.arange(1, len(correct) + 1)
+        starts = np.maximum(ends - window, 0)
+        return ((totals[ends] - totals[starts]) / (ends - starts) * 100).astype(np.float32)
+    
+    def trend(self, patient: Optional[str] = None, period_days: float = 7,
+              category: Optional[str] = None) -> dict:
+        """
+        Evoluția reușitei pe perioade (implicit săptămâni)
+        
+        Returns:
+            periods: listă (începutul perioadei, încercări, procentaj), doar
+                perioadele cu încercări; slope: variația procentajului pe
+                perioadă (regresie liniară ponderată cu numărul de încercări)
+        """
+        view = self._view()
+        mask = self._mask(view, patient, category)
+        timestamps = self._select(view, 'timestamp', mask)
+        if not len(timestamps):
+            return {'periods': [], 'slope': 0.0}
+        
+        period = period_days * DAY_SECONDS
+        origin = np.floor(timestamps.min() / period) * period
+        buckets = ((timestamps - origin) // period).astype(np.int64)
+        attempts = np.bincount(buckets)
+        successes = np.bincount(buckets, weights=self._select(view, 'correct', mask))
+        used = np.flatnonzero(attempts)
+        rates = successes[used] / attempts[used] * 100
+        
+        slope = 0.0
+        if len(used) > 1:
+            slope = float(np.polyfit(used, rates, 1, w=np.sqrt(attempts[used]))[0])
+        periods = [(float(origin + index * period), int(attempts[index]), float(rate))
+                   for index, rate in zip(used, rates)]
+        return {'periods': periods, 'slope': slope}
+    
+    def save(self, path: Optional[str] = None) -> None:
+        """Salvează coloanele pe disc (scriere atomică)"""
+        path = path or self.path
+        if not path:
+            return
+        with self._lock:
+            arrays = {name: self._columns[name][:self._size].copy() for name in self.COLUMNS}
+            for kind, names in self._names.items():
+                arrays[f"{kind}_names"] = np.array(names, dtype=str)
+        
+        temporary = f"{path}.tmp.npz"
+        # Salvarea din fundal și cea de la închidere folosesc același fișier temporar
+        with self._save_lock:
+            try:
+                np.savez(temporary, **arrays)
+                os.replace(temporary, path)
+            except OSError as e:
+                print(f"Eroare salvare istoric încercări: {e}")
+    
+    def save_in_background(self) -> None:
+        """
+        Cere o salvare pe firul de salvare și revine imediat
+        
+        Cererile venite cât timp o salvare rulează produc o singură salvare
+        ulterioară, cu datele de atunci.
+        """
+        if not self.path:
+            return
+        with self._save_condition:
+            self._save_requested = True
+            if self._save_thread is None:
+                self._save_thread = threading.Thread(target=self._save_loop, name="history-save", daemon=True)
+                self._save_thread.start()
+            self._save_condition.notify()
+    
+    def _save_loop(self) -> None:
+        """Bucla firului de salvare"""
+        while True:
+            with self._save_condition:
+                while not self._save_requested:
+                    self._save_condition.wait()
+                self._save_requested = False
+            self.save()
+    
+    def load(self, path: str) -> None:
+        """Încarcă istoricul salvat, înlocuind conținutul curent"""
+        try:
+            with np.load(path, allow_pickle=False) as data:
+                columns = {name: data[name].astype(dtype) for name, dtype in self.COLUMNS.items()}
+                names = {kind: [str(name) for name in data[f"{kind}_names"]] for kind in self._names}
+        except (OSError, KeyError, ValueError) as e:
+            print(f"Eroare citire istoric încercări: {e}")
+            return
+        
+        with self._lock:
+            self._size = len(columns['word'])
+            capacity = max(self._size, len(self._columns['word']))
+            for name, column in columns.items():
+                self._columns[name] = np.empty(capacity, column.dtype)
+                self._columns[name][:self._size] = column
+            self._names = names
+            self._ids = {kind: {name: i for i, name in enumerate(values)} for kind, values in names.items()}
+
+def format_report(history: AttemptHistory, patient: Optional[str] = None, count: int = 10) -> str:
+    """Raport text: reușita generală, pe categorii, cele mai grele cuvinte și evoluția"""
+    attempts, percentage = history.accuracy(patient)
+    lines = [f"Pacient: {patient or 'toți'} - {attempts} încercări, {percentage:.1f}% reușite", "", "Categorii:"]
+    for category, (tries, rate) in sorted(history.category_accuracy(patient).items()):
+        lines.append(f"  {category or '-':<20} {tries:6d} {rate:6.1f}%")
+    
+    lines += ["", "Cele mai grele cuvinte:"]
+    for word, tries, rate in history.hardest_words(count, patient=patient):
+        lines.append(f"  {word:<20} {tries:6d} {rate:6.1f}%")
+    
+    trend = history.trend(patient)
+    lines += ["", f"Evoluție săptămânală ({trend['slope']:+.1f}% pe săptămână):"]
+    for start, tries, rate in trend['periods']:
+        lines.append(f"  {time.strftime('%Y-%m-%d', time.localtime(start))} {tries:6d} {rate:6.1f}%")
+    return "\n".join(lines)
+
+def main():
+    """Punctul de intrare în linia de comandă"""
+    parser = argparse.ArgumentParser(description="Raport din istoricul încercărilor")
+    parser.add_argument('--file', default=DEFAULT_HISTORY_FILE, help="Fișierul istoricului")
+    parser.add_argument('--patient', default=None, help="Pacientul (implicit toți)")
+    parser.add_argument('--count', type=int, default=10, help="Numărul de cuvinte grele afișate")
+    args = parser.parse_args()
+    
+    print(format_report(AttemptHistory(args.file), args.patient, args.count))
+
+if __name__ == "__main__":
+    main()
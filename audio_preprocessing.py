@@ -0,0 +1,173 @@
+# audio_preprocessing.py
+"""
+Pregătirea audio-ului înainte de recunoaștere (vectorizat cu NumPy)
+"""
+import threading
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Optional, Tuple
+import numpy as np
+from config import AppConfig
+
+if TYPE_CHECKING:
+    import speech_recognition as sr
+
+@dataclass
+class PreprocessResult:
+    """Rezultatul pregătirii unei înregistrări"""
+    pcm: Optional[bytes]
+    sample_rate: int
+    original_bytes: int
+    rejected: bool = False
+    
+    @property
+    def bytes_saved(self) -> int:
+        return self.original_bytes - (len(self.pcm) if self.pcm else 0)
+
+def to_float(pcm: bytes, sample_width: int, channels: int = 1) -> np.ndarray:
+    """PCM întreg cu semn (sau 8 biți fără semn) -> float32 în [-1, 1], mono"""
+    if sample_width == 1:
+        samples = (np.frombuffer(pcm, np.uint8).astype(np.float32) - 128) / 128
+    elif sample_width == 2:
+        samples = np.frombuffer(pcm, '<i2').astype(np.float32) / 32768
+    elif sample_width == 3:
+        raw = np.frombuffer(pcm, np.uint8).reshape(-1, 3)
+        padded = np.zeros((len(raw), 4), np.uint8)
+        padded[:, 1:] = raw
+        samples = padded.view('<i4').ravel().astype(np.float32) / 2 ** 31
+    else:
+        samples = np.frombuffer(pcm, '<i4').astype(np.float32) / 2 ** 31
+    return downmix(samples, channels)
+
+def downmix(samples: np.ndarray, channels: int) -> np.ndarray:
+    """Media canalelor intercalate"""
+    if channels <= 1:
+        return samples
+    usable = len(samples) - len(samples) % channels
+    return samples[:usable].reshape(-1, channels).mean(axis=1)
+
+def resample(samples: np.ndarray, rate: int, target_rate: int) -> np.ndarray:
+    """Reeșantionare liniară, cu o medie glisantă înainte de micșorare (anti-aliasing)"""
+    if rate == target_rate or not len(samples):
+        return samples
+    if rate > target_rate:
+        width = int(np.ceil(rate / target_rate))
+        if width > 1:
+            samples = np.convolve(samples, np.full(width, 1 / width, np.float32), mode='same')
+    count = int(round(len(samples) * target_rate / rate))
+    positions = np.arange(count, dtype=np.float64) * (rate / target_rate)
+    return np.interp(positions, np.arange(len(samples)), samples).astype(np.float32)
+
+def to_pcm16(samples: np.ndarray) -> bytes:
+    """float în [-1, 1] -> PCM cu semn pe 16 biți"""
+    return np.clip(samples * 32767, -32768, 32767).astype('<i2').tobytes()
+
+def pcm_rms(pcm: bytes, sample_width: int) -> float:
+    """Nivelul RMS al unei bucăți PCM, pe scara eșantioanelor întregi (ca energy_threshold)"""
+    samples = to_float(pcm, sample_width)
+    if not len(samples):
+        return 0.0
+    return float(np.sqrt(np.mean(samples * samples))) * 2 ** (8 * sample_width - 1)
+
+def frame_levels(samples: np.ndarray, frame: int) -> np.ndarray:
+    """Nivelul RMS al fiecărui cadru complet de `frame` eșantioane"""
+    usable = len(samples) - len(samples) % frame
+    frames = samples[:usable].reshape(-1, frame)
+    return np.sqrt(np.mean(frames * frames, axis=1))
+
+def speech_bounds(levels: np.ndarray, min_snr: float = AppConfig.PREPROCESS_MIN_SNR,
+                  min_level_range: float = AppConfig.PREPROCESS_MIN_LEVEL_RANGE,
+                  floor: float = AppConfig.PREPROCESS_SILENCE_FLOOR) -> Optional[Tuple[int, int, int]]:
+    """
+    Primul și ultimul cadru cu vorbire și numărul cadrelor cu vorbire
+    
+    Vorbirea variază mult de la o silabă la alta, chiar fără pauze, pe când un
+    zgomot constant (ventilator, aer condiționat) are un nivel aproape plat:
+    dacă raportul dintre cadrele puternice și cele slabe (percentilele 90 și
+    10) este sub min_level_range, înregistrarea este doar zgomot. Altfel,
+    zgomotul de fond este estimat din cadrele cele mai liniștite și un cadru
+    conține vorbire dacă îl depășește de min_snr ori; pragul nu trece de
+    percentila 90, ca o frază fără pauze să nu fie tăiată aproape toată.
+    """
+    if not len(levels):
+        return None
+    noise, loud = (float(level) for level in np.percentile(levels, [10, 90]))
+    if loud < floor or loud < noise * min_level_range:
+        return None
+    voiced = np.flatnonzero(levels > max(min(noise * min_snr, loud), floor))
+    if not len(voiced):
+        return None
+    return int(voiced[0]), int(voiced[-1]), len(voiced)
+
+class AudioPreprocessor:
+    """
+    Taie liniștea, normalizează volumul și aduce audio-ul la 16 kHz mono, 16 biți
+    
+    Înregistrările fără vorbire (doar zgomot) sunt respinse înainte de a ajunge
+    la motorul de recunoaștere. Păstrează câți octeți s-au economisit.
+    """
+    
+    def __init__(self, target_rate: int = AppConfig.PREPROCESS_SAMPLE_RATE,
+                 frame_ms: int = AppConfig.PREPROCESS_FRAME_MS,
+                 pad_ms: int = AppConfig.PREPROCESS_PAD_MS,
+                 min_speech_ms: int = AppConfig.PREPROCESS_MIN_SPEECH_MS,
+                 target_peak: float = AppConfig.PREPROCESS_TARGET_PEAK,
+                 max_gain: float = AppConfig.PREPROCESS_MAX_GAIN):
+        self.target_rate = target_rate
+        self.frame_ms = frame_ms
+        self.pad_ms = pad_ms
+        self.min_speech_ms = min_speech_ms
+        self.target_peak = target_peak
+        self.max_gain = max_gain
+        
+        self._lock = threading.Lock()
+        self._calls = 0
+        self._rejected = 0
+        self._bytes_in = 0
+        self._bytes_out = 0
+    
+    def process(self, pcm: bytes, sample_rate: int, sample_width: int,
+                channels: int = 1) -> PreprocessResult:
+        """Pregătește o înregistrare PCM; pcm este None în rezultat dacă a fost respinsă"""
+        samples = resample(to_float(pcm, sample_width, channels), sample_rate, self.target_rate)
+        frame = max(1, self.target_rate * self.frame_ms // 1000)
+        bounds = speech_bounds(frame_levels(samples, frame))
+        
+        if bounds is None or bounds[2] * self.frame_ms < self.min_speech_ms:
+            result = PreprocessResult(None, self.target_rate, len(pcm), rejected=True)
+        else:
+            first, last, _ = bounds
+            pad = self.pad_ms // self.frame_ms
+            start = max(0, first - pad) * frame
+            end = min(len(samples), (last + 1 + pad) * frame)
+            speech = samples[start:end]
+            
+            peak = float(np.max(np.abs(speech))) if len(speech) else 0.0
+            gain = min(self.max_gain, self.target_peak / peak) if peak > 0 else 1.0
+            result = PreprocessResult(to_pcm16(speech * gain), self.target_rate, len(pcm))
+        
+        with self._lock:
+            self._calls += 1
+            self._rejected += result.rejected
+            self._bytes_in += result.original_bytes
+            self._bytes_out += result.original_bytes - result.bytes_saved
+        return result
+    
+    def process_audio(self, audio: "sr.AudioData") -> Tuple[Optional["sr.AudioData"], PreprocessResult]:
+        """Pregătește un sr.AudioData; primul element este None dacă a fost respins"""
+        import speech_recognition as sr
+        
+        result = self.process(audio.get_raw_data(), audio.sample_rate, audio.sample_width)
+        if result.rejected:
+            return None, result
+        return sr.AudioData(result.pcm, result.sample_rate, 2), result
+    
+    def get_stats(self) -> dict:
+        """Numărul de înregistrări procesate și respinse și octeții economisiți"""
+        with self._lock:
+            return {
+                'calls': self._calls,
+                'rejected': self._rejected,
+                'bytes_in': self._bytes_in,
+                'bytes_out': self._bytes_out,
+                'bytes_saved': self._bytes_in - self._bytes_out
+            }
@@ -2,11 +2,28 @@
 """
 Servicii pentru audio (TTS și recunoaștere vocală)
 """
-import speech_recognition as sr
-import pyttsx3
+import collections
+import io
+import os
+import threading
+import time
+import wave
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import TYPE_CHECKING, Callable, Deque, Iterable, List, Optional, Tuple
 from config import AppConfig
+from calibration import CalibrationStore
+from models import Hypothesis
+from latency_metrics import pipeline_metrics
+from startup_timing import startup_timings
+from tts_cache import TTSCache
+
+# speech_recognition și pyttsx3 se importă doar când serviciile sunt create,
+# pe firele de inițializare, ca fereastra să apară fără să le aștepte
+if TYPE_CHECKING:
+    import speech_recognition as sr
+    from audio_preprocessing import AudioPreprocessor
+    from capture import ContinuousCapture
+    from recognizers import RecognizerBackend
 
 class AudioService(ABC):
     """Interfață abstractă pentru serviciile audio"""
@@ -18,24 +35,71 @@ class AudioService(ABC):
     @abstractmethod
     def listen(self) -> Optional[str]:
         pass
+    
+    def listen_all(self, max_alternatives: int = AppConfig.RECOGNITION_MAX_ALTERNATIVES) -> List[Hypothesis]:
+        """
+        Ascultă și returnează ipotezele recunoașterii, cea mai probabilă prima
+        
+        Codurile TIMEOUT/UNKNOWN/ERROR apar ca ipoteză unică; lista este goală
+        dacă nu s-a auzit nimic.
+        """
+        text = self.listen()
+        return [Hypothesis(text)] if text else []
+    
+    def listen_stream(self, on_partial: Callable[[List[Hypothesis]], bool],
+                      max_alternatives: int = AppConfig.RECOGNITION_MAX_ALTERNATIVES) -> List[Hypothesis]:
+        """
+        Ca listen_all(), dar trimite ipotezele parțiale la on_partial cât timp se vorbește
+        
+        Când on_partial returnează True, ascultarea se oprește și sunt întoarse
+        ipotezele acceptate. Serviciile fără streaming nu produc rezultate parțiale.
+        """
+        return self.listen_all(max_alternatives)
+    
+    def prefetch(self, texts: Iterable[str]) -> None:
+        """Pregătește în avans audio-ul pentru textele care urmează"""
+        pass
+    
+    def close(self) -> None:
+        """Eliberează resursele serviciului"""
+        pass
 
 class TTSService:
     """Serviciu pentru text-to-speech"""
     
-    def __init__(self, rate: int = AppConfig.SPEECH_RATE):
+    def __init__(self, rate: int = AppConfig.SPEECH_RATE, cache: Optional[TTSCache] = None):
+        self.rate = rate
+        self.cache = cache
+        self._player = None
+        # Citită o singură dată aici, pe firul care deține motorul, ca prefetch()
+        # să poată calcula cheile de cache de pe alt fir fără să atingă pyttsx3
+        self.voice = ""
         try:
-            self.engine = pyttsx3.init()
-            self.engine.setProperty('rate', rate)
+            with startup_timings.measure('tts_init'):
+                import pyttsx3
+                self.engine = pyttsx3.init()
+                self.engine.setProperty('rate', rate)
+                self.voice = str(self.engine.getProperty('voice') or "")
             self._available = True
         except Exception as e:
             print(f"Eroare inițializare TTS: {e}")
             self._available = False
+        
+        if self.cache is None and AppConfig.TTS_CACHE_ENABLED:
+            try:
+                self.cache = TTSCache()
+            except OSError as e:
+                print(f"Eroare inițializare cache TTS: {e}")
     
     def speak(self, text: str) -> None:
-        """Pronunță un text"""
+        """Pronunță un text (din cache dacă a fost deja generat)"""
         if not self._available:
             print(f"TTS nu este disponibil. Text: {text}")
             return
+        
+        data = self.cached_audio(text)
+        if data and self._play(data):
+            return
             
         try:
             self.engine.say(text)
@@ -43,92 +107,497 @@ class TTSService:
         except Exception as e:
             print(f"Eroare TTS: {e}")
     
+    def render(self, text: str) -> bool:
+        """
+        Generează audio-ul pentru text în cache-ul de pe disc
+        
+        Returns:
+            True dacă audio-ul există în cache (deja sau după generare)
+        """
+        if not self._available or not self.cache:
+            return False
+        
+        key = self._cache_key(text)
+        if self.cache.contains(key):
+            return True
+        
+        path = self.cache.path_for(key)
+        partial = path[:-len('.wav')] + '.part'
+        try:
+            self.engine.save_to_file(text, partial)
+            self.engine.runAndWait()
+            os.replace(partial, path)
+        except Exception as e:
+            print(f"Eroare generare audio TTS: {e}")
+            return False
+        
+        self.cache.register(key)
+        return True
+    
+    def cached_audio(self, text: str) -> Optional[bytes]:
+        """Audio-ul WAV pentru text, generat în cache dacă lipsește; None dacă nu este posibil"""
+        if not self.render(text):
+            return None
+        return self.cache.get(self._cache_key(text))
+    
+    def prefetch(self, texts: Iterable[str]) -> None:
+        """Aduce în memorie audio-ul deja generat pentru textele date"""
+        if self._available and self.cache:
+            self.cache.prefetch(self._cache_key(text) for text in texts)
+    
+    def _cache_key(self, text: str) -> str:
+        """Cheia de cache pentru text cu vocea și viteza motorului"""
+        return TTSCache.make_key(text, self.voice, self.rate)
+    
+    def _play(self, data: bytes) -> bool:
+        """Redă un fișier WAV din memorie; False dacă redarea nu este posibilă"""
+        try:
+            import pyaudio
+            
+            if self._player is None:
+                self._player = pyaudio.PyAudio()
+            
+            with wave.open(io.BytesIO(data), 'rb') as wav:
+                stream = self._player.open(
+                    format=self._player.get_format_from_width(wav.getsampwidth()),
+                    channels=wav.getnchannels(),
+                    rate=wav.getframerate(),
+                    output=True
+                )
+                try:
+                    stream.write(wav.readframes(wav.getnframes()))
+                finally:
+                    stream.stop_stream()
+                    stream.close()
+            return True
+        except Exception as e:
+            print(f"Eroare redare audio din cache: {e}")
+            return False
+    
     def is_available(self) -> bool:
         """Verifică dacă TTS este disponibil"""
         return self._available
 
+class TTSWorker:
+    """
+    Rulează toate cererile de vorbire pe un singur fir, dintr-o coadă
+    
+    Motorul pyttsx3 nu este thread-safe, așa că este creat și folosit doar
+    de acest fir. Cererile repetate pentru același text sunt comasate, iar
+    o cerere pentru un text nou înlocuiește cererile încă neîncepute.
+    """
+    
+    def __init__(self, create_service: Callable[[], TTSService] = TTSService):
+        self._create_service = create_service
+        self._service: Optional[TTSService] = None
+        self._queue: Deque[Tuple[str, float]] = collections.deque()
+        self._condition = threading.Condition()
+        self._ready = threading.Event()
+        self._current: Optional[str] = None
+        self._running = True
+        
+        self._submitted = 0
+        self._coalesced = 0
+        self._dropped = 0
+        self._spoken = 0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+        
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+    
+    @property
+    def service(self) -> Optional[TTSService]:
+        """Serviciul TTS, după ce a fost inițializat pe firul worker-ului"""
+        self._ready.wait()
+        return self._service
+    
+    def is_ready(self) -> bool:
+        """Verifică dacă inițializarea TTS s-a încheiat"""
+        return self._ready.is_set()
+    
+    def submit(self, text: str) -> None:
+        """Programează pronunțarea unui text (nu blochează)"""
+        with self._condition:
+            self._submitted += 1
+            if text == self._current or any(queued == text for queued, _ in self._queue):
+                self._coalesced += 1
+                return
+            
+            # Un text nou face ca cererile încă neîncepute să fie învechite
+            self._dropped += len(self._queue)
+            self._queue.clear()
+            self._queue.append((text, time.monotonic()))
+            self._condition.notify()
+    
+    def cancel_pending(self) -> None:
+        """Renunță la cererile care nu au început încă"""
+        with self._condition:
+            self._dropped += len(self._queue)
+            self._queue.clear()
+    
+    def stop(self) -> None:
+        """Oprește worker-ul după cererea în curs"""
+        with self._condition:
+            self._running = False
+            self._queue.clear()
+            self._condition.notify()
+        self._thread.join(timeout=2)
+    
+    def get_stats(self) -> dict:
+        """Returnează adâncimea cozii și timpii de așteptare"""
+        with self._condition:
+            return {
+                'queue_depth': len(self._queue),
+                'speaking': self._current is not None,
+                'submitted': self._submitted,
+                'coalesced': self._coalesced,
+                'dropped': self._dropped,
+                'spoken': self._spoken,
+                'avg_wait_ms': self._total_wait / self._spoken * 1000 if self._spoken else 0.0,
+                'max_wait_ms': self._max_wait * 1000
+            }
+    
+    def _run(self) -> None:
+        """Bucla worker-ului"""
+        try:
+            self._service = self._create_service()
+        except Exception as e:
+            print(f"Eroare inițializare worker TTS: {e}")
+        finally:
+            self._ready.set()
+        
+        while True:
+            with self._condition:
+                while self._running and not self._queue:
+                    self._condition.wait()
+                if not self._running:
+                    return
+                text, enqueued_at = self._queue.popleft()
+                self._current = text
+                waited = time.monotonic() - enqueued_at
+                self._total_wait += waited
+                self._max_wait = max(self._max_wait, waited)
+                self._spoken += 1
+            
+            try:
+                if self._service:
+                    self._service.speak(text)
+            except Exception as e:
+                print(f"Eroare TTS: {e}")
+            finally:
+                with self._condition:
+                    self._current = None
+
 class SpeechRecognitionService:
     """Serviciu pentru recunoașterea vocii"""
     
-    def __init__(self):
+    def __init__(self, backend: Optional["RecognizerBackend"] = None,
+                 calibration: Optional[CalibrationStore] = None):
+        with startup_timings.measure('stt_import'):
+            import speech_recognition as sr
+            from recognizers import create_recognizer_backend
+        
         self.recognizer = sr.Recognizer()
+        self.backend = backend or create_recognizer_backend()
+        self.calibration = calibration or CalibrationStore()
+        self.capture: Optional["ContinuousCapture"] = None
+        self.preprocessor: Optional["AudioPreprocessor"] = None
+        if AppConfig.PREPROCESS_ENABLED:
+            from audio_preprocessing import AudioPreprocessor
+            self.preprocessor = AudioPreprocessor()
+        self._device_key = "default"
+        self._saved_threshold: Optional[float] = None
         try:
             self.microphone = sr.Microphone()
-            self._setup_microphone()
+            self._device_key = self._get_device_key()
             self._available = True
+            self._setup_microphone()
         except Exception as e:
             print(f"Eroare inițializare microfon: {e}")
             self._available = False
+        
+        if self._available and AppConfig.CAPTURE_MODE == "continuous":
+            self._start_continuous_capture()
+        
+        # Modelele locale se încarcă în fundal, ca prima încercare să nu aștepte
+        threading.Thread(target=self._preload_backend, daemon=True).start()
+    
+    def _preload_backend(self) -> None:
+        """Încarcă motorul de recunoaștere"""
+        try:
+            self.backend.preload()
+        except Exception as e:
+            print(f"Eroare încărcare motor recunoaștere ({self.backend.name}): {e}")
+    
+    def _get_device_key(self) -> str:
+        """Identificatorul microfonului folosit (numele dispozitivului de intrare)"""
+        try:
+            import pyaudio
+            
+            audio = pyaudio.PyAudio()
+            try:
+                if self.microphone.device_index is None:
+                    info = audio.get_default_input_device_info()
+                else:
+                    info = audio.get_device_info_by_index(self.microphone.device_index)
+                return str(info.get('name', 'default'))
+            finally:
+                audio.terminate()
+        except Exception:
+            return "default" if self.microphone.device_index is None else str(self.microphone.device_index)
     
     def _setup_microphone(self) -> None:
-        """Configurează microfonul"""
+        """Configurează microfonul (din calibrarea salvată, dacă există)"""
         if not self._available:
             return
+        
+        stored = self.calibration.get_threshold(self._device_key)
+        if stored is not None:
+            # Pragul salvat e rafinat apoi din liniștea dintre încercări
+            self.recognizer.energy_threshold = stored
+            self._saved_threshold = stored
+            startup_timings.record('mic_calibration', 0.0)
+            return
             
         try:
-            with self.microphone as source:
-                self.recognizer.adjust_for_ambient_noise(source, duration=1)
+            with startup_timings.measure('mic_calibration'), self.microphone as source:
+                self.recognizer.adjust_for_ambient_noise(source, duration=AppConfig.CALIBRATION_DURATION)
         except Exception as e:
             print(f"Eroare configurare microfon: {e}")
             self._available = False
+            return
+        self._save_calibration(force=True)
+    
+    def _save_calibration(self, force: bool = False) -> None:
+        """Salvează pragul curent dacă s-a schimbat semnificativ"""
+        threshold = self.recognizer.energy_threshold
+        previous = self._saved_threshold
+        if not force and previous and abs(threshold - previous) / previous < AppConfig.CALIBRATION_SAVE_CHANGE:
+            return
+        self.calibration.save_threshold(self._device_key, threshold)
+        self._saved_threshold = threshold
+    
+    def _start_continuous_capture(self) -> None:
+        """Pornește captura continuă cu buffer circular"""
+        from capture import ContinuousCapture
+        
+        try:
+            self.capture = ContinuousCapture(self.microphone, self.recognizer)
+            self.capture.start()
+        except Exception as e:
+            print(f"Eroare pornire captură continuă: {e}")
+            self.capture = None
+    
+    def _capture_audio(self) -> "sr.AudioData":
+        """Înregistrează o frază, din buffer-ul continuu sau deschizând microfonul"""
+        if self.capture and self.capture.is_running:
+            return self.capture.capture_utterance(
+                timeout=AppConfig.LISTEN_TIMEOUT,
+                phrase_time_limit=AppConfig.PHRASE_TIME_LIMIT
+            )
+        
+        with self.microphone as source:
+            return self.recognizer.listen(
+                source, 
+                timeout=AppConfig.LISTEN_TIMEOUT, 
+                phrase_time_limit=AppConfig.PHRASE_TIME_LIMIT
+            )
     
     def listen(self) -> Optional[str]:
         """Ascultă și recunoaște vorbirea"""
+        hypotheses = self.listen_all(1)
+        return hypotheses[0].transcript if hypotheses else None
+    
+    def listen_all(self, max_alternatives: int = AppConfig.RECOGNITION_MAX_ALTERNATIVES) -> List[Hypothesis]:
+        """Ascultă și returnează până la max_alternatives ipoteze, cu încrederea lor"""
         if not self._available:
-            return None
-            
+            return []
+        return self._recognize_safely(lambda: self._recognize_utterance(max_alternatives))
+    
+    def listen_stream(self, on_partial: Callable[[List[Hypothesis]], bool],
+                      max_alternatives: int = AppConfig.RECOGNITION_MAX_ALTERNATIVES) -> List[Hypothesis]:
+        """
+        Recunoaștere în timp ce se vorbește, cu oprire la primul rezultat acceptat
+        
+        Necesită captura continuă și un motor cu streaming; altfel este
+        echivalent cu listen_all(). Pe această cale audio-ul nu trece prin
+        pregătire (tăierea liniștii are nevoie de toată înregistrarea).
+        """
+        if not self._available:
+            return []
+        if not (self.capture and self.capture.is_running and self.backend.supports_streaming):
+            return self.listen_all(max_alternatives)
+        return self._recognize_safely(lambda: self._recognize_stream(on_partial, max_alternatives))
+    
+    def _recognize_utterance(self, max_alternatives: int) -> List[Hypothesis]:
+        """Înregistrează fraza întreagă, apoi o recunoaște"""
+        import speech_recognition as sr
+        
+        with pipeline_metrics.measure('capture'):
+            audio = self._capture_audio()
+        
+        self._save_calibration()
+        if self.preprocessor:
+            with pipeline_metrics.measure('preprocessing'):
+                audio, _ = self.preprocessor.process_audio(audio)
+            # Doar zgomot: nu are rost să fie trimis motorului
+            if audio is None:
+                raise sr.UnknownValueError()
+        
+        with pipeline_metrics.measure('recognition'):
+            return self.backend.recognize_all(self.recognizer, audio, max_alternatives)
+    
+    def _recognize_stream(self, on_partial: Callable[[List[Hypothesis]], bool],
+                          max_alternatives: int) -> List[Hypothesis]:
+        """Trimite bucățile capturate motorului pe măsură ce sosesc"""
+        chunks = self.capture.stream_utterance(
+            timeout=AppConfig.LISTEN_TIMEOUT,
+            phrase_time_limit=AppConfig.PHRASE_TIME_LIMIT
+        )
+        
+        def normalized_partial(hypotheses: List[Hypothesis]) -> bool:
+            return on_partial([Hypothesis(h.transcript.lower().strip(), h.confidence) for h in hypotheses])
+        
         try:
-            with self.microphone as source:
-                audio = self.recognizer.listen(
-                    source, 
-                    timeout=AppConfig.LISTEN_TIMEOUT, 
-                    phrase_time_limit=AppConfig.PHRASE_TIME_LIMIT
+            with pipeline_metrics.measure('streaming'):
+                return self.backend.recognize_stream(
+                    self.recognizer, chunks, self.capture.sample_rate, self.capture.sample_width,
+                    normalized_partial, max_alternatives
                 )
-            
-            text = self.recognizer.recognize_google(audio, language='ro-RO')
-            return text.lower().strip()
+        finally:
+            # Oprește captura și când rezultatul a fost acceptat înainte de final
+            chunks.close()
+            self._save_calibration()
+    
+    def _recognize_safely(self, recognize: Callable[[], List[Hypothesis]]) -> List[Hypothesis]:
+        """Rulează recunoașterea și transformă erorile în codurile TIMEOUT/UNKNOWN/ERROR"""
+        import speech_recognition as sr
+        
+        try:
+            hypotheses = recognize()
+            return [Hypothesis(h.transcript.lower().strip(), h.confidence) for h in hypotheses]
             
         except sr.WaitTimeoutError:
-            return "TIMEOUT"
+            return [Hypothesis("TIMEOUT")]
         except sr.UnknownValueError:
-            return "UNKNOWN"
+            return [Hypothesis("UNKNOWN")]
         except sr.RequestError as e:
             print(f"Eroare serviciu recunoaștere: {e}")
-            return "ERROR"
+            return [Hypothesis("ERROR")]
         except Exception as e:
             print(f"Eroare neașteptată recunoaștere: {e}")
-            return "ERROR"
+            return [Hypothesis("ERROR")]
+    
+    def get_cache_stats(self) -> Optional[dict]:
+        """Statisticile cache-ului de transcrieri, dacă motorul îl folosește"""
+        cache = getattr(self.backend, 'cache', None)
+        return cache.get_stats() if cache else None
+    
+    def get_preprocessing_stats(self) -> Optional[dict]:
+        """Statisticile pregătirii audio (înregistrări respinse, octeți economisiți)"""
+        return self.preprocessor.get_stats() if self.preprocessor else None
     
     def is_available(self) -> bool:
         """Verifică dacă recunoașterea vocală este disponibilă"""
         return self._available
+    
+    def close(self) -> None:
+        """Eliberează microfonul și salvează calibrarea"""
+        if self.capture:
+            self.capture.stop()
+        if self._available:
+            self._save_calibration()
 
 class CombinedAudioService(AudioService):
     """Serviciu audio combinat (TTS + Recunoaștere)"""
     
     def __init__(self):
-        self.tts = TTSService()
-        self.stt = SpeechRecognitionService()
+        self.tts_worker = TTSWorker()
+        self._stt: Optional[SpeechRecognitionService] = None
+        self._stt_ready = threading.Event()
+        
+        # Microfonul (deschidere + calibrare) se inițializează în fundal
+        threading.Thread(target=self._init_stt, name="stt-init", daemon=True).start()
+    
+    def _init_stt(self) -> None:
+        """Creează serviciul de recunoaștere vocală"""
+        try:
+            self._stt = SpeechRecognitionService()
+        except Exception as e:
+            print(f"Eroare inițializare recunoaștere vocală: {e}")
+        finally:
+            self._stt_ready.set()
+    
+    @property
+    def tts(self) -> Optional[TTSService]:
+        """Serviciul TTS deținut de worker (așteaptă inițializarea)"""
+        return self.tts_worker.service
+    
+    @property
+    def stt(self) -> Optional[SpeechRecognitionService]:
+        """Serviciul de recunoaștere vocală (așteaptă inițializarea)"""
+        self._stt_ready.wait()
+        return self._stt
+    
+    def is_ready(self) -> bool:
+        """Verifică dacă ambele servicii audio au terminat inițializarea"""
+        return self.tts_worker.is_ready() and self._stt_ready.is_set()
     
     def speak(self, text: str) -> None:
-        """Pronunță un text"""
-        self.tts.speak(text)
+        """Programează pronunțarea unui text pe worker-ul TTS (nu blochează)"""
+        self.tts_worker.submit(text)
     
     def listen(self) -> Optional[str]:
         """Ascultă și recunoaște vorbirea"""
-        return self.stt.listen()
+        stt = self.stt
+        return stt.listen() if stt else None
+    
+    def listen_all(self, max_alternatives: int = AppConfig.RECOGNITION_MAX_ALTERNATIVES) -> List[Hypothesis]:
+        """Ascultă și returnează ipotezele recunoașterii"""
+        stt = self.stt
+        return stt.listen_all(max_alternatives) if stt else []
+    
+    def listen_stream(self, on_partial: Callable[[List[Hypothesis]], bool],
+                      max_alternatives: int = AppConfig.RECOGNITION_MAX_ALTERNATIVES) -> List[Hypothesis]:
+        """Ascultă cu rezultate parțiale, dacă motorul le suportă"""
+        stt = self.stt
+        return stt.listen_stream(on_partial, max_alternatives) if stt else []
+    
+    def prefetch(self, texts: Iterable[str]) -> None:
+        """Aduce în memorie audio-ul TTS pentru cuvintele care urmează"""
+        if self.tts_worker.is_ready() and self.tts:
+            self.tts.prefetch(texts)
     
     def is_tts_available(self) -> bool:
         """Verifică disponibilitatea TTS"""
-        return self.tts.is_available()
+        return self.tts is not None and self.tts.is_available()
     
     def is_stt_available(self) -> bool:
         """Verifică disponibilitatea recunoașterii vocale"""
-        return self.stt.is_available()
+        return self.stt is not None and self.stt.is_available()
+    
+    def close(self) -> None:
+        """Oprește worker-ul TTS și eliberează microfonul"""
+        self.tts_worker.stop()
+        if self._stt:
+            self._stt.close()
     
     def get_status(self) -> dict:
-        """Returnează statusul serviciilor audio"""
+        """
+        Returnează statusul serviciilor audio, fără să aștepte inițializarea
+        
+        Cât timp un serviciu nu este gata, *_ready este False și *_available None.
+        """
+        tts_ready = self.tts_worker.is_ready()
+        stt_ready = self._stt_ready.is_set()
         return {
-            'tts_available': self.is_tts_available(),
-            'stt_available': self.is_stt_available()
+            'tts_ready': tts_ready,
+            'stt_ready': stt_ready,
+            'tts_available': self.is_tts_available() if tts_ready else None,
+            'stt_available': self.is_stt_available() if stt_ready else None,
+            'stt_backend': self._stt.backend.name if self._stt else None,
+            'transcript_cache': self._stt.get_cache_stats() if self._stt else None,
+            'preprocessing': self._stt.get_preprocessing_stats() if self._stt else None,
+            'tts_queue': self.tts_worker.get_stats()
         }
\ No newline at end of file
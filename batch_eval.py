@@ -0,0 +1,190 @@
+# batch_eval.py
+"""
+Evaluare în lot, fără interfață: recunoaștere + scorare pentru un corpus de încercări
+
+Utilizare:
+    python batch_eval.py corpus.jsonl -o rezultate.jsonl -j 4
+
+Corpusul este JSONL (un obiect pe linie) sau CSV cu antet. Fiecare element are
+câmpul `target` și fie `transcript` (text deja recunoscut), fie `audio`
+(calea unui fișier WAV, recunoscut cu motorul ales).
+"""
+import argparse
+import csv
+import json
+import multiprocessing
+import os
+import sys
+import time
+from typing import Dict, Iterator, Optional
+from config import AppConfig
+from pronunciation_checker import PronunciationChecker
+
+# Obiecte create o singură dată în fiecare proces worker
+_checker: Optional[PronunciationChecker] = None
+_backend_name = AppConfig.RECOGNIZER_BACKEND
+_backend = None
+_recognizer = None
+_preprocessor = None
+
+def read_corpus(path: str) -> Iterator[Dict[str, str]]:
+    """Citește elementele corpusului (JSONL sau CSV), pe rând"""
+    with open(path, 'r', encoding='utf-8', newline='') as f:
+        if path.lower().endswith('.csv'):
+            for row in csv.DictReader(f):
+                yield row
+            return
+        
+        for line_number, line in enumerate(f, 1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                yield json.loads(line)
+            except ValueError as e:
+                print(f"Linie invalidă {line_number}: {e}", file=sys.stderr)
+
+def _init_worker(backend_name: str, similarity_engine: str) -> None:
+    """Inițializează verificatorul și motorul de recunoaștere în procesul worker"""
+    global _checker, _backend_name
+    _checker = PronunciationChecker(engine=similarity_engine)
+    _backend_name = backend_name
+
+def _recognize_file(path: str) -> str:
+    """Recunoaște un fișier WAV; returnează aceleași coduri ca listen()"""
+    global _backend, _recognizer, _preprocessor
+    import speech_recognition as sr
+    from recognizers import create_recognizer_backend
+    
+    # Motorul (și modelul local, dacă există) se încarcă o dată pe proces
+    if _backend is None:
+        _backend = create_recognizer_backend(_backend_name)
+        _recognizer = sr.Recognizer()
+        if AppConfig.PREPROCESS_ENABLED:
+            from audio_preprocessing import AudioPreprocessor
+            _preprocessor = AudioPreprocessor()
+    
+    try:
+        with sr.AudioFile(path) as source:
+            audio = _recognizer.record(source)
+        if _preprocessor:
+            audio, _ = _preprocessor.process_audio(audio)
+            if audio is None:
+                return "UNKNOWN"
+        return _backend.recognize(_recognizer, audio).lower().strip()
+    except sr.UnknownValueError:
+        return "UNKNOWN"
+    except (sr.RequestError, OSError, ValueError) as e:
+        print(f"Eroare recunoaștere {path}: {e}", file=sys.stderr)
+        return "ERROR"
+
+def _invalid_reason(item) -> Optional[str]:
+    """De ce nu poate fi evaluat un element al corpusului, ori None dacă e valid"""
+    if not isinstance(item, dict):
+        return "elementul nu este un obiect"
+    target = item.get('target')
+    if not isinstance(target, str) or not target.strip():
+        return "lipsește câmpul target"
+    transcript = item.get('transcript')
+    audio_path = item.get('audio')
+    if transcript is not None and not isinstance(transcript, str):
+        return "transcript trebuie să fie text"
+    if audio_path and not isinstance(audio_path, str):
+        return "audio trebuie să fie o cale"
+    if transcript is None and not audio_path:
+        return "lipsesc atât transcript cât și audio"
+    return None
+
+def _error_result(item, message: str) -> dict:
+    """Rezultatul unui element care nu a putut fi evaluat"""
+    result = dict(item) if isinstance(item, dict) else {'item': item}
+    result.update({'correct': False, 'similarity': 0.0, 'error': message})
+    return result
+
+def evaluate_item(item: Dict[str, str]) -> dict:
+    """
+    Recunoaște (dacă e nevoie) și scorează un element al corpusului
+    
+    Elementele invalide și erorile neprevăzute produc un rezultat cu câmpul
+    `error`, ca un singur element greșit să nu oprească toată evaluarea.
+    """
+    reason = _invalid_reason(item)
+    if reason:
+        return _error_result(item, reason)
+    
+    try:
+        target = item['target'].strip()
+        transcript = item.get('transcript')
+        audio_path = item.get('audio')
+        
+        started = time.perf_counter()
+        if not transcript and audio_path:
+            transcript = _recognize_file(audio_path)
+        recognition_ms = (time.perf_counter() - started) * 1000
+        
+        is_correct, similarity = _checker.check_pronunciation(target, transcript or "")
+    except Exception as e:
+        return _error_result(item, f"{type(e).__name__}: {e}")
+    
+    result = dict(item)
+    result.update({
+        'transcript': transcript or "",
+        'correct': is_correct,
+        'similarity': round(similarity, 4),
+        'recognition_ms': round(recognition_ms, 2)
+    })
+    return result
+
+def run(corpus: str, output: str, workers: int, backend: str,
+        similarity_engine: str, chunksize: int) -> dict:
+    """
+    Rulează evaluarea și scrie rezultatele în JSONL pe măsură ce sosesc
+    
+    Returns:
+        Sumarul rulării (număr de elemente, corecte, erori, durată, elemente/s)
+    """
+    total = 0
+    correct = 0
+    errors = 0
+    started = time.perf_counter()
+    last_report = started
+    
+    with multiprocessing.Pool(workers, initializer=_init_worker,
+                              initargs=(backend, similarity_engine)) as pool, \
+            open(output, 'w', encoding='utf-8') as out:
+        for result in pool.imap(evaluate_item, read_corpus(corpus), chunksize=chunksize):
+            out.write(json.dumps(result, ensure_ascii=False) + "\n")
+            total += 1
+            correct += result['correct']
+            errors += 'error' in result
+            
+            now = time.perf_counter()
+            if now - last_report >= AppConfig.BATCH_REPORT_INTERVAL:
+                print(f"{total} elemente, {total / (now - started):.1f} elemente/s", file=sys.stderr)
+                last_report = now
+    
+    elapsed = time.perf_counter() - started
+    return {
+        'items': total,
+        'correct': correct,
+        'errors': errors,
+        'seconds': round(elapsed, 3),
+        'items_per_second': round(total / elapsed, 1) if elapsed > 0 else 0.0
+    }
+
+def main():
+    """Punctul de intrare în linia de comandă"""
+    parser = argparse.ArgumentParser(description="Evaluare în lot a pronunției, fără interfață")
+    parser.add_argument('corpus', help="Fișier JSONL sau CSV cu target și transcript/audio")
+    parser.add_argument('-o', '--output', default="rezultate.jsonl", help="Fișierul JSONL de ieșire")
+    parser.add_argument('-j', '--workers', type=int, default=os.cpu_count() or 1, help="Numărul de procese")
+    parser.add_argument('--backend', default=AppConfig.RECOGNIZER_BACKEND, help="Motorul de recunoaștere pentru audio")
+    parser.add_argument('--engine', default=AppConfig.SIMILARITY_ENGINE, help="Motorul de similaritate")
+    parser.add_argument('--chunksize', type=int, default=AppConfig.BATCH_CHUNKSIZE, help="Elemente trimise odată unui proces")
+    args = parser.parse_args()
+    
+    summary = run(args.corpus, args.output, args.workers, args.backend, args.engine, args.chunksize)
+    print(json.dumps(summary, ensure_ascii=False))
+
+if __name__ == "__main__":
+    main()
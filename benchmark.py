@@ -0,0 +1,256 @@
+# benchmark.py
+"""
+Benchmark-uri pentru căile critice: scorare, pachetul de cuvinte, pregătirea audio și ciclul controller-ului
+
+Utilizare:
+    python benchmark.py                         # rulează și afișează rezultatele JSON
+    python benchmark.py --save-baseline         # salvează rezultatele ca referință
+    python benchmark.py --compare               # compară cu referința; cod 1 la regresie
+"""
+import argparse
+import json
+import random
+import statistics
+import sys
+import time
+from typing import Callable, Dict, List
+from audio_preprocessing import AudioPreprocessor
+from config import AppConfig
+from fake_audio import FakeAudioService
+from game_controller import GameController
+from pronunciation_checker import PronunciationChecker
+from scheduler import CommandScheduler, ManualClock
+from vocabulary_store import VocabularyStore
+from word_deck import create_deck
+from word_manager import WordCategoryManager
+
+SEED = 1234
+
+def measure(function: Callable[[], None], number: int, repeat: int) -> Dict[str, float]:
+    """Rulează funcția de `number` ori, în `repeat` serii; timpi per apel în microsecunde"""
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            function()
+        samples.append((time.perf_counter() - start) / number * 1e6)
+    return {
+        'median_us': round(statistics.median(samples), 3),
+        'min_us': round(min(samples), 3),
+        'number': number,
+        'repeat': repeat
+    }
+
+def _vocabulary() -> List[str]:
+    """Toate cuvintele din categoriile implicite"""
+    manager = WordCategoryManager()
+    return [word for name in manager.get_category_names() for word in manager.get_category(name).words]
+
+def _synthetic_words(count: int) -> List[str]:
+    """Cuvinte distincte doar din litere (cifrele nu trec de validarea vocabularului)"""
+    words = []
+    for i in range(count):
+        suffix = ""
+        while True:
+            i, letter = divmod(i, 26)
+            suffix = chr(ord('a') + letter) + suffix
+            if not i:
+                break
+        words.append(f"cuvant{suffix}")
+    return words
+
+def _transcripts(words: List[str], count: int) -> List[str]:
+    """Transcrieri sintetice: cuvinte corecte, variații fără diacritice și cuvinte greșite"""
+    rng = random.Random(SEED)
+    plain = str.maketrans('ăâîșț', 'aaist')
+    transcripts = []
+    for _ in range(count):
+        word = rng.choice(words)
+        kind = rng.random()
+        if kind < 0.3:
+            transcripts.append(word)
+        elif kind < 0.6:
+            transcripts.append(word.translate(plain))
+        else:
+            transcripts.append(rng.choice(words))
+    return transcripts
+
+def bench_check_pronunciation(number: int, repeat: int) -> Dict[str, Dict[str, float]]:
+    """check_pronunciation fără cache, cu cache cald, prin check_many și check_hypotheses"""
+    words = _vocabulary()
+    rng = random.Random(SEED)
+    pairs = list(zip((rng.choice(words) for _ in range(number)), _transcripts(words, number)))
+    results = {}
+    
+    for engine in ("sequence_matcher", "levenshtein", "phonetic"):
+        uncached = PronunciationChecker(cache_size=0, engine=engine)
+        iterator = iter(pairs * (repeat + 1))
+        results[f"check_pronunciation[{engine},uncached]"] = measure(
+            lambda: uncached.check_pronunciation(*next(iterator)), number, repeat
+        )
+    
+    cached = PronunciationChecker()
+    cached.check_many(pairs)
+    iterator = iter(pairs * (repeat + 1))
+    results["check_pronunciation[cached]"] = measure(
+        lambda: cached.check_pronunciation(*next(iterator)), number, repeat
+    )
+    
+    batch_checker = PronunciationChecker(cache_size=0)
+    batch = measure(lambda: batch_checker.check_many(pairs), 1, repeat)
+    results["check_many[per_pair]"] = {
+        **batch,
+        'median_us': round(batch['median_us'] / len(pairs), 3),
+        'min_us': round(batch['min_us'] / len(pairs), 3)
+    }
+    
+    # N-best: ținta comparată cu 5 ipoteze într-un singur apel
+    alternatives = AppConfig.RECOGNITION_MAX_ALTERNATIVES
+    hypotheses = _transcripts(words, number * alternatives)
+    nbest = [(target, hypotheses[i * alternatives:(i + 1) * alternatives]) for i, (target, _) in enumerate(pairs)]
+    nbest_checker = PronunciationChecker(cache_size=0)
+    iterator = iter(nbest * (repeat + 1))
+    results[f"check_hypotheses[{alternatives}-best,uncached]"] = measure(
+        lambda: nbest_checker.check_hypotheses(*next(iterator)), number, repeat
+    )
+    return results
+
+def bench_generate_variations(number: int, repeat: int) -> Dict[str, Dict[str, float]]:
+    """_generate_variations pe cuvintele vocabularului"""
+    checker = PronunciationChecker()
+    words = _vocabulary()
+    iterator = iter(words * (number * (repeat + 1) // len(words) + 1))
+    return {"generate_variations": measure(lambda: checker._generate_variations(next(iterator)), number, repeat)}
+
+def bench_random_words(number: int, repeat: int) -> Dict[str, Dict[str, float]]:
+    """WordCategory.get_random_words pe o categorie mică și pe una mare"""
+    random.seed(SEED)
+    manager = WordCategoryManager(VocabularyStore(":memory:"))
+    small = manager.get_category(manager.get_category_names()[0])
+    manager.add_category("benchmark", _synthetic_words(5000))
+    large = manager.get_category("benchmark")
+    if len(large.words) != 5000:
+        raise RuntimeError(f"Categoria de test are {len(large.words)} cuvinte în loc de 5000")
+    return {
+        "get_random_words[small]": measure(small.get_random_words, number, repeat),
+        "get_random_words[5000]": measure(large.get_random_words, max(1, number // 100), repeat)
+    }
+
+def bench_deck(number: int, repeat: int) -> Dict[str, Dict[str, float]]:
+    """Alegerea cuvântului următor dintr-un pachet de 5000 de cuvinte, pentru fiecare mod"""
+    rng = random.Random(SEED)
+    words = _synthetic_words(5000)
+    results = {}
+    for mode in ("sequential", "spaced"):
+        deck = create_deck(words, mode)
+        
+        def step() -> None:
+            word = deck.next_word()
+            if word is not None:
+                deck.record_result(word, rng.random() < 0.7)
+                deck.upcoming(AppConfig.TTS_PREFETCH_COUNT)
+        
+        results[f"deck_next_word[{mode},5000]"] = measure(step, min(number, 1000), repeat)
+    return results
+
+def bench_preprocessing(number: int, repeat: int) -> Dict[str, Dict[str, float]]:
+    """Pregătirea audio pentru o înregistrare de 3 s la 44,1 kHz (vorbire sintetică între pauze)"""
+    import numpy as np
+    
+    rate = 44100
+    rng = np.random.default_rng(SEED)
+    tone = np.arange(rate) / rate
+    speech = 0.3 * np.sin(2 * np.pi * 220 * tone) * np.hanning(rate)
+    clip = np.concatenate([rng.normal(0, 0.002, rate), speech, rng.normal(0, 0.002, rate)])
+    pcm = (clip * 32767).astype('<i2').tobytes()
+    preprocessor = AudioPreprocessor()
+    return {"preprocess[44.1kHz,3s]": measure(lambda: preprocessor.process(pcm, rate, 2), min(number, 200), repeat)}
+
+def bench_controller_cycle(number: int, repeat: int, latency: float) -> Dict[str, Dict[str, float]]:
+    """Un ciclu complet de încercare: ascultare, scorare, feedback și avans la cuvântul următor"""
+    words = _vocabulary()
+    audio = FakeAudioService(_transcripts(words, 512), listen_latency=latency)
+    clock = ManualClock()
+    scheduler = CommandScheduler(clock, max_workers=0, threaded=False)
+    controller = GameController(audio_service=audio, scheduler=scheduler)
+    category = controller.get_available_categories()[0]
+    
+    def cycle() -> None:
+        if not controller.state.deck:
+            controller.start_new_category(category)
+            scheduler.run_pending()
+        controller.start_listening()
+        scheduler.run_pending()
+        if controller._pending_advance is None:
+            controller.skip_current_word()
+        clock.advance(AppConfig.SUCCESS_DISPLAY_TIME / 1000)
+        scheduler.run_pending()
+    
+    controller.start_new_category(category)
+    scheduler.run_pending()
+    result = measure(cycle, number, repeat)
+    controller.shutdown()
+    return {f"controller_cycle[latency={latency * 1000:g}ms]": result}
+
+def run_all(number: int, repeat: int, latency: float) -> Dict[str, Dict[str, float]]:
+    """Rulează toate benchmark-urile"""
+    results = {}
+    results.update(bench_check_pronunciation(number, repeat))
+    results.update(bench_generate_variations(number, repeat))
+    results.update(bench_random_words(number, repeat))
+    results.update(bench_deck(number, repeat))
+    results.update(bench_preprocessing(number, repeat))
+    results.update(bench_controller_cycle(max(1, number // 10), repeat, 0.0))
+    if latency > 0:
+        results.update(bench_controller_cycle(max(1, int(0.2 / latency)), repeat, latency))
+    return results
+
+def compare(results: Dict[str, Dict[str, float]], baseline: Dict[str, Dict[str, float]],
+            tolerance: float) -> List[str]:
+    """Returnează benchmark-urile al căror median depășește referința cu mai mult de `tolerance`"""
+    regressions = []
+    for name, result in results.items():
+        reference = baseline.get(name)
+        if not reference:
+            continue
+        ratio = result['median_us'] / reference['median_us'] if reference['median_us'] else 1.0
+        if ratio > 1 + tolerance:
+            regressions.append(f"{name}: {reference['median_us']} -> {result['median_us']} us (x{ratio:.2f})")
+    return regressions
+
+def main():
+    """Punctul de intrare în linia de comandă"""
+    parser = argparse.ArgumentParser(description="Benchmark-uri pentru aplicația de pronunție")
+    parser.add_argument('--number', type=int, default=2000, help="Apeluri per serie")
+    parser.add_argument('--repeat', type=int, default=5, help="Numărul de serii")
+    parser.add_argument('--latency', type=float, default=0.02, help="Latența ascultării simulate (secunde)")
+    parser.add_argument('--baseline', default=AppConfig.BENCHMARK_BASELINE, help="Fișierul de referință")
+    parser.add_argument('--save-baseline', action='store_true', help="Salvează rezultatele ca referință")
+    parser.add_argument('--compare', action='store_true', help="Compară cu referința")
+    parser.add_argument('--tolerance', type=float, default=AppConfig.BENCHMARK_TOLERANCE,
+                        help="Creșterea relativă acceptată față de referință")
+    args = parser.parse_args()
+    
+    results = run_all(args.number, args.repeat, args.latency)
+    print(json.dumps(results, indent=2, ensure_ascii=False))
+    
+    if args.save_baseline:
+        with open(args.baseline, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2, ensure_ascii=False)
+        print(f"Referință salvată în {args.baseline}", file=sys.stderr)
+    
+    if args.compare:
+        try:
+            with open(args.baseline, 'r', encoding='utf-8') as f:
+                baseline = json.load(f)
+        except OSError:
+            print(f"Nu există referința {args.baseline}; rulează cu --save-baseline", file=sys.stderr)
+            sys.exit(2)
+        
+        regressions = compare(results, baseline, args.tolerance)
+        for line in regressions:
+            print(f"REGRESIE {line}", file=sys.stderr)
+        sys.exit(1 if regressions else 0)
+
+if __name__ == "__main__":
+    main()
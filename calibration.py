@@ -0,0 +1,58 @@
+# calibration.py
+"""
+Persistența calibrării microfonului (pragul de energie) pentru fiecare dispozitiv
+"""
+import json
+import os
+import threading
+import time
+from typing import Dict, Optional
+from config import AppConfig
+
+# Fișierul stă lângă cod, deci nu depinde de directorul curent
+DEFAULT_CALIBRATION_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), AppConfig.CALIBRATION_FILE)
+
+class CalibrationStore:
+    """Păstrează pe disc pragul de energie învățat pentru fiecare microfon"""
+    
+    def __init__(self, path: str = DEFAULT_CALIBRATION_FILE):
+        self.path = path
+        self._lock = threading.Lock()
+        self._data: Dict[str, dict] = self._load()
+    
+    def _load(self) -> Dict[str, dict]:
+        """Citește fișierul de calibrare (gol dacă lipsește sau e corupt)"""
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            return data if isinstance(data, dict) else {}
+        except (OSError, ValueError):
+            return {}
+    
+    def get_threshold(self, device_key: str) -> Optional[float]:
+        """Returnează pragul salvat pentru dispozitiv, dacă există"""
+        with self._lock:
+            entry = self._data.get(device_key)
+        if not entry:
+            return None
+        try:
+            return float(entry['energy_threshold'])
+        except (KeyError, TypeError, ValueError):
+            return None
+    
+    def save_threshold(self, device_key: str, threshold: float) -> None:
+        """Salvează pragul pentru dispozitiv (scriere atomică)"""
+        with self._lock:
+            self._data[device_key] = {
+                'energy_threshold': round(float(threshold), 2),
+                'updated': time.time()
+            }
+            snapshot = json.dumps(self._data, ensure_ascii=False, indent=2)
+        
+        temporary = f"{self.path}.tmp"
+        try:
+            with open(temporary, 'w', encoding='utf-8') as f:
+                f.write(snapshot)
+            os.replace(temporary, self.path)
+        except OSError as e:
+            print(f"Eroare salvare calibrare microfon: {e}")
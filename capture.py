@@ -0,0 +1,239 @@
+# capture.py
+"""
+Captură audio continuă cu buffer circular și detecția sfârșitului vorbirii
+"""
+import collections
+import threading
+import time
+from typing import Deque, Iterator, Optional, Tuple
+import speech_recognition as sr
+from audio_preprocessing import pcm_rms
+from config import AppConfig
+from latency_metrics import pipeline_metrics
+
+class ContinuousCapture:
+    """
+    Ține fluxul microfonului deschis și păstrează ultimele secunde într-un buffer circular
+    
+    La fiecare cerere, înregistrarea începe cu o mică porțiune dinainte de
+    apăsarea butonului (pre-roll) și se oprește imediat ce vorbitorul tace,
+    pe baza energiei semnalului.
+    """
+    
+    def __init__(self, microphone: sr.Microphone, recognizer: sr.Recognizer,
+                 buffer_seconds: float = AppConfig.RING_BUFFER_SECONDS,
+                 pre_roll_ms: int = AppConfig.PRE_ROLL_MS,
+                 endpoint_silence_ms: int = AppConfig.ENDPOINT_SILENCE_MS):
+        self.microphone = microphone
+        self.recognizer = recognizer
+        self.buffer_seconds = buffer_seconds
+        self.pre_roll_ms = pre_roll_ms
+        self.endpoint_silence_ms = endpoint_silence_ms
+        
+        self._chunks: Deque[Tuple[int, bytes]] = collections.deque()
+        self._next_index = 0
+        self._condition = threading.Condition()
+        self._running = False
+        self._capturing = False
+        self._thread: Optional[threading.Thread] = None
+        self._source = None
+    
+    @property
+    def is_running(self) -> bool:
+        return self._running
+    
+    @property
+    def sample_rate(self) -> int:
+        return self._source.SAMPLE_RATE
+    
+    @property
+    def sample_width(self) -> int:
+        return self._source.SAMPLE_WIDTH
+    
+    def start(self) -> None:
+        """Deschide fluxul microfonului și pornește citirea în fundal"""
+        if self._running:
+            return
+        
+        self._source = self.microphone.__enter__()
+        self._chunks = collections.deque(maxlen=self._chunks_for(self.buffer_seconds * 1000))
+        self._running = True
+        self._thread = threading.Thread(target=self._read_loop, daemon=True)
+        self._thread.start()
+    
+    def stop(self) -> None:
+        """Oprește citirea și închide fluxul microfonului"""
+        if not self._running:
+            return
+        
+        self._running = False
+        with self._condition:
+            self._condition.notify_all()
+        if self._thread:
+            self._thread.join(timeout=1)
+        self._close_source()
+    
+    def _close_source(self) -> None:
+        """Închide fluxul microfonului o singură dată, la oprire sau după o eroare"""
+        with self._condition:
+            source, self._source = self._source, None
+        if source is not None:
+            self.microphone.__exit__(None, None, None)
+    
+    def _read_loop(self) -> None:
+        """Citește continuu bucăți din flux în buffer-ul circular"""
+        while self._running:
+            try:
+                chunk = self._source.stream.read(self._source.CHUNK)
+            except Exception as e:
+                print(f"Eroare citire microfon: {e}")
+                # Microfonul trebuie eliberat, altfel înregistrarea directă nu îl mai poate deschide
+                self._running = False
+                self._close_source()
+                break
+            
+            with self._condition:
+                self._chunks.append((self._next_index, chunk))
+                self._next_index += 1
+                capturing = self._capturing
+                self._condition.notify_all()
+            
+            if not capturing:
+                self._recalibrate(chunk)
+        
+        with self._condition:
+            self._condition.notify_all()
+    
+    def _recalibrate(self, chunk: bytes) -> None:
+        """
+        Ajustează treptat pragul de energie din sunetul ambiental dintre încercări
+        
+        Folosește aceeași formulă ca ajustarea dinamică din speech_recognition,
+        deci pragul urmărește zgomotul camerei fără nicio calibrare separată.
+        Ca în listen(), bucățile peste prag (vorbirea pacientului între încercări,
+        redarea TTS) sunt ignorate, deci pragul învățat, și cel salvat, vine
+        doar din liniște.
+        """
+        if not self.recognizer.dynamic_energy_threshold:
+            return
+        
+        energy = pcm_rms(chunk, self._source.SAMPLE_WIDTH)
+        if energy > self.recognizer.energy_threshold:
+            return
+        seconds_per_buffer = self._source.CHUNK / self._source.SAMPLE_RATE
+        damping = self.recognizer.dynamic_energy_adjustment_damping ** seconds_per_buffer
+        target = energy * self.recognizer.dynamic_energy_ratio
+        self.recognizer.energy_threshold = (
+            self.recognizer.energy_threshold * damping + target * (1 - damping)
+        )
+    
+    def _chunks_for(self, milliseconds: float) -> int:
+        """Numărul de bucăți care acoperă durata dată"""
+        chunk_ms = self._source.CHUNK * 1000 / self._source.SAMPLE_RATE
+        return max(1, int(round(milliseconds / chunk_ms)))
+    
+    def capture_utterance(self, timeout: float = AppConfig.LISTEN_TIMEOUT,
+                          phrase_time_limit: float = AppConfig.PHRASE_TIME_LIMIT) -> sr.AudioData:
+        """
+        Returnează următoarea frază rostită, inclusiv pre-roll-ul
+        
+        Args:
+            timeout: Cât se așteaptă începutul vorbirii (secunde)
+            phrase_time_limit: Durata maximă a frazei (secunde)
+            
+        Raises:
+            sr.WaitTimeoutError: dacă nu începe nicio vorbire în timp util
+        """
+        frames = b"".join(self.stream_utterance(timeout, phrase_time_limit))
+        return sr.AudioData(frames, self._source.SAMPLE_RATE, self._source.SAMPLE_WIDTH)
+    
+    def stream_utterance(self, timeout: float = AppConfig.LISTEN_TIMEOUT,
+                         phrase_time_limit: float = AppConfig.PHRASE_TIME_LIMIT) -> Iterator[bytes]:
+        """
+        Ca capture_utterance(), dar produce bucățile pe măsură ce sosesc
+        
+        Primele bucăți (pre-roll-ul) apar când începe vorbirea. Dacă
+        generatorul este închis mai devreme, captura se oprește imediat.
+        """
+        if not self._running:
+            raise RuntimeError("Captura continuă nu este pornită")
+        
+        pre_roll = self._chunks_for(self.pre_roll_ms)
+        silence_needed = self._chunks_for(self.endpoint_silence_ms)
+        phrase_limit = self._chunks_for(phrase_time_limit * 1000)
+        
+        with self._condition:
+            oldest = self._chunks[0][0] if self._chunks else self._next_index
+            cursor = max(oldest, self._next_index - pre_roll)
+            self._capturing = True
+        
+        try:
+            yield from self._iter_utterance(cursor, timeout, pre_roll, silence_needed, phrase_limit)
+        finally:
+            with self._condition:
+                self._capturing = False
+    
+    def _iter_utterance(self, cursor: int, timeout: float, pre_roll: int,
+                        silence_needed: int, phrase_limit: int) -> Iterator[bytes]:
+        """Citește bucăți din buffer până la sfârșitul frazei"""
+        width = self._source.SAMPLE_WIDTH
+        waiting = []
+        speech_started = False
+        speech_chunks = 0
+        silent_chunks = 0
+        last_speech = time.perf_counter()
+        deadline = time.monotonic() + timeout
+        
+        while True:
+            entry = self._wait_for_chunk(cursor, deadline if not speech_started else None)
+            if entry is None:
+                if not self._running:
+                    raise RuntimeError("Captura continuă a fost oprită")
+                raise sr.WaitTimeoutError("listening timed out while waiting for phrase to start")
+            index, chunk = entry
+            cursor = index + 1
+            
+            is_speech = pcm_rms(chunk, width) > self.recognizer.energy_threshold
+            if not speech_started:
+                waiting.append(chunk)
+                if not is_speech:
+                    # Păstrează doar pre-roll-ul dinaintea vorbirii
+                    del waiting[:-pre_roll]
+                    continue
+                speech_started = True
+                yield from waiting
+            else:
+                yield chunk
+            
+            speech_chunks += 1
+            if is_speech:
+                silent_chunks = 0
+                last_speech = time.perf_counter()
+            else:
+                silent_chunks += 1
+            if silent_chunks >= silence_needed:
+                # Timpul petrecut așteptând liniștea de final
+                pipeline_metrics.record('endpointing', time.perf_counter() - last_speech)
+                break
+            if speech_chunks >= phrase_limit:
+                break
+    
+    def _wait_for_chunk(self, index: int,
+                        deadline: Optional[float]) -> Optional[Tuple[int, bytes]]:
+        """
+        Așteaptă bucata cu indexul dat
+        
+        Dacă bucata a fost deja suprascrisă în buffer, returnează cea mai veche
+        bucată disponibilă. Returnează None la expirarea termenului.
+        """
+        with self._condition:
+            while self._running and index >= self._next_index:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return None
+                self._condition.wait(remaining)
+            
+            if index >= self._next_index:
+                return None
+            oldest = self._chunks[0][0]
+            return self._chunks[max(index, oldest) - oldest]
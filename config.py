@@ -11,12 +11,93 @@ class AppConfig:
     WINDOW_SIZE = "800x600"
     WINDOW_TITLE = "Aplicație Exerciții Pronunție"
     SPEECH_RATE = 150
+    TTS_CACHE_ENABLED = True
+    TTS_CACHE_DIR = "tts_cache"
+    TTS_CACHE_MAX_BYTES = 200 * 1024 * 1024
+    TTS_MEMORY_CACHE_SIZE = 16
+    TTS_PREFETCH_COUNT = 3
     SIMILARITY_THRESHOLD = 0.7
+    SCORE_CACHE_SIZE = 4096
+    SIMILARITY_ENGINE = "sequence_matcher"  # sau "levenshtein", "phonetic" (după pronunție)
+    PHONEME_CACHE_SIZE = 4096
+    NEAREST_WORD_MAX_DISTANCE = 2
+    VOCABULARY_DB = "vocabulary.db"
+    VOCABULARY_SEED_FILE = "default_words.csv"
+    VOCABULARY_IMPORT_BATCH = 1000
+    VOCABULARY_MAX_WORD_LENGTH = 64
+    RECOGNIZER_BACKEND = "google"
+    RECOGNITION_LANGUAGE = "ro-RO"
+    WHISPER_MODEL = "small"
+    WHISPER_DEVICE = "cpu"
+    WHISPER_COMPUTE_TYPE = "int8"
+    RECOGNITION_MAX_ALTERNATIVES = 5  # ipotezele (N-best) cerute motorului
+    STREAMING_RECOGNITION = True  # acceptare timpurie pe rezultate parțiale (motoarele care o suportă)
+    STREAM_PARTIAL_MS = 300
+    STREAM_ACCEPT_SIMILARITY = 0.95  # mai strict decât pragul: prefixele parțiale primesc 0.9
+    TRANSCRIPT_CACHE_ENABLED = True
+    TRANSCRIPT_CACHE_SIZE = 1024
+    TRANSCRIPT_CACHE_DIR = "transcript_cache"  # None = doar în memorie
+    PREPROCESS_ENABLED = True
+    PREPROCESS_SAMPLE_RATE = 16000
+    PREPROCESS_FRAME_MS = 10
+    PREPROCESS_PAD_MS = 150  # liniștea păstrată în jurul vorbirii
+    PREPROCESS_MIN_SPEECH_MS = 80
+    PREPROCESS_MIN_SNR = 3.0
+    PREPROCESS_MIN_LEVEL_RANGE = 2.0  # sub acest raport între cadrele puternice și cele slabe: doar zgomot
+    PREPROCESS_SILENCE_FLOOR = 0.003
+    PREPROCESS_TARGET_PEAK = 0.9
+    PREPROCESS_MAX_GAIN = 8.0
     LISTEN_TIMEOUT = 5
     PHRASE_TIME_LIMIT = 3
+    CAPTURE_MODE = "continuous"
+    RING_BUFFER_SECONDS = 10
+    PRE_ROLL_MS = 300
+    ENDPOINT_SILENCE_MS = 400
+    CALIBRATION_FILE = "calibration.json"
+    CALIBRATION_DURATION = 1
+    CALIBRATION_SAVE_CHANGE = 0.1
     BLINK_COUNT = 3
     BLINK_DURATION = 0.2
+    SUCCESS_FLASH_MS = 120
+    LISTENING_PULSE_MS = 800
     SUCCESS_DISPLAY_TIME = 1500
+    SCHEDULER_MAX_WORKERS = 1
+    UI_FRAME_MS = 16
+    AUDIO_STATUS_POLL_MS = 200
+    STARTUP_REPORT = True
+    BATCH_CHUNKSIZE = 256
+    BATCH_REPORT_INTERVAL = 5
+    BENCHMARK_BASELINE = "benchmark_baseline.json"
+    BENCHMARK_TOLERANCE = 0.25
+    JOURNAL_ENABLED = True
+    JOURNAL_FILE = "session.journal"
+    JOURNAL_SNAPSHOT_FILE = "session.snapshot"
+    JOURNAL_FLUSH_MS = 50
+    JOURNAL_SNAPSHOT_EVERY = 200
+    HISTORY_ENABLED = True
+    HISTORY_FILE = "attempt_history.npz"
+    HISTORY_MIN_ATTEMPTS = 3
+    HISTORY_ROLLING_WINDOW = 20
+    DEFAULT_PATIENT = "implicit"
+    DECK_MODE = "sequential"  # sau "spaced" (repetiție spațiată)
+    SPACED_RETRY_GAP = 3
+    SPACED_BASE_INTERVAL = 4
+    SPACED_MASTERY_STREAK = 2
+    SPACED_MAX_PRESENTATIONS = 4
+    SERVER_HOST = "127.0.0.1"
+    SERVER_PORT = 8765
+    SERVER_MAX_SESSIONS = 32
+    SERVER_MAX_RECOGNITIONS = 4
+    SERVER_MAX_RECOGNITION_QUEUE = 16
+    SERVER_MAX_UPLOAD_BYTES = 2 * 1024 * 1024
+    SERVER_SESSION_IDLE_TIMEOUT = 30 * 60
+    SERVER_TICK_MS = 100
+    SERVER_HISTORY_SAVE_INTERVAL = 60  # secunde
+    METRICS_ENABLED = False
+    METRICS_FILE = "metrics.prom"
+    METRICS_PORT = 0  # 0 = fără endpoint HTTP
+    METRICS_WRITE_INTERVAL = 15.0  # secunde; 0 = fișierul se scrie doar la închidere
+    METRICS_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
 
 class Colors:
     """Constante pentru culori"""
@@ -25,6 +106,7 @@ class Colors:
     SUCCESS_BG = "#90EE90"
     SUCCESS_FG = "#006400"
     ERROR_BG = "#ffcccb"
+    LISTENING_BG = "#E3F2FD"
     BUTTON_PRIMARY = "#2196F3"
     BUTTON_SUCCESS = "#4CAF50"
     BUTTON_WARNING = "#FF9800"
@@ -52,6 +134,7 @@ class UIText:
     RESTART_BUTTON = "🔄 Restart categorie"
     STATUS_DEFAULT = "Apasă pe microfon și pronunță cuvântul"
     STATUS_LISTENING = "Vorbește acum..."
+    STATUS_PARTIAL = "Aud: {text}..."
     STATUS_CORRECT = "✅ Corect! Felicitări!"
     STATUS_INCORRECT = "❌ Ai spus: '{text}'. Încearcă din nou!"
     STATUS_NO_SOUND = "Nu am auzit nimic. Încearcă din nou."
@@ -0,0 +1,79 @@
+# fake_audio.py
+"""
+Serviciu audio local, fără microfon și fără TTS, pentru benchmark-uri și rulări fără hardware
+"""
+import itertools
+import time
+from typing import Callable, Iterable, List, Optional, Sequence, Union
+from audio_services import AudioService
+from config import AppConfig
+from models import Hypothesis
+
+class FakeAudioService(AudioService):
+    """
+    Returnează transcrieri predefinite, cu o latență configurabilă
+    
+    Un element poate fi și o listă de transcrieri: ipotezele unei singure
+    încercări (N-best), cea mai probabilă prima.
+    
+    Cu `partials`, listen_stream() simulează un motor cu streaming: fiecare
+    element este șirul rezultatelor parțiale ale unei încercări (ultimul este
+    rezultatul final), emise la câte partial_latency secunde.
+    """
+    
+    def __init__(self, transcripts: Iterable[Union[str, Sequence[str]]] = (), listen_latency: float = 0.0,
+                 speak_latency: float = 0.0, partials: Optional[Iterable[Sequence[str]]] = None,
+                 partial_latency: float = 0.0):
+        self._transcripts = itertools.cycle(list(transcripts) or [""])
+        self._partials = itertools.cycle(list(partials)) if partials else None
+        self.listen_latency = listen_latency
+        self.speak_latency = speak_latency
+        self.partial_latency = partial_latency
+        self.spoken: List[str] = []
+        self.early_accepts = 0
+    
+    def speak(self, text: str) -> None:
+        """Înregistrează textul care ar fi fost rostit"""
+        if self.speak_latency:
+            time.sleep(self.speak_latency)
+        self.spoken.append(text)
+    
+    def listen(self) -> Optional[str]:
+        """Returnează următoarea transcriere predefinită"""
+        hypotheses = self.listen_all(1)
+        return hypotheses[0].transcript if hypotheses else None
+    
+    def listen_all(self, max_alternatives: int = AppConfig.RECOGNITION_MAX_ALTERNATIVES) -> List[Hypothesis]:
+        """Returnează ipotezele următoarei încercări predefinite"""
+        if self.listen_latency:
+            time.sleep(self.listen_latency)
+        entry = next(self._transcripts)
+        alternatives = [entry] if isinstance(entry, str) else list(entry)
+        return [Hypothesis(text) for text in alternatives[:max_alternatives] if text]
+    
+    def listen_stream(self, on_partial: Callable[[List[Hypothesis]], bool],
+                      max_alternatives: int = AppConfig.RECOGNITION_MAX_ALTERNATIVES) -> List[Hypothesis]:
+        """Emite rezultatele parțiale predefinite; se oprește la primul acceptat"""
+        if self._partials is None:
+            return self.listen_all(max_alternatives)
+        
+        hypotheses: List[Hypothesis] = []
+        stages = list(next(self._partials))
+        for stage, text in enumerate(stages):
+            if self.partial_latency:
+                time.sleep(self.partial_latency)
+            hypotheses = [Hypothesis(text)] if text else []
+            if stage < len(stages) - 1 and hypotheses and on_partial(hypotheses):
+                self.early_accepts += 1
+                break
+        return hypotheses
+    
+    def get_status(self) -> dict:
+        """Status compatibil cu CombinedAudioService"""
+        return {
+            'tts_ready': True,
+            'stt_ready': True,
+            'tts_available': True,
+            'stt_available': True,
+            'stt_backend': 'fake'
+        }
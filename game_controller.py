@@ -2,22 +2,49 @@
 """
 Controller pentru logica jocului!
 """
-import threading
-from typing import Optional, Callable
-from models import GameState
+import time
+from typing import TYPE_CHECKING, List, Optional, Callable
+from models import GameState, Hypothesis
 from word_manager import WordCategoryManager
-from audio_services import CombinedAudioService
-from pronunciation_checker import PronunciationChecker
+from audio_services import AudioService, CombinedAudioService
+from pronunciation_checker import STATUS_CODES, PronunciationChecker
+from scheduler import CommandScheduler, ScheduledCall
+from session_journal import SessionJournal
+from word_deck import create_deck
 from config import AppConfig, UIText
+from latency_metrics import pipeline_metrics
+
+if TYPE_CHECKING:
+    from attempt_history import AttemptHistory
 
 class GameController:
     """Controller principal pentru logica jocului"""
     
-    def __init__(self):
+    def __init__(self, audio_service: Optional[AudioService] = None,
+                 scheduler: Optional[CommandScheduler] = None,
+                 journal: Optional[SessionJournal] = None,
+                 history: Optional["AttemptHistory"] = None,
+                 word_manager: Optional[WordCategoryManager] = None,
+                 pronunciation_checker: Optional[PronunciationChecker] = None,
+                 autosave_history: bool = True):
         self.state = GameState()
-        self.word_manager = WordCategoryManager()
-        self.audio_service = CombinedAudioService()
-        self.pronunciation_checker = PronunciationChecker()
+        # Managerul de cuvinte și verificatorul pot fi partajate între sesiuni
+        self.word_manager = word_manager or WordCategoryManager()
+        self.audio_service = audio_service or CombinedAudioService()
+        self.pronunciation_checker = pronunciation_checker or PronunciationChecker()
+        self.journal = journal
+        self.history = history
+        # Serverul partajează istoricul între sesiuni și îl salvează singur, periodic
+        self.autosave_history = autosave_history
+        self.patient = AppConfig.DEFAULT_PATIENT
+        # Rangul ipotezei (0 = prima) pe care a fost acceptată ultima încercare corectă
+        self.last_match_rank: Optional[int] = None
+        
+        # Toate modificările stării rulează serializat pe planificator
+        self.scheduler = scheduler or CommandScheduler()
+        self._pending_advance: Optional[ScheduledCall] = None
+        self._listen_word: Optional[str] = None
+        self._listen_started = 0.0
         
         # Callbacks pentru UI
         self.on_word_changed: Optional[Callable[[str], None]] = None
@@ -36,81 +63,214 @@ class GameController:
     
     def start_new_category(self, category_name: str) -> bool:
         """Începe o categorie nouă"""
-        category = self.word_manager.get_category(category_name)
-        if not category:
+        if not self.word_manager.get_category(category_name):
             return False
         
-        self.state.current_category = category_name
-        self.state.remaining_words = category.get_random_words()
-        self.state.reset_score()
-        
-        self._update_score()
-        self._next_word()
+        self.scheduler.submit(self._start_category, category_name)
         return True
     
+    def resume_session(self) -> Optional[str]:
+        """Reia sesiunea întreruptă din jurnal; returnează categoria reluată"""
+        if not self.journal:
+            return None
+        state = self.journal.restore()
+        if not state or not self.word_manager.get_category(state.current_category):
+            return None
+        
+        self.scheduler.submit(self._resume_session, state)
+        return state.current_category
+    
     def restart_current_category(self) -> None:
         """Restart categoria curentă"""
-        self.start_new_category(self.state.current_category)
+        self.scheduler.submit(self._restart_category)
     
     def skip_current_word(self) -> None:
         """Sare peste cuvântul curent"""
-        self.state.add_attempt(correct=False)
-        self._update_score()
-        self._next_word()
+        self.scheduler.submit(self._skip_word)
     
     def speak_current_word(self) -> None:
         """Pronunță cuvântul curent"""
-        if self.state.current_word:
-            threading.Thread(
-                target=self.audio_service.speak, 
-                args=(self.state.current_word,), 
-                daemon=True
-            ).start()
+        self.scheduler.submit(self._speak_word)
     
     def start_listening(self) -> None:
         """Începe ascultarea pentru pronunție"""
-        if self.state.is_listening:
-            return
-        
-        self.state.is_listening = True
-        self._update_listening_status()
-        self._update_status(UIText.STATUS_LISTENING)
-        
-        # Rulează ascultarea într-un thread separat
-        threading.Thread(target=self._listen_for_pronunciation, daemon=True).start()
+        self.scheduler.submit(self._start_listening)
+    
+    def shutdown(self) -> None:
+        """Oprește planificatorul și serviciile audio"""
+        self.scheduler.shutdown()
+        self.audio_service.close()
+        if self.journal:
+            self.journal.close()
+        if self.history is not None:
+            self.history.save()
     
     def get_available_categories(self) -> list:
         """Returnează lista categoriilor disponibile"""
         return self.word_manager.get_category_names()
     
+    def find_closest_word(self, spoken_text: str) -> Optional[str]:
+        """Returnează cuvântul din vocabular cel mai apropiat de textul recunoscut"""
+        if not spoken_text or spoken_text in STATUS_CODES:
+            return None
+        return self.word_manager.get_vocabulary_index().closest_word(spoken_text)
+    
+    def get_confusion_stats(self) -> dict:
+        """Returnează confuziile (cuvânt țintă, cuvânt auzit) -> număr de apariții"""
+        return dict(self.state.confusions)
+    
     def get_audio_status(self) -> dict:
         """Returnează statusul serviciilor audio"""
         return self.audio_service.get_status()
     
+    def _start_category(self, category_name: str) -> None:
+        """Pornește categoria (rulează pe planificator)"""
+        category = self.word_manager.get_category(category_name)
+        if not category:
+            return
+        
+        self._cancel_pending_advance()
+        self.pronunciation_checker.compile_category(category)
+        self.state.current_category = category_name
+        self.state.deck = create_deck(category.get_random_words())
+        self.state.reset_score()
+        if self.journal:
+            self.journal.record_deck(category_name, self.state.deck)
+        
+        self._update_score()
+        self._next_word()
+    
+    def _resume_session(self, state: GameState) -> None:
+        """Restaurează starea salvată (rulează pe planificator)"""
+        self._cancel_pending_advance()
+        self.pronunciation_checker.compile_category(self.word_manager.get_category(state.current_category))
+        self.state = state
+        
+        self._update_score()
+        self._update_word()
+        self._update_status(UIText.STATUS_DEFAULT)
+        self._speak_word()
+    
+    def _restart_category(self) -> None:
+        """Repornește categoria curentă (rulează pe planificator)"""
+        self._start_category(self.state.current_category)
+    
+    def _skip_word(self) -> None:
+        """Sare peste cuvânt (rulează pe planificator)"""
+        # Cuvântul a fost deja pronunțat corect: doar grăbește trecerea mai departe
+        if self._cancel_pending_advance():
+            self._next_word()
+            return
+        
+        self.state.add_attempt(correct=False)
+        self.state.deck.record_result(self.state.current_word, False)
+        now = time.time()
+        if self.journal:
+            self.journal.record_attempt(self.state.current_word, None, 0.0, False, now, now)
+        self._record_history(0.0, False, now)
+        self._update_score()
+        self._next_word()
+    
+    def _speak_word(self) -> None:
+        """Trimite cuvântul curent la TTS (rulează pe planificator)"""
+        if self.state.current_word:
+            self.audio_service.speak(self.state.current_word)
+    
+    def _start_listening(self) -> None:
+        """Pornește ascultarea (rulează pe planificator)"""
+        if self.state.is_listening or self._pending_advance:
+            return
+        
+        self.state.is_listening = True
+        self._listen_word = self.state.current_word
+        self._listen_started = time.time()
+        self._update_listening_status()
+        self._update_status(UIText.STATUS_LISTENING)
+        
+        # Ascultarea blochează, deci rulează pe executor; rezultatul revine în coadă
+        self.scheduler.run_in_executor(
+            self._listen_for_pronunciation,
+            self._process_pronunciation,
+            self._handle_listen_error
+        )
+    
+    def _cancel_pending_advance(self) -> bool:
+        """Anulează trecerea programată la cuvântul următor, dacă există"""
+        if self._pending_advance is None:
+            return False
+        self._pending_advance.cancel()
+        self._pending_advance = None
+        return True
+    
     def _next_word(self) -> None:
         """Trece la următorul cuvânt"""
-        if not self.state.remaining_words:
+        self._pending_advance = None
+        word = self.state.deck.next_word()
+        if word is None:
             self._handle_category_completion()
             return
         
-        self.state.current_word = self.state.remaining_words.pop(0)
+        self.state.current_word = word
+        if self.journal:
+            self.journal.record_next(self.state.current_word)
         self._update_word()
         self._update_status(UIText.STATUS_DEFAULT)
         
         # Pronunță automat cuvântul nou
-        self.speak_current_word()
+        self._speak_word()
+        self.audio_service.prefetch(self.state.deck.upcoming(AppConfig.TTS_PREFETCH_COUNT))
+    
+    def _listen_for_pronunciation(self) -> List[Hypothesis]:
+        """Ascultă pronunția (rulează pe executor, nu modifică starea)"""
+        with pipeline_metrics.measure('listen'):
+            if not AppConfig.STREAMING_RECOGNITION:
+                return self.audio_service.listen_all()
+            word = self._listen_word
+            return self.audio_service.listen_stream(lambda hypotheses: self._accept_partial(word, hypotheses))
+    
+    def _accept_partial(self, word: str, hypotheses: List[Hypothesis]) -> bool:
+        """
+        Verifică un rezultat parțial (rulează pe executor); True oprește ascultarea
+        
+        Un prefix al cuvântului este considerat corect de regula variațiilor
+        (scor 0.9), deci acceptarea timpurie cere STREAM_ACCEPT_SIMILARITY.
+        """
+        if not hypotheses or not hypotheses[0].transcript:
+            return False
+        self.scheduler.submit(self._show_partial, word, hypotheses[0].transcript)
+        is_correct, similarity, _ = self.pronunciation_checker.check_hypotheses(word, hypotheses)
+        return is_correct and similarity >= AppConfig.STREAM_ACCEPT_SIMILARITY
     
-    def _listen_for_pronunciation(self) -> None:
-        """Ascultă și procesează pronunția"""
+    def _show_partial(self, word: str, text: str) -> None:
+        """Afișează textul auzit până acum, dacă ascultarea pentru cuvânt continuă"""
+        if self.state.is_listening and self._listen_word == word:
+            self._update_status(UIText.STATUS_PARTIAL.format(text=text))
+    
+    def _process_pronunciation(self, hypotheses: List[Hypothesis]) -> None:
+        """Procesează ipotezele recunoașterii (rulează pe planificator)"""
         try:
-            spoken_text = self.audio_service.listen()
-            
-            if spoken_text:
-                is_correct, similarity = self.pronunciation_checker.check_pronunciation(
-                    self.state.current_word, spoken_text
-                )
+            if self.state.current_word != self._listen_word:
+                # Cuvântul s-a schimbat între timp: rezultatul nu mai este relevant
+                self._update_status(UIText.STATUS_DEFAULT)
+            elif hypotheses and hypotheses[0].transcript:
+                with pipeline_metrics.measure('scoring'):
+                    is_correct, similarity, rank = self.pronunciation_checker.check_hypotheses(
+                        self.state.current_word, hypotheses
+                    )
+                
+                # Acceptat pe o ipoteză alternativă: se păstrează varianta potrivită;
+                # altfel, feedback-ul folosește transcrierea cea mai probabilă
+                self.last_match_rank = rank if is_correct else None
+                spoken_text = hypotheses[rank if is_correct else 0].transcript
                 
                 self.state.add_attempt(correct=is_correct)
+                self.state.deck.record_result(self.state.current_word, is_correct)
+                if self.journal:
+                    self.journal.record_attempt(
+                        self.state.current_word, spoken_text, similarity, is_correct,
+                        self._listen_started, time.time(), rank=self.last_match_rank
+                    )
+                self._record_history(similarity, is_correct, self._listen_started)
                 
                 if is_correct:
                     self._handle_correct_pronunciation()
@@ -126,8 +286,25 @@ class GameController:
             self._update_status("Eroare la ascultare. Încearcă din nou.")
         finally:
             self.state.is_listening = False
+            self._listen_word = None
             self._update_listening_status()
     
+    def _record_history(self, similarity: float, correct: bool, timestamp: float) -> None:
+        """Adaugă încercarea curentă în istoricul pacientului"""
+        if self.history is not None:
+            self.history.append(
+                self.state.current_word, similarity, correct,
+                category=self.state.current_category, patient=self.patient, timestamp=timestamp
+            )
+    
+    def _handle_listen_error(self, error: Exception) -> None:
+        """Gestionează o eroare apărută în timpul ascultării"""
+        print(f"Eroare la ascultare: {error}")
+        self._update_status("Eroare la ascultare. Încearcă din nou.")
+        self.state.is_listening = False
+        self._listen_word = None
+        self._update_listening_status()
+    
     def _handle_correct_pronunciation(self) -> None:
         """Gestionează pronunția corectă"""
         self._update_status(UIText.STATUS_CORRECT)
@@ -135,13 +312,19 @@ class GameController:
             self.on_feedback_correct()
         
         # Programează trecerea la următorul cuvânt
-        threading.Timer(
+        self._pending_advance = self.scheduler.call_later(
             AppConfig.SUCCESS_DISPLAY_TIME / 1000, 
             self._next_word
-        ).start()
+        )
     
     def _handle_incorrect_pronunciation(self, spoken_text: str) -> None:
         """Gestionează pronunția incorectă"""
+        closest = self.find_closest_word(spoken_text)
+        if closest and closest != self.state.current_word:
+            self.state.add_confusion(self.state.current_word, closest)
+            if self.journal:
+                self.journal.record_confusion(self.state.current_word, closest)
+        
         feedback_msg = self.pronunciation_checker.get_feedback_message(
             self.state.current_word, spoken_text, False
         )
@@ -152,6 +335,11 @@ class GameController:
     
     def _handle_category_completion(self) -> None:
         """Gestionează finalizarea categoriei"""
+        if self.journal:
+            self.journal.record_complete(self.state.current_category)
+        if self.history is not None and self.autosave_history:
+            # Scrierea fișierului nu are loc pe firul planificatorului
+            self.history.save_in_background()
         if self.on_category_completed:
             self.on_category_completed(
                 self.state.current_category,
@@ -0,0 +1,198 @@
+# latency_metrics.py
+"""
+Histograme de latență pentru etapele ascultare → scorare → feedback
+"""
+import os
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Iterator, List, Optional, Sequence
+from config import AppConfig
+
+class Histogram:
+    """Histogramă cu praguri fixe, în stilul Prometheus (secunde)"""
+    
+    def __init__(self, buckets: Sequence[float]):
+        self.buckets = tuple(sorted(buckets))
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.total = 0.0
+        self.count = 0
+    
+    def observe(self, seconds: float) -> None:
+        """Adaugă o observație"""
+        index = 0
+        while index < len(self.buckets) and seconds > self.buckets[index]:
+            index += 1
+        self.counts[index] += 1
+        self.total += seconds
+        self.count += 1
+    
+    def cumulative(self) -> List[int]:
+        """Numărul cumulat de observații pentru fiecare prag (ultimul este +Inf)"""
+        result = []
+        running = 0
+        for count in self.counts:
+            running += count
+            result.append(running)
+        return result
+
+class LatencyMetrics:
+    """
+    Colectează durata etapelor din fluxul unei încercări
+    
+    Etape: capture (înregistrarea frazei), endpointing (așteptarea liniștii de
+    final, inclusă în capture), recognition, listen (tot apelul listen()),
+    scoring și dispatch (de la callback-ul controller-ului până la execuția
+    lui pe firul Tk). Când măsurarea este dezactivată, measure() întoarce un
+    context gol și record() iese imediat.
+    """
+    
+    METRIC_NAME = "speech_pipeline_stage_seconds"
+    
+    def __init__(self, enabled: bool = AppConfig.METRICS_ENABLED,
+                 buckets: Sequence[float] = AppConfig.METRICS_BUCKETS):
+        self.enabled = enabled
+        self.buckets = tuple(buckets)
+        self._histograms: Dict[str, Histogram] = {}
+        self._lock = threading.Lock()
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._write_lock = threading.Lock()
+        self._writer: Optional[threading.Thread] = None
+        self._stop_writer = threading.Event()
+        self._null = nullcontext()
+    
+    def measure(self, stage: str):
+        """Context care măsoară durata unei etape (gol când măsurarea e dezactivată)"""
+        if not self.enabled:
+            return self._null
+        return self._measure(stage)
+    
+    @contextmanager
+    def _measure(self, stage: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(stage, time.perf_counter() - start)
+    
+    def record(self, stage: str, seconds: float) -> None:
+        """Înregistrează o durată (în secunde) pentru etapa dată"""
+        if not self.enabled:
+            return
+        with self._lock:
+            histogram = self._histograms.get(stage)
+            if histogram is None:
+                histogram = self._histograms[stage] = Histogram(self.buckets)
+            histogram.observe(seconds)
+    
+    def reset(self) -> None:
+        """Șterge toate observațiile"""
+        with self._lock:
+            self._histograms.clear()
+    
+    def get_summary(self) -> dict:
+        """Numărul de observații și media (ms) pentru fiecare etapă"""
+        with self._lock:
+            return {
+                stage: {
+                    'count': histogram.count,
+                    'mean_ms': histogram.total / histogram.count * 1000 if histogram.count else 0.0
+                }
+                for stage, histogram in self._histograms.items()
+            }
+    
+    def render_prometheus(self) -> str:
+        """Histogramele în formatul text Prometheus"""
+        lines = [
+            f"# HELP {self.METRIC_NAME} Durata etapelor unei încercări de pronunție",
+            f"# TYPE {self.METRIC_NAME} histogram"
+        ]
+        with self._lock:
+            for stage in sorted(self._histograms):
+                histogram = self._histograms[stage]
+                bounds = [f"{bound:g}" for bound in histogram.buckets] + ["+Inf"]
+                for bound, count in zip(bounds, histogram.cumulative()):
+                    lines.append(f'{self.METRIC_NAME}_bucket{{stage="{stage}",le="{bound}"}} {count}')
+                lines.append(f'{self.METRIC_NAME}_sum{{stage="{stage}"}} {histogram.total:.6f}')
+                lines.append(f'{self.METRIC_NAME}_count{{stage="{stage}"}} {histogram.count}')
+        return "\n".join(lines) + "\n"
+    
+    def write(self, path: str = AppConfig.METRICS_FILE) -> None:
+        """Scrie histogramele într-un fișier text (pentru textfile collector), atomic"""
+        temp_path = f"{path}.tmp"
+        # Scrierea periodică și cea de la închidere folosesc același fișier temporar
+        with self._write_lock:
+            try:
+                with open(temp_path, 'w', encoding='utf-8') as f:
+                    f.write(self.render_prometheus())
+                os.replace(temp_path, path)
+            except OSError as e:
+                print(f"Eroare scriere metrici: {e}")
+    
+    def write_periodically(self, interval: float = AppConfig.METRICS_WRITE_INTERVAL,
+                           path: str = AppConfig.METRICS_FILE) -> None:
+        """
+        Rescrie fișierul la fiecare `interval` secunde, pe un fir propriu
+        
+        Astfel datele pot fi citite cât timp aplicația rulează și nu se pierd
+        dacă aceasta este oprită forțat; scrierea pe disc nu întârzie firul
+        planificatorului, pe care rulează chiar etapele măsurate.
+        """
+        if not self.enabled or interval <= 0 or self._writer is not None:
+            return
+        
+        def run() -> None:
+            while not self._stop_writer.wait(interval):
+                self.write(path)
+        
+        self._stop_writer.clear()
+        self._writer = threading.Thread(target=run, name="metrics-writer", daemon=True)
+        self._writer.start()
+    
+    def stop_writer(self) -> None:
+        """Oprește scrierea periodică"""
+        if self._writer is None:
+            return
+        self._stop_writer.set()
+        self._writer.join(timeout=1)
+        self._writer = None
+    
+    def serve(self, port: int = AppConfig.METRICS_PORT) -> None:
+        """Pornește un endpoint HTTP local (/metrics) pe 127.0.0.1"""
+        if self._server is not None:
+            return
+        
+        metrics = self
+        
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.rstrip('/') != '/metrics':
+                    self.send_error(404)
+                    return
+                body = metrics.render_prometheus().encode('utf-8')
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+            
+            def log_message(self, format, *args):
+                pass
+        
+        try:
+            self._server = ThreadingHTTPServer(('127.0.0.1', port), Handler)
+        except OSError as e:
+            print(f"Eroare pornire server metrici: {e}")
+            return
+        threading.Thread(target=self._server.serve_forever, name="metrics-http", daemon=True).start()
+    
+    def stop_server(self) -> None:
+        """Oprește endpoint-ul HTTP"""
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+# Instanța folosită de serviciul audio, controller și dispecerul UI
+pipeline_metrics = LatencyMetrics()
@@ -4,22 +4,41 @@ Aplicația principală pentru exerciții de pronunție
 """
 import tkinter as tk
 from tkinter import messagebox
-from config import AppConfig, Colors, UIText
-from game_controller import GameController
-from ui_components import (
-    WordDisplayComponent, CategorySelectorComponent, ScoreDisplayComponent,
-    StatusDisplayComponent, ControlPanelComponent
-)
+from startup_timing import startup_timings
+
+with startup_timings.measure('imports'):
+    from config import AppConfig, Colors, UIText
+    from game_controller import GameController
+    from latency_metrics import pipeline_metrics
+    from session_journal import SessionJournal
+    from ui_dispatcher import UIDispatcher
+    from ui_components import (
+        WordDisplayComponent, CategorySelectorComponent, ScoreDisplayComponent,
+        StatusDisplayComponent, ControlPanelComponent
+    )
 
 class SpeechTherapyApp:
     """Aplicația principală pentru terapia vocală"""
     
     def __init__(self):
         self.root = tk.Tk()
-        self.controller = GameController()
-        self._setup_window()
-        self._create_ui()
-        self._setup_controller_callbacks()
+        self.dispatcher = UIDispatcher(self.root)
+        if pipeline_metrics.enabled and AppConfig.METRICS_PORT:
+            pipeline_metrics.serve(AppConfig.METRICS_PORT)
+        
+        # Serviciile audio se inițializează în fundal; fereastra nu le așteaptă
+        with startup_timings.measure('controller_init'):
+            journal = SessionJournal() if AppConfig.JOURNAL_ENABLED else None
+            history = None
+            if AppConfig.HISTORY_ENABLED:
+                from attempt_history import AttemptHistory
+                history = AttemptHistory()
+            self.controller = GameController(journal=journal, history=history)
+        pipeline_metrics.write_periodically()
+        with startup_timings.measure('ui_construction'):
+            self._setup_window()
+            self._create_ui()
+            self._setup_controller_callbacks()
         self._initialize_game()
     
     def _setup_window(self) -> None:
@@ -86,25 +105,40 @@ class SpeechTherapyApp:
     
     def _setup_controller_callbacks(self) -> None:
         """Configurează callback-urile pentru controller"""
+        # Callback-urile vin de pe alte fire: trec prin dispecer spre firul Tk.
+        # Actualizările de stare se comasează pe cheie, evenimentele nu.
+        dispatch = self.dispatcher.wrap
         self.controller.set_callbacks(
-            on_word_changed=self._on_word_changed,
-            on_score_changed=self._on_score_changed,
-            on_status_changed=self._on_status_changed,
-            on_feedback_correct=self._on_feedback_correct,
-            on_feedback_incorrect=self._on_feedback_incorrect,
-            on_listening_changed=self._on_listening_changed,
-            on_category_completed=self._on_category_completed
+            on_word_changed=dispatch(self._on_word_changed, 'word'),
+            on_score_changed=dispatch(self._on_score_changed, 'score'),
+            on_status_changed=dispatch(self._on_status_changed, 'status'),
+            on_feedback_correct=dispatch(self._on_feedback_correct),
+            on_feedback_incorrect=dispatch(self._on_feedback_incorrect),
+            on_listening_changed=dispatch(self._on_listening_changed, 'listening'),
+            on_category_completed=dispatch(self._on_category_completed)
         )
+        self.dispatcher.start()
     
     def _initialize_game(self) -> None:
-        """Inițializează jocul"""
+        """Inițializează jocul (reia sesiunea întreruptă, dacă există)"""
+        resumed_category = self.controller.resume_session()
+        if resumed_category:
+            self.category_selector.set_selected(resumed_category)
+            return
+        
         default_category = self.category_selector.get_selected()
         if default_category:
             self.controller.start_new_category(default_category)
     
     def _check_audio_status(self) -> None:
-        """Verifică și afișează statusul serviciilor audio"""
+        """Verifică și afișează statusul serviciilor audio, după ce sunt gata"""
         status = self.controller.get_audio_status()
+        if not (status['tts_ready'] and status['stt_ready']):
+            self.root.after(AppConfig.AUDIO_STATUS_POLL_MS, self._check_audio_status)
+            return
+        
+        if AppConfig.STARTUP_REPORT:
+            print(startup_timings.format_report())
         
         warnings = []
         if not status['tts_available']:
@@ -167,6 +201,7 @@ class SpeechTherapyApp:
     def _on_listening_changed(self, is_listening: bool) -> None:
         """Callback pentru schimbarea statusului de ascultare"""
         self.control_panel.set_listening_mode(is_listening)
+        self.word_display.show_listening(is_listening)
     
     def _on_category_completed(self, category: str, score: int, total: int, percentage: float) -> None:
         """Callback pentru finalizarea categoriei"""
@@ -196,6 +231,13 @@ class SpeechTherapyApp:
             print("Aplicația a fost închisă.")
         except Exception as e:
             messagebox.showerror("Eroare", f"Eroare neașteptată: {e}")
+        finally:
+            self.dispatcher.stop()
+            self.controller.shutdown()
+            if pipeline_metrics.enabled:
+                pipeline_metrics.stop_writer()
+                pipeline_metrics.write(AppConfig.METRICS_FILE)
+                pipeline_metrics.stop_server()
 
 def main():
     """Funcția principală"""
@@ -3,8 +3,9 @@
 Modele de date pentru aplicația de terapie vocală
 """
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 import random
+from word_deck import SequentialDeck, WordDeck
 
 @dataclass
 class WordCategory:
@@ -18,19 +19,33 @@ class WordCategory:
         random.shuffle(shuffled)
         return shuffled
 
+@dataclass(frozen=True)
+class Hypothesis:
+    """O variantă a transcrierii, cu încrederea dată de motor (None dacă lipsește)"""
+    transcript: str
+    confidence: Optional[float] = None
+
 @dataclass
 class GameState:
     """Starea jocului"""
     current_category: str = "Animale"
     current_word: str = ""
-    remaining_words: List[str] = None
+    deck: WordDeck = None
     score: int = 0
     total_attempts: int = 0
     is_listening: bool = False
+    confusions: Dict[Tuple[str, str], int] = None
     
     def __post_init__(self):
-        if self.remaining_words is None:
-            self.remaining_words = []
+        if self.deck is None:
+            self.deck = SequentialDeck()
+        if self.confusions is None:
+            self.confusions = {}
+    
+    @property
+    def remaining_words(self) -> List[str]:
+        """Cuvintele rămase în pachet, în ordinea în care urmează"""
+        return self.deck.remaining()
     
     def reset_score(self):
         """Resetează scorul"""
@@ -43,6 +58,11 @@ class GameState:
         if correct:
             self.score += 1
     
+    def add_confusion(self, target_word: str, heard_word: str) -> None:
+        """Înregistrează că în locul cuvântului țintă s-a auzit alt cuvânt din vocabular"""
+        key = (target_word, heard_word)
+        self.confusions[key] = self.confusions.get(key, 0) + 1
+    
     def get_score_percentage(self) -> float:
         """Calculează procentajul de succes"""
         return (self.score / self.total_attempts * 100) if self.total_attempts > 0 else 0
\ No newline at end of file
@@ -0,0 +1,134 @@
+# phonetics.py
+"""
+Transcriere fonetică pentru limba română și distanța de editare ponderată între foneme
+"""
+import unicodedata
+from functools import lru_cache
+from typing import Dict, List, Tuple
+from config import AppConfig
+
+Phonemes = Tuple[str, ...]
+
+_CEDILLA_FIX = str.maketrans("şţ", "șț")
+_VOWEL_LETTERS = set("aăâeiîou")
+
+# Litere cu o singură pronunție, indiferent de context
+_LETTERS: Dict[str, Phonemes] = {
+    'a': ('a',), 'ă': ('ə',), 'â': ('ɨ',), 'î': ('ɨ',), 'b': ('b',), 'd': ('d',),
+    'e': ('e',), 'f': ('f',), 'h': ('h',), 'i': ('i',), 'j': ('ʒ',), 'k': ('k',),
+    'l': ('l',), 'm': ('m',), 'n': ('n',), 'o': ('o',), 'p': ('p',), 'q': ('k',),
+    'r': ('r',), 's': ('s',), 'ș': ('ʃ',), 't': ('t',), 'ț': ('ts',), 'u': ('u',),
+    'v': ('v',), 'w': ('v',), 'x': ('k', 's'), 'y': ('i',), 'z': ('z',)
+}
+
+VOWELS = frozenset("aəɨeiou")
+
+# Costul înlocuirii între foneme apropiate (simetric); restul costă 1
+_SIMILAR_PAIRS = {
+    # Vocale apropiate și diacritice omise la transcriere (ă -> a, â/î -> i)
+    ('a', 'ə'): 0.3, ('ə', 'ɨ'): 0.4, ('i', 'ɨ'): 0.4, ('ə', 'e'): 0.5,
+    ('e', 'i'): 0.5, ('o', 'u'): 0.5, ('i', 'j'): 0.2, ('i', 'ʲ'): 0.3, ('j', 'ʲ'): 0.2,
+    # Perechi surdă-sonoră
+    ('p', 'b'): 0.4, ('t', 'd'): 0.4, ('k', 'g'): 0.4, ('f', 'v'): 0.4,
+    ('s', 'z'): 0.4, ('ʃ', 'ʒ'): 0.4, ('tʃ', 'dʒ'): 0.4,
+    # Diacritice omise (ș -> s, ț -> t) și simplificări frecvente; l/r rămâne
+    # o greșeală întreagă, fiind chiar una dintre confuziile exersate
+    ('s', 'ʃ'): 0.3, ('t', 'ts'): 0.3, ('ts', 's'): 0.5, ('tʃ', 'ʃ'): 0.5,
+    ('dʒ', 'ʒ'): 0.5, ('k', 'tʃ'): 0.6, ('g', 'dʒ'): 0.6, ('m', 'n'): 0.5
+}
+SUBSTITUTION_COSTS: Dict[Tuple[str, str], float] = {
+    **_SIMILAR_PAIRS, **{(b, a): cost for (a, b), cost in _SIMILAR_PAIRS.items()}
+}
+VOWEL_SUBSTITUTION_COST = 0.7
+
+# Sunete slabe, ușor de pierdut sau de adăugat în vorbire
+INDEL_COSTS: Dict[str, float] = {'ʲ': 0.3, 'j': 0.5, 'h': 0.5}
+
+def _normalize(text: str) -> str:
+    text = unicodedata.normalize("NFC", text).lower().translate(_CEDILLA_FIX)
+    return "".join(char for char in text if char.isalpha())
+
+@lru_cache(maxsize=AppConfig.PHONEME_CACHE_SIZE)
+def to_phonemes(text: str) -> Phonemes:
+    """
+    Secvența de foneme a unui text românesc (spațiile și punctuația sunt ignorate)
+    
+    Reguli: ce/ci și ge/gi sunt africate, iar i/e dintre africată și o vocală
+    nu se pronunță (ciorap, geam); che/chi și ghe/ghi sunt k/g; i final după
+    consoană este doar palatalizare (lupi), după vocală este semivocală (mai).
+    """
+    word = _normalize(text)
+    phonemes: List[str] = []
+    i = 0
+    while i < len(word):
+        char = word[i]
+        following = word[i + 1:i + 2]
+        
+        if char in "cg":
+            plain = 'k' if char == 'c' else 'g'
+            if following == 'h' and word[i + 2:i + 3] in ('e', 'i'):
+                phonemes.append(plain)
+                i += 2
+                continue
+            if following in ('e', 'i'):
+                phonemes.append('tʃ' if char == 'c' else 'dʒ')
+                after = word[i + 2:i + 3]
+                if (following == 'i' and after in ('a', 'ă', 'o', 'u')) or (following == 'e' and after in ('a', 'o')):
+                    i += 2
+                else:
+                    i += 1
+                continue
+            phonemes.append(plain)
+        elif char == 'i' and i == len(word) - 1 and i > 0:
+            phonemes.append('j' if word[i - 1] in _VOWEL_LETTERS else 'ʲ')
+        else:
+            phonemes.extend(_LETTERS.get(char, ()))
+        i += 1
+    return tuple(phonemes)
+
+def substitution_cost(a: str, b: str) -> float:
+    """Costul înlocuirii fonemului a cu b"""
+    if a == b:
+        return 0.0
+    cost = SUBSTITUTION_COSTS.get((a, b))
+    if cost is not None:
+        return cost
+    if a in VOWELS and b in VOWELS:
+        return VOWEL_SUBSTITUTION_COST
+    return 1.0
+
+def phoneme_distance(a: Phonemes, b: Phonemes, max_distance: float = float('inf')) -> float:
+    """
+    Distanța de editare ponderată între două secvențe de foneme
+    
+    Returnează o valoare mai mare decât max_distance de îndată ce un rând
+    întreg al tabelului o depășește.
+    """
+    previous = [0.0]
+    for phoneme in b:
+        previous.append(previous[-1] + INDEL_COSTS.get(phoneme, 1.0))
+    
+    for source in a:
+        deletion = INDEL_COSTS.get(source, 1.0)
+        current = [previous[0] + deletion]
+        for j, target in enumerate(b, 1):
+            current.append(min(
+                previous[j] + deletion,
+                current[j - 1] + INDEL_COSTS.get(target, 1.0),
+                previous[j - 1] + substitution_cost(source, target)
+            ))
+        if min(current) > max_distance:
+            return min(current)
+        previous = current
+    return previous[-1]
+
+def phoneme_similarity(a: Phonemes, b: Phonemes, min_score: float = 0.0) -> float:
+    """1 - distanță / lungime_maximă, sau 0.0 dacă min_score nu poate fi atins"""
+    longest = max(len(a), len(b))
+    if longest == 0:
+        return 1.0
+    max_distance = (1.0 - min_score) * longest + 1e-9 if min_score > 0 else float('inf')
+    distance = phoneme_distance(a, b, max_distance)
+    if distance > max_distance:
+        return 0.0
+    return max(0.0, 1.0 - distance / longest)
@@ -2,15 +2,81 @@
 """
 Serviciu pentru verificarea pronunției
 """
-from difflib import SequenceMatcher
-from typing import List, Tuple
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple, Union
 from config import AppConfig
+from models import Hypothesis, WordCategory
+from similarity import SimilarityEngine, create_engine
+
+# Rezultatele listen() care nu sunt transcrieri
+STATUS_CODES = ("TIMEOUT", "UNKNOWN", "ERROR")
+
+@dataclass(frozen=True)
+class CompiledWord:
+    """Formă precompilată a unui cuvânt țintă"""
+    normalized: str
+    variations: Tuple[str, ...]
 
 class PronunciationChecker:
     """Verifică corectitudinea pronunției"""
     
-    def __init__(self, similarity_threshold: float = AppConfig.SIMILARITY_THRESHOLD):
+    def __init__(self, similarity_threshold: float = AppConfig.SIMILARITY_THRESHOLD,
+                 cache_size: int = AppConfig.SCORE_CACHE_SIZE,
+                 engine: Union[str, SimilarityEngine] = AppConfig.SIMILARITY_ENGINE):
         self.threshold = similarity_threshold
+        self.engine = create_engine(engine) if isinstance(engine, str) else engine
+        self.cache_size = cache_size
+        self._index: Dict[str, CompiledWord] = {}
+        self._results: "OrderedDict[Tuple[str, str], Tuple[bool, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+    
+    def compile_category(self, category: WordCategory) -> None:
+        """Precompilează toate cuvintele unei categorii"""
+        for word in category.words:
+            self.compile_word(word)
+    
+    def compile_word(self, word: str) -> CompiledWord:
+        """Returnează forma precompilată a unui cuvânt (o calculează o singură dată)"""
+        compiled = self._index.get(word)
+        if compiled is None:
+            normalized = word.lower().strip()
+            self.engine.prepare(normalized)
+            variations = self._generate_variations(normalized) if self.engine.uses_variations else []
+            compiled = CompiledWord(normalized, tuple(variations))
+            self._index[word] = compiled
+        return compiled
+    
+    def check_many(self, pairs: Iterable[Tuple[str, str]]) -> List[Tuple[bool, float]]:
+        """
+        Verifică un lot de perechi (cuvânt țintă, text recunoscut)
+        
+        Args:
+            pairs: Perechi (cuvânt_țintă, text_recunoscut)
+            
+        Returns:
+            Lista de (este_corect, scor_similaritate), în ordinea perechilor
+        """
+        return [self.check_pronunciation(target, spoken) for target, spoken in pairs]
+    
+    def get_cache_stats(self) -> dict:
+        """Returnează statistici pentru indexul și cache-ul de rezultate"""
+        return {
+            'compiled_words': len(self._index),
+            'cached_results': len(self._results),
+            'hits': self._hits,
+            'misses': self._misses
+        }
+    
+    def clear_cache(self) -> None:
+        """Golește cache-ul de rezultate"""
+        with self._lock:
+            self._results.clear()
+            self._hits = 0
+            self._misses = 0
     
     def check_pronunciation(self, target_word: str, spoken_text: str) -> Tuple[bool, float]:
         """
@@ -23,34 +89,129 @@ class PronunciationChecker:
         Returns:
             Tuple cu (este_corect, scor_similaritate)
         """
-        if not spoken_text or spoken_text in ["TIMEOUT", "UNKNOWN", "ERROR"]:
+        if not spoken_text or spoken_text in STATUS_CODES:
             return False, 0.0
         
-        target_lower = target_word.lower().strip()
+        compiled = self.compile_word(target_word)
         spoken_lower = spoken_text.lower().strip()
+        key = (compiled.normalized, spoken_lower)
+        
+        with self._lock:
+            result = self._results.get(key)
+            if result is not None:
+                self._results.move_to_end(key)
+                self._hits += 1
+                return result
+            self._misses += 1
         
-        # Verifică match exact
-        if target_lower == spoken_lower:
-            return True, 1.0
+        result = self._score(compiled, spoken_lower)
         
-        # Verifică variații comune
-        variations = self._generate_variations(target_lower)
+        with self._lock:
+            self._results[key] = result
+            if len(self._results) > self.cache_size:
+                self._results.popitem(last=False)
+        return result
+    
+    def check_hypotheses(self, target_word: str,
+                         hypotheses: Sequence[Union[str, Hypothesis]]) -> Tuple[bool, float, int]:
+        """
+        Verifică toate ipotezele recunoașterii (N-best) într-un singur apel
         
-        for variation in variations:
-            if variation in spoken_lower or spoken_lower in variation:
-                return True, 0.9
+        Args:
+            target_word: Cuvântul țintă
+            hypotheses: Transcrierile, cea mai probabilă prima
+            
+        Returns:
+            Tuple cu (este_corect, scor_similaritate, rang) pentru cea mai bună
+            ipoteză; rangul este poziția ei în listă (0 = prima)
+        """
+        compiled = self.compile_word(target_word)
+        spoken = [
+            (hypothesis.transcript if isinstance(hypothesis, Hypothesis) else hypothesis)
+            for hypothesis in hypotheses
+        ]
+        normalized = [
+            text.lower().strip() if text and text not in STATUS_CODES else None
+            for text in spoken
+        ]
         
-        # Calculează similaritatea
-        similarity = SequenceMatcher(None, target_lower, spoken_lower).ratio()
+        results: Dict[str, Tuple[bool, float]] = {}
+        with self._lock:
+            for text in normalized:
+                if text is None or text in results:
+                    continue
+                key = (compiled.normalized, text)
+                result = self._results.get(key)
+                if result is not None:
+                    self._results.move_to_end(key)
+                    self._hits += 1
+                    results[text] = result
+                else:
+                    self._misses += 1
         
-        # Verifică similaritatea cu variațiile
-        max_similarity = similarity
-        for variation in variations:
-            var_similarity = SequenceMatcher(None, variation, spoken_lower).ratio()
-            max_similarity = max(max_similarity, var_similarity)
+        missing = [text for text in dict.fromkeys(normalized) if text is not None and text not in results]
+        if missing:
+            scored = dict(zip(missing, self._score_many(compiled, missing)))
+            results.update(scored)
+            with self._lock:
+                for text, result in scored.items():
+                    self._results[(compiled.normalized, text)] = result
+                while len(self._results) > self.cache_size:
+                    self._results.popitem(last=False)
         
-        is_correct = max_similarity >= self.threshold
-        return is_correct, max_similarity
+        best: Optional[Tuple[bool, float, int]] = None
+        for rank, text in enumerate(normalized):
+            if text is None:
+                continue
+            is_correct, similarity = results[text]
+            if best is None or (is_correct, similarity) > best[:2]:
+                best = (is_correct, similarity, rank)
+        return best if best is not None else (False, 0.0, 0)
+    
+    def _score(self, compiled: CompiledWord, spoken_lower: str) -> Tuple[bool, float]:
+        """Calculează scorul pentru un cuvânt precompilat"""
+        return self._score_many(compiled, [spoken_lower])[0]
+    
+    def _score_many(self, compiled: CompiledWord, spoken: Sequence[str]) -> List[Tuple[bool, float]]:
+        """Calculează scorurile unui lot de texte pentru același cuvânt precompilat"""
+        target_lower = compiled.normalized
+        variations = compiled.variations
+        results: List[Optional[Tuple[bool, float]]] = [None] * len(spoken)
+        
+        for i, spoken_lower in enumerate(spoken):
+            # Verifică match exact
+            if target_lower == spoken_lower:
+                results[i] = (True, 1.0)
+                continue
+            
+            # Verifică variații comune
+            for variation in variations:
+                if variation in spoken_lower or spoken_lower in variation:
+                    results[i] = (True, 0.9)
+                    break
+        
+        pending = [i for i, result in enumerate(results) if result is None]
+        if pending:
+            texts = [spoken[i] for i in pending]
+            
+            # Scorul exact (fără oprire la prag) ajunge în jurnal și în istoricul
+            # încercărilor, deci fiecare text este comparat o singură dată, complet
+            max_similarity = self._max_similarity(compiled, texts)
+            
+            for i, similarity in zip(pending, max_similarity):
+                results[i] = (similarity >= self.threshold, similarity)
+        return results
+    
+    def _max_similarity(self, compiled: CompiledWord, texts: Sequence[str]) -> List[float]:
+        """Similaritatea maximă cu ținta și cu variațiile, câte un apel pe tipar"""
+        target_lower = compiled.normalized
+        max_similarity = self.engine.similarity_many(target_lower, texts)
+        for variation in compiled.variations:
+            if variation == target_lower:
+                continue
+            var_similarity = self.engine.similarity_many(variation, texts)
+            max_similarity = [max(a, b) for a, b in zip(max_similarity, var_similarity)]
+        return max_similarity
     
     def _generate_variations(self, word: str) -> List[str]:
         """Generează variații comune ale cuvântului"""
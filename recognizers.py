@@ -0,0 +1,280 @@
+# recognizers.py
+"""
+Motoare de recunoaștere vocală (online și offline)
+"""
+import json
+import math
+import threading
+from abc import ABC, abstractmethod
+from typing import Callable, Dict, Iterable, List, Optional, Tuple, Type
+import speech_recognition as sr
+from config import AppConfig
+from models import Hypothesis
+from transcript_cache import UNRECOGNIZED, TranscriptCache
+
+# Primește ipotezele parțiale; True oprește recunoașterea (rezultatul este acceptat)
+PartialCallback = Callable[[List[Hypothesis]], bool]
+
+class RecognizerBackend(ABC):
+    """
+    Interfață abstractă pentru motoarele de recunoaștere
+    
+    recognize() ridică sr.UnknownValueError când vorbirea nu a fost înțeleasă
+    și sr.RequestError când motorul nu poate fi folosit.
+    """
+    
+    name = ""
+    # Dacă recognize_stream() produce rezultate parțiale cât timp sosește audio
+    supports_streaming = False
+    
+    def preload(self) -> None:
+        """Încarcă resursele motorului înainte de prima recunoaștere"""
+        pass
+    
+    @abstractmethod
+    def recognize(self, recognizer: sr.Recognizer, audio: sr.AudioData) -> str:
+        pass
+    
+    def recognize_all(self, recognizer: sr.Recognizer, audio: sr.AudioData,
+                      max_alternatives: int = AppConfig.RECOGNITION_MAX_ALTERNATIVES) -> List[Hypothesis]:
+        """Ipotezele recunoașterii (N-best), cea mai probabilă prima; implicit doar una"""
+        return [Hypothesis(self.recognize(recognizer, audio))]
+    
+    def recognize_stream(self, recognizer: sr.Recognizer, chunks: Iterable[bytes],
+                         sample_rate: int, sample_width: int, on_partial: PartialCallback,
+                         max_alternatives: int = AppConfig.RECOGNITION_MAX_ALTERNATIVES) -> List[Hypothesis]:
+        """
+        Recunoaște audio-ul pe măsură ce sosește
+        
+        Motoarele cu streaming apelează on_partial cu ipotezele parțiale și se
+        opresc când acesta returnează True, întorcând ipotezele acceptate.
+        Implicit, audio-ul este adunat și recunoscut o singură dată, la final.
+        """
+        audio = sr.AudioData(b"".join(chunks), sample_rate, sample_width)
+        return self.recognize_all(recognizer, audio, max_alternatives)
+
+class GoogleRecognizerBackend(RecognizerBackend):
+    """Recunoaștere prin serviciul online Google"""
+    
+    name = "google"
+    
+    def __init__(self, language: str = AppConfig.RECOGNITION_LANGUAGE):
+        self.language = language
+    
+    def recognize(self, recognizer: sr.Recognizer, audio: sr.AudioData) -> str:
+        """Trimite audio la Google și returnează transcrierea"""
+        return recognizer.recognize_google(audio, language=self.language)
+    
+    def recognize_all(self, recognizer: sr.Recognizer, audio: sr.AudioData,
+                      max_alternatives: int = AppConfig.RECOGNITION_MAX_ALTERNATIVES) -> List[Hypothesis]:
+        """Cere serviciului toate alternativele (show_all), cu încrederea lor"""
+        if max_alternatives <= 1:
+            return [Hypothesis(self.recognize(recognizer, audio))]
+        
+        response = recognizer.recognize_google(audio, language=self.language, show_all=True)
+        alternatives = response.get('alternative', []) if isinstance(response, dict) else []
+        hypotheses = [
+            Hypothesis(alternative['transcript'], alternative.get('confidence'))
+            for alternative in alternatives if alternative.get('transcript')
+        ]
+        if not hypotheses:
+            raise sr.UnknownValueError()
+        return hypotheses[:max_alternatives]
+
+class WhisperRecognizerBackend(RecognizerBackend):
+    """
+    Recunoaștere offline cu faster-whisper
+    
+    Modelul este încărcat o singură dată pe proces și rămâne în memorie,
+    așa că latența unei încercări depinde doar de procesorul local.
+    """
+    
+    name = "whisper"
+    supports_streaming = True
+    SAMPLE_RATE = 16000
+    
+    _models: Dict[Tuple[str, str, str], object] = {}
+    _models_lock = threading.Lock()
+    
+    def __init__(self, model_size: str = AppConfig.WHISPER_MODEL,
+                 device: str = AppConfig.WHISPER_DEVICE,
+                 compute_type: str = AppConfig.WHISPER_COMPUTE_TYPE,
+                 language: str = AppConfig.RECOGNITION_LANGUAGE):
+        self.model_key = (model_size, device, compute_type)
+        self.language = language.split('-')[0]
+    
+    def preload(self) -> None:
+        """Încarcă modelul Whisper dacă nu este deja în memorie"""
+        self._get_model()
+    
+    def _get_model(self):
+        """Returnează modelul încărcat, încărcându-l la prima cerere"""
+        with self._models_lock:
+            model = self._models.get(self.model_key)
+            if model is None:
+                try:
+                    from faster_whisper import WhisperModel
+                except ImportError as e:
+                    raise sr.RequestError(f"faster-whisper nu este instalat: {e}")
+                
+                model_size, device, compute_type = self.model_key
+                model = WhisperModel(model_size, device=device, compute_type=compute_type)
+                self._models[self.model_key] = model
+            return model
+    
+    def recognize(self, recognizer: sr.Recognizer, audio: sr.AudioData) -> str:
+        """Transcrie local înregistrarea"""
+        return self.recognize_all(recognizer, audio, 1)[0].transcript
+    
+    def recognize_all(self, recognizer: sr.Recognizer, audio: sr.AudioData,
+                      max_alternatives: int = AppConfig.RECOGNITION_MAX_ALTERNATIVES) -> List[Hypothesis]:
+        """
+        O singură ipoteză (faster-whisper nu expune alternativele), cu încrederea
+        estimată din log-probabilitatea medie a segmentelor
+        """
+        hypothesis = self._transcribe(audio)
+        if hypothesis is None:
+            raise sr.UnknownValueError()
+        return [hypothesis]
+    
+    def recognize_stream(self, recognizer: sr.Recognizer, chunks: Iterable[bytes],
+                         sample_rate: int, sample_width: int, on_partial: PartialCallback,
+                         max_alternatives: int = AppConfig.RECOGNITION_MAX_ALTERNATIVES) -> List[Hypothesis]:
+        """
+        Retranscrie audio-ul adunat după fiecare STREAM_PARTIAL_MS de audio nou
+        
+        Whisper nu decodează incremental, dar pe fraze de un cuvânt o
+        retranscriere costă puțin, iar acceptarea timpurie scurtează ascultarea.
+        """
+        step = max(1, sample_rate * sample_width * AppConfig.STREAM_PARTIAL_MS // 1000)
+        buffer = bytearray()
+        decoded = 0
+        hypothesis = None
+        for chunk in chunks:
+            buffer += chunk
+            if len(buffer) - decoded < step:
+                continue
+            decoded = len(buffer)
+            hypothesis = self._transcribe(sr.AudioData(bytes(buffer), sample_rate, sample_width))
+            if hypothesis is not None and on_partial([hypothesis]):
+                return [hypothesis]
+        
+        if decoded != len(buffer):
+            hypothesis = self._transcribe(sr.AudioData(bytes(buffer), sample_rate, sample_width))
+        if hypothesis is None:
+            raise sr.UnknownValueError()
+        return [hypothesis]
+    
+    def _transcribe(self, audio: sr.AudioData) -> Optional[Hypothesis]:
+        """Transcrierea înregistrării, sau None dacă nu s-a recunoscut nimic"""
+        import numpy as np
+        
+        model = self._get_model()
+        raw = audio.get_raw_data(convert_rate=self.SAMPLE_RATE, convert_width=2)
+        samples = np.frombuffer(raw, dtype=np.int16).astype(np.float32) / 32768.0
+        
+        segments = list(model.transcribe(samples, language=self.language, beam_size=1)[0])
+        text = " ".join(segment.text.strip() for segment in segments).strip()
+        if not text:
+            return None
+        log_probability = sum(segment.avg_logprob for segment in segments) / len(segments)
+        return Hypothesis(text, math.exp(log_probability))
+
+class CachedRecognizerBackend(RecognizerBackend):
+    """
+    Motor care întoarce din cache transcrierile pentru audio deja recunoscut
+    
+    Și rezultatul „nu s-a înțeles nimic” este păstrat; erorile de serviciu
+    (sr.RequestError) nu sunt păstrate, ca încercarea următoare să reîncerce.
+    """
+    
+    def __init__(self, backend: RecognizerBackend, cache: TranscriptCache):
+        self.backend = backend
+        self.cache = cache
+        self.name = backend.name
+        self.supports_streaming = backend.supports_streaming
+        self.language = getattr(backend, 'language', AppConfig.RECOGNITION_LANGUAGE)
+    
+    def preload(self) -> None:
+        self.backend.preload()
+    
+    def recognize(self, recognizer: sr.Recognizer, audio: sr.AudioData) -> str:
+        key = self.cache.make_key(
+            audio.get_raw_data(), audio.sample_rate, audio.sample_width, self.language, self.name
+        )
+        text = self.cache.get(key)
+        if text is None:
+            try:
+                text = self.backend.recognize(recognizer, audio)
+            except sr.UnknownValueError:
+                self.cache.put(key, UNRECOGNIZED)
+                raise
+            self.cache.put(key, text)
+        
+        if text == UNRECOGNIZED:
+            raise sr.UnknownValueError()
+        return text
+    
+    def recognize_all(self, recognizer: sr.Recognizer, audio: sr.AudioData,
+                      max_alternatives: int = AppConfig.RECOGNITION_MAX_ALTERNATIVES) -> List[Hypothesis]:
+        """Ca recognize(), pentru listele de ipoteze (păstrate ca JSON, sub o cheie separată)"""
+        if max_alternatives <= 1:
+            return [Hypothesis(self.recognize(recognizer, audio))]
+        
+        key = self.cache.make_key(
+            audio.get_raw_data(), audio.sample_rate, audio.sample_width,
+            self.language, f"{self.name}/n{max_alternatives}"
+        )
+        text = self.cache.get(key)
+        if text is None:
+            try:
+                hypotheses = self.backend.recognize_all(recognizer, audio, max_alternatives)
+            except sr.UnknownValueError:
+                self.cache.put(key, UNRECOGNIZED)
+                raise
+            self.cache.put(key, json.dumps(
+                [[h.transcript, h.confidence] for h in hypotheses], ensure_ascii=False
+            ))
+            return hypotheses
+        
+        if text == UNRECOGNIZED:
+            raise sr.UnknownValueError()
+        return [Hypothesis(transcript, confidence) for transcript, confidence in json.loads(text)]
+    
+    def recognize_stream(self, recognizer: sr.Recognizer, chunks: Iterable[bytes],
+                         sample_rate: int, sample_width: int, on_partial: PartialCallback,
+                         max_alternatives: int = AppConfig.RECOGNITION_MAX_ALTERNATIVES) -> List[Hypothesis]:
+        """Rezultatele parțiale depind de momentul opririi, deci nu trec prin cache"""
+        if not self.supports_streaming:
+            return super().recognize_stream(
+                recognizer, chunks, sample_rate, sample_width, on_partial, max_alternatives
+            )
+        return self.backend.recognize_stream(
+            recognizer, chunks, sample_rate, sample_width, on_partial, max_alternatives
+        )
+
+BACKENDS: Dict[str, Type[RecognizerBackend]] = {
+    GoogleRecognizerBackend.name: GoogleRecognizerBackend,
+    WhisperRecognizerBackend.name: WhisperRecognizerBackend,
+}
+
+# Cache-ul de transcrieri este comun tuturor motoarelor din proces
+_transcript_cache: Optional[TranscriptCache] = None
+_transcript_cache_lock = threading.Lock()
+
+def get_transcript_cache() -> TranscriptCache:
+    """Cache-ul de transcrieri al procesului (creat la prima cerere)"""
+    global _transcript_cache
+    with _transcript_cache_lock:
+        if _transcript_cache is None:
+            _transcript_cache = TranscriptCache()
+        return _transcript_cache
+
+def create_recognizer_backend(name: str = AppConfig.RECOGNIZER_BACKEND,
+                              cached: bool = AppConfig.TRANSCRIPT_CACHE_ENABLED) -> RecognizerBackend:
+    """Creează un motor de recunoaștere după nume (cu cache de transcrieri, implicit)"""
+    try:
+        backend = BACKENDS[name]()
+    except KeyError:
+        raise ValueError(f"Motor de recunoaștere necunoscut: {name}") from None
+    return CachedRecognizerBackend(backend, get_transcript_cache()) if cached else backend
@@ -0,0 +1,185 @@
+# scheduler.py
+"""
+Planificator de comenzi serializate pentru logica jocului
+"""
+import heapq
+import itertools
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, List, Optional, Tuple
+from config import AppConfig
+
+class Clock:
+    """Ceas monoton folosit de planificator"""
+    
+    def now(self) -> float:
+        return time.monotonic()
+
+class ManualClock(Clock):
+    """Ceas controlat manual, pentru teste și rulări deterministe"""
+    
+    def __init__(self, start: float = 0.0):
+        self._now = start
+    
+    def now(self) -> float:
+        return self._now
+    
+    def advance(self, seconds: float) -> None:
+        """Avansează ceasul"""
+        self._now += seconds
+
+class ScheduledCall:
+    """O comandă programată, care poate fi anulată înainte de execuție"""
+    
+    def __init__(self, due: float, callback: Callable, args: Tuple):
+        self.due = due
+        self.callback = callback
+        self.args = args
+        self.cancelled = False
+    
+    def cancel(self) -> None:
+        """Anulează comanda dacă nu a rulat încă"""
+        self.cancelled = True
+
+class CommandScheduler:
+    """
+    Execută comenzile una câte una, în ordine, pe un singur fir
+    
+    Toate modificările stării jocului trec prin acest planificator, deci sunt
+    ordonate. Operațiile blocante (ascultarea microfonului) rulează pe un
+    executor limitat, iar rezultatul lor revine ca o comandă nouă în coadă.
+    
+    Cu threaded=False nu pornește niciun fir pentru comenzi: acestea rulează
+    la apelul run_pending(), ceea ce, împreună cu ManualClock și
+    max_workers=0 (executare pe loc), face controller-ul testabil determinist.
+    """
+    
+    def __init__(self, clock: Optional[Clock] = None,
+                 max_workers: int = AppConfig.SCHEDULER_MAX_WORKERS,
+                 threaded: bool = True):
+        self.clock = clock or Clock()
+        self._queue: List[Tuple[float, int, ScheduledCall]] = []
+        self._sequence = itertools.count()
+        self._condition = threading.Condition()
+        self._running = True
+        self._executor = ThreadPoolExecutor(max_workers, thread_name_prefix="game-io") if max_workers > 0 else None
+        self._thread: Optional[threading.Thread] = None
+        
+        if threaded:
+            self._thread = threading.Thread(target=self._run, name="game-scheduler", daemon=True)
+            self._thread.start()
+    
+    def submit(self, callback: Callable, *args: Any) -> ScheduledCall:
+        """Programează o comandă cât mai curând, după cele deja în coadă"""
+        return self.call_later(0, callback, *args)
+    
+    def call_later(self, delay: float, callback: Callable, *args: Any) -> ScheduledCall:
+        """Programează o comandă după `delay` secunde"""
+        call = ScheduledCall(self.clock.now() + delay, callback, args)
+        with self._condition:
+            heapq.heappush(self._queue, (call.due, next(self._sequence), call))
+            self._condition.notify()
+        return call
+    
+    def run_in_executor(self, function: Callable[[], Any],
+                        on_result: Callable[[Any], None],
+                        on_error: Optional[Callable[[Exception], None]] = None) -> None:
+        """
+        Rulează o operație blocantă în afara firului de comenzi
+        
+        on_result / on_error sunt apoi executate ca o comandă obișnuită.
+        """
+        if self._executor is None:
+            future: Future = Future()
+            try:
+                future.set_result(function())
+            except Exception as e:
+                future.set_exception(e)
+            self.submit(self._deliver, future, on_result, on_error)
+            return
+        
+        future = self._executor.submit(function)
+        future.add_done_callback(lambda done: self.submit(self._deliver, done, on_result, on_error))
+    
+    def run_pending(self) -> int:
+        """Execută comenzile scadente (pentru modul fără fir); returnează câte au rulat"""
+        executed = 0
+        while True:
+            call = self._pop_due()
+            if call is None:
+                return executed
+            self._execute(call)
+            executed += 1
+    
+    def pending_count(self) -> int:
+        """Numărul de comenzi aflate în coadă"""
+        with self._condition:
+            return sum(1 for _, _, call in self._queue if not call.cancelled)
+    
+    def shutdown(self) -> None:
+        """Oprește firul de comenzi și executorul"""
+        with self._condition:
+            self._running = False
+            self._condition.notify()
+        if self._thread:
+            self._thread.join(timeout=1)
+        if self._executor:
+            self._executor.shutdown(wait=False)
+    
+    def _pop_due(self) -> Optional[ScheduledCall]:
+        """Scoate următoarea comandă scadentă, dacă există"""
+        with self._condition:
+            while self._queue:
+                due, _, call = self._queue[0]
+                if call.cancelled:
+                    heapq.heappop(self._queue)
+                    continue
+                if due > self.clock.now():
+                    return None
+                heapq.heappop(self._queue)
+                return call
+            return None
+    
+    def _run(self) -> None:
+        """Bucla firului de comenzi"""
+        while True:
+            with self._condition:
+                while self._running:
+                    if self._queue:
+                        delay = self._queue[0][0] - self.clock.now()
+                        if delay <= 0:
+                            break
+                        self._condition.wait(delay)
+                    else:
+                        self._condition.wait()
+                if not self._running:
+                    return
+            
+            call = self._pop_due()
+            if call is not None:
+                self._execute(call)
+    
+    @staticmethod
+    def _execute(call: ScheduledCall) -> None:
+        """Execută o comandă, fără ca o eroare să oprească planificatorul"""
+        if call.cancelled:
+            return
+        try:
+            call.callback(*call.args)
+        except Exception as e:
+            print(f"Eroare la executarea comenzii {getattr(call.callback, '__name__', call.callback)}: {e}")
+    
+    @staticmethod
+    def _deliver(future: Future, on_result: Callable[[Any], None],
+                 on_error: Optional[Callable[[Exception], None]]) -> None:
+        """Transmite rezultatul unei operații blocante"""
+        try:
+            result = future.result()
+        except Exception as e:
+            if on_error:
+                on_error(e)
+            else:
+                print(f"Eroare în operația din fundal: {e}")
+            return
+        on_result(result)
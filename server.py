@@ -0,0 +1,492 @@
+# server.py
+"""
+Mod server: mai multe sesiuni independente printr-un API HTTP/WebSocket local
+
+Utilizare:
+    python server.py [--host 127.0.0.1] [--port 8765]
+
+Toate sesiunile folosesc același index de cuvinte, același verificator de
+pronunție (cu cache-ul lui de scoruri) și același cache TTS.
+"""
+import argparse
+import asyncio
+import io
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, Set
+from aiohttp import WSMsgType, web
+from audio_services import AudioService
+from config import AppConfig
+from game_controller import GameController
+from models import Hypothesis
+from pronunciation_checker import PronunciationChecker
+from scheduler import CommandScheduler
+from tts_cache import TTSCache
+from word_manager import WordCategoryManager
+
+class SessionAudioService(AudioService):
+    """Audio-ul unei sesiuni la distanță: transcrierea vine de la client, textul rostit pleacă spre el"""
+    
+    def __init__(self, on_speak: Callable[[str], None]):
+        self.on_speak = on_speak
+        self._hypotheses: List[Hypothesis] = []
+    
+    def provide(self, hypotheses: Optional[List[Hypothesis]]) -> None:
+        """Ipotezele pe care le va returna următorul listen_all()"""
+        self._hypotheses = hypotheses or []
+    
+    def speak(self, text: str) -> None:
+        self.on_speak(text)
+    
+    def listen(self) -> Optional[str]:
+        hypotheses = self.listen_all(1)
+        return hypotheses[0].transcript if hypotheses else None
+    
+    def listen_all(self, max_alternatives: int = AppConfig.RECOGNITION_MAX_ALTERNATIVES) -> List[Hypothesis]:
+        hypotheses, self._hypotheses = self._hypotheses, []
+        return hypotheses[:max_alternatives]
+    
+    def get_status(self) -> dict:
+        return {'tts_ready': True, 'stt_ready': True, 'tts_available': True,
+                'stt_available': True, 'stt_backend': 'remote'}
+
+class RemoteSession:
+    """
+    O sesiune de exerciții pentru un client
+    
+    Fiecare sesiune are propriul GameController, cu un planificator fără fire
+    (comenzile rulează pe bucla asyncio), deci mii de sesiuni nu înseamnă mii
+    de fire. Evenimentele controller-ului sunt returnate comenzii care le-a
+    produs și trimise abonaților WebSocket.
+    """
+    
+    def __init__(self, session_id: str, patient: str, word_manager: WordCategoryManager,
+                 checker: PronunciationChecker, history=None):
+        self.id = session_id
+        self.patient = patient
+        self.last_seen = time.monotonic()
+        self.lock = asyncio.Lock()
+        self.subscribers: Set[asyncio.Queue] = set()
+        self._collected: Optional[List[dict]] = None
+        
+        self.audio = SessionAudioService(lambda text: self._emit('speak', text=text))
+        self.scheduler = CommandScheduler(max_workers=0, threaded=False)
+        self.controller = GameController(
+            audio_service=self.audio, scheduler=self.scheduler, history=history,
+            word_manager=word_manager, pronunciation_checker=checker, autosave_history=False
+        )
+        self.controller.patient = patient
+        self.controller.set_callbacks(
+            on_word_changed=lambda word: self._emit('word', word=word),
+            on_score_changed=lambda score, total: self._emit('score', score=score, total=total),
+            on_status_changed=lambda status: self._emit('status', status=status),
+            on_feedback_correct=lambda: self._emit('feedback', correct=True),
+            on_feedback_incorrect=lambda: self._emit('feedback', correct=False),
+            on_category_completed=lambda category, score, total, percentage: self._emit(
+                'completed', category=category, score=score, total=total, percentage=percentage
+            )
+        )
+    
+    def _emit(self, kind: str, **fields) -> None:
+        event = dict(fields, type=kind)
+        if self._collected is not None:
+            self._collected.append(event)
+        for queue in self.subscribers:
+            queue.put_nowait(event)
+    
+    def run(self, command: Callable, *args, hypotheses: Optional[List[Hypothesis]] = None) -> List[dict]:
+        """Execută o comandă a controller-ului și returnează evenimentele produse"""
+        self.last_seen = time.monotonic()
+        self._collected = []
+        self.audio.provide(hypotheses)
+        try:
+            command(*args)
+            self.scheduler.run_pending()
+            return self._collected
+        finally:
+            self._collected = None
+            self.audio.provide(None)
+    
+    def tick(self) -> None:
+        """Rulează comenzile programate care au devenit scadente (trecerea la cuvântul următor)"""
+        if self.scheduler.pending_count():
+            self.scheduler.run_pending()
+    
+    def describe(self) -> dict:
+        """Starea sesiunii pentru client"""
+        state = self.controller.state
+        return {
+            'id': self.id,
+            'patient': self.patient,
+            'category': state.current_category,
+            'word': state.current_word,
+            'score': state.score,
+            'total': state.total_attempts,
+            'percentage': state.get_score_percentage(),
+            'remaining': len(state.deck),
+            'match_rank': self.controller.last_match_rank
+        }
+    
+    def close(self) -> None:
+        self.scheduler.shutdown()
+
+class SessionServer:
+    """Găzduiește sesiunile și resursele partajate, cu limite configurabile"""
+    
+    def __init__(self, max_sessions: int = AppConfig.SERVER_MAX_SESSIONS,
+                 max_recognitions: int = AppConfig.SERVER_MAX_RECOGNITIONS,
+                 max_recognition_queue: int = AppConfig.SERVER_MAX_RECOGNITION_QUEUE,
+                 idle_timeout: float = AppConfig.SERVER_SESSION_IDLE_TIMEOUT):
+        self.max_sessions = max_sessions
+        self.max_recognitions = max_recognitions
+        self.max_recognition_queue = max_recognition_queue
+        self.idle_timeout = idle_timeout
+        
+        self.word_manager = WordCategoryManager()
+        self.checker = PronunciationChecker()
+        self.history = None
+        if AppConfig.HISTORY_ENABLED:
+            from attempt_history import AttemptHistory
+            self.history = AttemptHistory()
+        self.tts_cache = TTSCache() if AppConfig.TTS_CACHE_ENABLED else None
+        
+        self.sessions: Dict[str, RemoteSession] = {}
+        self._recognition_pool = ThreadPoolExecutor(max_recognitions, thread_name_prefix="recognition")
+        # pyttsx3 nu suportă mai multe fire: un singur fir pentru generarea audio
+        self._tts_pool = ThreadPoolExecutor(1, thread_name_prefix="tts")
+        self._tts_service = None
+        self._backend = None
+        self._preprocessor = None
+        self._backend_lock = threading.Lock()
+        self._recognition_slots: Optional[asyncio.Semaphore] = None
+        self._waiting = 0
+        self._tick_task: Optional[asyncio.Task] = None
+        self._history_task: Optional[asyncio.Task] = None
+        self._saved_attempts = len(self.history) if self.history is not None else 0
+        self._stats = {'requests': 0, 'attempts': 0, 'recognitions': 0, 'rejected': 0, 'expired': 0}
+    
+    def create_app(self) -> web.Application:
+        """Aplicația aiohttp cu toate rutele"""
+        app = web.Application(client_max_size=AppConfig.SERVER_MAX_UPLOAD_BYTES)
+        app.add_routes([
+            web.get('/categories', self._categories),
+            web.get('/stats', self._get_stats),
+            web.post('/sessions', self._create_session),
+            web.get('/sessions/{id}', self._get_session_state),
+            web.delete('/sessions/{id}', self._delete_session),
+            web.post('/sessions/{id}/attempt', self._attempt),
+            web.post('/sessions/{id}/skip', self._skip),
+            web.post('/sessions/{id}/restart', self._restart),
+            web.post('/sessions/{id}/category', self._change_category),
+            web.get('/sessions/{id}/tts', self._tts),
+            web.get('/sessions/{id}/ws', self._websocket)
+        ])
+        app.on_startup.append(self._on_startup)
+        app.on_cleanup.append(self._on_cleanup)
+        return app
+    
+    async def _on_startup(self, app: web.Application) -> None:
+        self._recognition_slots = asyncio.Semaphore(self.max_recognitions)
+        self._tick_task = asyncio.create_task(self._tick_loop())
+        if self.history is not None:
+            self._history_task = asyncio.create_task(self._history_loop())
+    
+    async def _on_cleanup(self, app: web.Application) -> None:
+        if self._tick_task:
+            self._tick_task.cancel()
+        if self._history_task:
+            self._history_task.cancel()
+        for session in self.sessions.values():
+            session.close()
+        self.sessions.clear()
+        await self._save_history()
+        self._recognition_pool.shutdown(wait=False)
+        self._tts_pool.shutdown(wait=False)
+    
+    async def _tick_loop(self) -> None:
+        """Avansează sesiunile și închide sesiunile inactive"""
+        while True:
+            await asyncio.sleep(AppConfig.SERVER_TICK_MS / 1000)
+            now = time.monotonic()
+            for session_id, session in list(self.sessions.items()):
+                if now - session.last_seen > self.idle_timeout and not session.subscribers:
+                    self._close_session(session_id)
+                    self._stats['expired'] += 1
+                elif not session.lock.locked():
+                    session.tick()
+    
+    async def _history_loop(self) -> None:
+        """Salvează periodic istoricul partajat, în afara buclei asyncio"""
+        while True:
+            await asyncio.sleep(AppConfig.SERVER_HISTORY_SAVE_INTERVAL)
+            await self._save_history()
+    
+    async def _save_history(self) -> None:
+        """Scrie istoricul pe un fir din executor, doar dacă au apărut încercări noi"""
+        if self.history is None:
+            return
+        attempts = len(self.history)
+        if attempts == self._saved_attempts:
+            return
+        await asyncio.get_running_loop().run_in_executor(None, self.history.save)
+        self._saved_attempts = attempts
+    
+    def _close_session(self, session_id: str) -> None:
+        session = self.sessions.pop(session_id, None)
+        if session:
+            session.close()
+    
+    def _session(self, request: web.Request) -> RemoteSession:
+        self._stats['requests'] += 1
+        session = self.sessions.get(request.match_info['id'])
+        if session is None:
+            raise web.HTTPNotFound(text='{"error": "sesiune necunoscută"}', content_type='application/json')
+        return session
+    
+    async def _json_body(self, request: web.Request) -> dict:
+        try:
+            body = await request.json()
+        except ValueError:
+            raise web.HTTPBadRequest(text='{"error": "JSON invalid"}', content_type='application/json')
+        if not isinstance(body, dict):
+            raise web.HTTPBadRequest(text='{"error": "se așteaptă un obiect JSON"}', content_type='application/json')
+        return body
+    
+    def _check_category(self, category: str) -> None:
+        if not isinstance(category, str) or not self.word_manager.get_category(category):
+            raise web.HTTPNotFound(text='{"error": "categorie necunoscută"}', content_type='application/json')
+    
+    async def _command(self, session: RemoteSession, command: Callable, *args,
+                       hypotheses: Optional[List[Hypothesis]] = None) -> web.Response:
+        async with session.lock:
+            events = session.run(command, *args, hypotheses=hypotheses)
+        return web.json_response({'events': events, 'session': session.describe()})
+    
+    async def _categories(self, request: web.Request) -> web.Response:
+        return web.json_response(self.word_manager.get_category_names())
+    
+    async def _create_session(self, request: web.Request) -> web.Response:
+        self._stats['requests'] += 1
+        body = await self._json_body(request) if request.can_read_body else {}
+        category = body.get('category') or self.word_manager.get_category_names()[0]
+        self._check_category(category)
+        if len(self.sessions) >= self.max_sessions:
+            self._stats['rejected'] += 1
+            raise web.HTTPServiceUnavailable(text='{"error": "prea multe sesiuni"}', content_type='application/json')
+        
+        session_id = uuid.uuid4().hex
+        session = RemoteSession(
+            session_id, str(body.get('patient') or AppConfig.DEFAULT_PATIENT),
+            self.word_manager, self.checker, self.history
+        )
+        self.sessions[session_id] = session
+        return await self._command(session, session.controller.start_new_category, category)
+    
+    async def _get_session_state(self, request: web.Request) -> web.Response:
+        session = self._session(request)
+        session.last_seen = time.monotonic()
+        return web.json_response(session.describe())
+    
+    async def _delete_session(self, request: web.Request) -> web.Response:
+        session = self._session(request)
+        self._close_session(session.id)
+        return web.json_response({'deleted': session.id})
+    
+    async def _attempt(self, request: web.Request) -> web.Response:
+        """
+        Încercare: JSON {"transcript": ..., "alternatives": [...]} sau audio WAV în corpul cererii
+        
+        alternatives (opțional) sunt celelalte ipoteze ale recunoașterii făcute
+        de client: texte sau obiecte {"transcript", "confidence"}.
+        """
+        session = self._session(request)
+        if request.content_type == 'application/json':
+            hypotheses = self._parse_hypotheses(await self._json_body(request))
+            if hypotheses is None:
+                raise web.HTTPBadRequest(text='{"error": "lipsește transcript"}', content_type='application/json')
+        else:
+            hypotheses = await self._recognize(await request.read())
+        
+        self._stats['attempts'] += 1
+        return await self._command(session, session.controller.start_listening, hypotheses=hypotheses)
+    
+    @staticmethod
+    def _parse_hypotheses(data: dict) -> Optional[List[Hypothesis]]:
+        """Ipotezele unei încercări trimise ca text; None dacă lipsește transcrierea"""
+        transcript = data.get('transcript')
+        if not isinstance(transcript, str):
+            return None
+        hypotheses = [Hypothesis(transcript.lower().strip())]
+        alternatives = data.get('alternatives')
+        for alternative in alternatives if isinstance(alternatives, list) else []:
+            if isinstance(alternative, dict):
+                text, confidence = alternative.get('transcript'), alternative.get('confidence')
+            else:
+                text, confidence = alternative, None
+            if isinstance(text, str) and text.strip():
+                confidence = float(confidence) if isinstance(confidence, (int, float)) else None
+                hypotheses.append(Hypothesis(text.lower().strip(), confidence))
+        return hypotheses[:AppConfig.RECOGNITION_MAX_ALTERNATIVES]
+    
+    async def _skip(self, request: web.Request) -> web.Response:
+        session = self._session(request)
+        return await self._command(session, session.controller.skip_current_word)
+    
+    async def _restart(self, request: web.Request) -> web.Response:
+        session = self._session(request)
+        return await self._command(session, session.controller.restart_current_category)
+    
+    async def _change_category(self, request: web.Request) -> web.Response:
+        session = self._session(request)
+        category = (await self._json_body(request)).get('category')
+        self._check_category(category)
+        return await self._command(session, session.controller.start_new_category, category)
+    
+    async def _recognize(self, data: bytes) -> List[Hypothesis]:
+        """Recunoaște audio-ul încărcat, cu un număr limitat de recunoașteri simultane"""
+        if self._waiting >= self.max_recognition_queue:
+            self._stats['rejected'] += 1
+            raise web.HTTPTooManyRequests(text='{"error": "prea multe recunoașteri în așteptare"}',
+                                          content_type='application/json')
+        self._waiting += 1
+        try:
+            async with self._recognition_slots:
+                self._stats['recognitions'] += 1
+                loop = asyncio.get_running_loop()
+                return await loop.run_in_executor(self._recognition_pool, self._recognize_wav, data)
+        finally:
+            self._waiting -= 1
+    
+    def _recognize_wav(self, data: bytes) -> List[Hypothesis]:
+        """Recunoaște un fișier WAV (rulează pe firele de recunoaștere)"""
+        try:
+            import speech_recognition as sr
+            
+            with self._backend_lock:
+                if self._backend is None:
+                    from recognizers import create_recognizer_backend
+                    self._backend = create_recognizer_backend()
+                if self._preprocessor is None and AppConfig.PREPROCESS_ENABLED:
+                    from audio_preprocessing import AudioPreprocessor
+                    self._preprocessor = AudioPreprocessor()
+        except ImportError as e:
+            print(f"Recunoașterea audio nu este disponibilă: {e}")
+            return [Hypothesis("ERROR")]
+        
+        recognizer = sr.Recognizer()
+        try:
+            with sr.AudioFile(io.BytesIO(data)) as source:
+                audio = recognizer.record(source)
+            if self._preprocessor:
+                audio, _ = self._preprocessor.process_audio(audio)
+                if audio is None:
+                    return [Hypothesis("UNKNOWN")]
+            hypotheses = self._backend.recognize_all(recognizer, audio)
+            return [Hypothesis(h.transcript.lower().strip(), h.confidence) for h in hypotheses]
+        except sr.UnknownValueError:
+            return [Hypothesis("UNKNOWN")]
+        except (sr.RequestError, ValueError) as e:
+            print(f"Eroare recunoaștere audio încărcat: {e}")
+            return [Hypothesis("ERROR")]
+    
+    async def _tts(self, request: web.Request) -> web.Response:
+        """Audio-ul WAV pentru cuvântul curent, din cache-ul TTS partajat"""
+        session = self._session(request)
+        word = session.controller.state.current_word
+        if not word:
+            raise web.HTTPNotFound(text='{"error": "niciun cuvânt curent"}', content_type='application/json')
+        
+        loop = asyncio.get_running_loop()
+        data = await loop.run_in_executor(self._tts_pool, self._render, word)
+        if data is None:
+            raise web.HTTPServiceUnavailable(text='{"error": "TTS indisponibil"}', content_type='application/json')
+        return web.Response(body=data, content_type='audio/wav')
+    
+    def _render(self, text: str) -> Optional[bytes]:
+        """Generează (o singură dată) și citește audio-ul din cache (pe firul TTS)"""
+        if self._tts_service is None:
+            from audio_services import TTSService
+            self._tts_service = TTSService(cache=self.tts_cache)
+        return self._tts_service.cached_audio(text)
+    
+    async def _websocket(self, request: web.Request) -> web.WebSocketResponse:
+        """Evenimentele sesiunii în timp real; acceptă și comenzi JSON"""
+        session = self._session(request)
+        ws = web.WebSocketResponse(heartbeat=30)
+        await ws.prepare(request)
+        
+        queue: asyncio.Queue = asyncio.Queue()
+        session.subscribers.add(queue)
+        sender = asyncio.create_task(self._forward_events(ws, queue))
+        await ws.send_json({'type': 'session', 'session': session.describe()})
+        
+        commands = {
+            'attempt': session.controller.start_listening,
+            'skip': session.controller.skip_current_word,
+            'speak': session.controller.speak_current_word,
+            'restart': session.controller.restart_current_category
+        }
+        try:
+            async for message in ws:
+                if message.type != WSMsgType.TEXT:
+                    continue
+                try:
+                    data = message.json()
+                except ValueError:
+                    await ws.send_json({'type': 'error', 'error': 'JSON invalid'})
+                    continue
+                
+                kind = data.get('type')
+                if kind == 'category' and self.word_manager.get_category(str(data.get('category'))):
+                    command, args = session.controller.start_new_category, (data['category'],)
+                elif kind in commands:
+                    command, args = commands[kind], ()
+                else:
+                    await ws.send_json({'type': 'error', 'error': f"comandă necunoscută: {kind}"})
+                    continue
+                
+                hypotheses = (self._parse_hypotheses(data) or []) if kind == 'attempt' else None
+                if kind == 'attempt':
+                    self._stats['attempts'] += 1
+                async with session.lock:
+                    session.run(command, *args, hypotheses=hypotheses)
+        finally:
+            session.subscribers.discard(queue)
+            sender.cancel()
+        return ws
+    
+    async def _forward_events(self, ws: web.WebSocketResponse, queue: asyncio.Queue) -> None:
+        while True:
+            event = await queue.get()
+            await ws.send_json(event)
+    
+    async def _get_stats(self, request: web.Request) -> web.Response:
+        return web.json_response({
+            **self._stats,
+            'sessions': len(self.sessions),
+            'max_sessions': self.max_sessions,
+            'recognitions_waiting': self._waiting,
+            'max_recognitions': self.max_recognitions,
+            'score_cache': self.checker.get_cache_stats(),
+            'tts_cache': self.tts_cache.get_stats() if self.tts_cache else None,
+            'transcript_cache': self._backend.cache.get_stats() if hasattr(self._backend, 'cache') else None,
+            'preprocessing': self._preprocessor.get_stats() if self._preprocessor else None
+        })
+
+def main():
+    """Punctul de intrare în linia de comandă"""
+    parser = argparse.ArgumentParser(description="Server local pentru mai multe sesiuni de exerciții")
+    parser.add_argument('--host', default=AppConfig.SERVER_HOST, help="Adresa de ascultare")
+    parser.add_argument('--port', type=int, default=AppConfig.SERVER_PORT, help="Portul")
+    parser.add_argument('--max-sessions', type=int, default=AppConfig.SERVER_MAX_SESSIONS)
+    parser.add_argument('--max-recognitions', type=int, default=AppConfig.SERVER_MAX_RECOGNITIONS,
+                        help="Recunoașteri audio simultane")
+    args = parser.parse_args()
+    
+    server = SessionServer(max_sessions=args.max_sessions, max_recognitions=args.max_recognitions)
+    web.run_app(server.create_app(), host=args.host, port=args.port)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,303 @@
+# session_journal.py
+"""
+Jurnal append-only al sesiunii, cu scriere pe disc în grup și reluare după oprire
+"""
+import collections
+import copy
+import json
+import os
+import threading
+import time
+from typing import Deque, Optional
+from config import AppConfig
+from models import GameState
+from word_deck import SequentialDeck, WordDeck, deck_from_dict
+
+# Jurnalul stă lângă cod: pornită din alt director, aplicația reia aceeași sesiune
+_MODULE_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_JOURNAL_FILE = os.path.join(_MODULE_DIR, AppConfig.JOURNAL_FILE)
+DEFAULT_SNAPSHOT_FILE = os.path.join(_MODULE_DIR, AppConfig.JOURNAL_SNAPSHOT_FILE)
+
+def apply_record(state: GameState, record: dict) -> None:
+    """
+    Aplică o înregistrare din jurnal asupra stării jocului
+    
+    Câmpurile sunt citite înainte de orice modificare, deci o înregistrare
+    incompletă ridică KeyError fără să lase starea pe jumătate actualizată.
+    """
+    kind = record.get('type')
+    if kind == 'deck':
+        category, deck = record['category'], deck_from_dict(record['deck'])
+        state.current_category = category
+        state.deck = deck
+        state.current_word = ""
+        state.reset_score()
+    elif kind == 'next':
+        word = record['word']
+        # Pachetul este determinist: reluarea dă același cuvânt ca la înregistrare
+        state.deck.next_word()
+        state.current_word = word
+    elif kind == 'attempt':
+        target, correct = record['target'], record['correct']
+        state.add_attempt(correct=correct)
+        state.deck.record_result(target, correct)
+    elif kind == 'confusion':
+        state.add_confusion(record['target'], record['heard'])
+    elif kind == 'complete':
+        state.current_word = ""
+
+def _state_to_dict(state: GameState) -> dict:
+    return {
+        'current_category': state.current_category,
+        'current_word': state.current_word,
+        'deck': state.deck.to_dict(),
+        'score': state.score,
+        'total_attempts': state.total_attempts,
+        'confusions': [[target, heard, count] for (target, heard), count in state.confusions.items()]
+    }
+
+def _state_from_dict(data: dict) -> GameState:
+    return GameState(
+        current_category=data['current_category'],
+        current_word=data['current_word'],
+        deck=deck_from_dict(data['deck']) if 'deck' in data else SequentialDeck(data['remaining_words']),
+        score=data['score'],
+        total_attempts=data['total_attempts'],
+        confusions={(target, heard): count for target, heard, count in data['confusions']}
+    )
+
+class SessionJournal:
+    """
+    Înregistrează fiecare încercare și fiecare schimbare a pachetului de cuvinte
+    
+    append() doar pune înregistrarea în coadă; un fir separat scrie tot ce s-a
+    adunat și face un singur fsync pentru întregul grup. Din când în când
+    starea completă este scrisă ca instantaneu și jurnalul este golit, deci la
+    pornire se citesc doar instantaneul și cel mult snapshot_every înregistrări.
+    """
+    
+    def __init__(self, path: str = DEFAULT_JOURNAL_FILE,
+                 snapshot_path: str = DEFAULT_SNAPSHOT_FILE,
+                 flush_ms: int = AppConfig.JOURNAL_FLUSH_MS,
+                 snapshot_every: int = AppConfig.JOURNAL_SNAPSHOT_EVERY):
+        self.path = path
+        self.snapshot_path = snapshot_path
+        self.flush_ms = flush_ms
+        self.snapshot_every = snapshot_every
+        
+        self._pending: Deque[dict] = collections.deque()
+        self._condition = threading.Condition()
+        self._closing = False
+        self._sequence = 0
+        self._applied = 0
+        self._state = GameState()
+        self._since_snapshot = 0
+        self._commits = 0
+        self._written = 0
+        self._failures = 0
+        # Lungimea jurnalului după ultimul grup scris complet
+        self._durable_bytes = 0
+        
+        self._recover()
+        self._file = open(self.path, 'a', encoding='utf-8')
+        self._durable_bytes = os.path.getsize(self.path)
+        self._thread = threading.Thread(target=self._run, name="session-journal", daemon=True)
+        self._thread.start()
+    
+    def _recover(self) -> None:
+        """Reconstruiește starea din instantaneu și din coada jurnalului"""
+        snapshot_sequence = 0
+        try:
+            with open(self.snapshot_path, 'r', encoding='utf-8') as f:
+                snapshot = json.load(f)
+            self._state = _state_from_dict(snapshot['state'])
+            snapshot_sequence = snapshot['sequence']
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+        self._sequence = self._applied = snapshot_sequence
+        
+        valid_bytes = 0
+        try:
+            with open(self.path, 'rb') as f:
+                for line in f:
+                    if not line.endswith(b"\n"):
+                        break
+                    try:
+                        record = json.loads(line)
+                        sequence = int(record['seq'])
+                        if sequence > snapshot_sequence:
+                            apply_record(self._state, record)
+                    except (ValueError, KeyError, TypeError, AttributeError):
+                        # O înregistrare cu altă formă (schemă veche, câmpuri lipsă)
+                        # oprește reluarea ca o linie ruptă, fără să blocheze pornirea
+                        break
+                    valid_bytes += len(line)
+                    if sequence > snapshot_sequence:
+                        self._sequence = self._applied = sequence
+                        self._since_snapshot += 1
+            # O linie scrisă pe jumătate la oprire, și tot ce urmează după ea, este eliminată
+            if valid_bytes != os.path.getsize(self.path):
+                with open(self.path, 'r+b') as f:
+                    f.truncate(valid_bytes)
+        except OSError:
+            pass
+    
+    def restore(self) -> Optional[GameState]:
+        """Starea sesiunii întrerupte, dacă a rămas un cuvânt în lucru"""
+        with self._condition:
+            if not self._state.current_word:
+                return None
+            return copy.deepcopy(self._state)
+    
+    def append(self, kind: str, **fields) -> None:
+        """Adaugă o înregistrare în coadă (nu așteaptă scrierea pe disc)"""
+        with self._condition:
+            if self._closing:
+                return
+            self._sequence += 1
+            fields.update(type=kind, seq=self._sequence, time=time.time())
+            self._pending.append(fields)
+            self._condition.notify()
+    
+    def record_deck(self, category: str, deck: WordDeck) -> None:
+        """Categorie nouă sau repornită, cu starea inițială a pachetului"""
+        self.append('deck', category=category, deck=deck.to_dict())
+    
+    def record_next(self, word: str) -> None:
+        """Trecerea la cuvântul următor"""
+        self.append('next', word=word)
+    
+    def record_attempt(self, target: str, transcript: Optional[str], similarity: float,
+                       correct: bool, started: float, finished: float,
+                       rank: Optional[int] = None) -> None:
+        """O încercare de pronunție (transcript None pentru cuvinte sărite; rank = ipoteza acceptată)"""
+        self.append('attempt', target=target, transcript=transcript, similarity=similarity,
+                    correct=correct, started=started, finished=finished, rank=rank)
+    
+    def record_confusion(self, target: str, heard: str) -> None:
+        """Cuvântul din vocabular auzit în locul celui țintă"""
+        self.append('confusion', target=target, heard=heard)
+    
+    def record_complete(self, category: str) -> None:
+        """Finalizarea categoriei"""
+        self.append('complete', category=category)
+    
+    def close(self) -> None:
+        """Scrie ce a rămas în coadă, salvează instantaneul și oprește firul"""
+        with self._condition:
+            if self._closing:
+                return
+            self._closing = True
+            self._condition.notify()
+        self._thread.join()
+        self._write_snapshot()
+        self._file.close()
+    
+    def get_stats(self) -> dict:
+        """Numărul de înregistrări scrise și de grupuri sincronizate pe disc"""
+        with self._condition:
+            return {
+                'written': self._written,
+                'commits': self._commits,
+                'failures': self._failures,
+                'pending': len(self._pending),
+                'sequence': self._sequence
+            }
+    
+    def _run(self) -> None:
+        """Scrie înregistrările în grupuri, cu câte un singur fsync"""
+        while True:
+            with self._condition:
+                while not self._pending and not self._closing:
+                    self._condition.wait()
+                # Lasă timp să se adune mai multe înregistrări în același grup
+                deadline = time.monotonic() + self.flush_ms / 1000
+                while not self._closing:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._condition.wait(remaining)
+                batch = list(self._pending)
+                self._pending.clear()
+                closing = self._closing
+            
+            if batch and not self._commit(batch):
+                if closing:
+                    print(f"Jurnal sesiune: {len(batch)} înregistrări nu au putut fi scrise")
+                    return
+                # Grupul rămâne primul în coadă și este reîncercat la următoarea scriere
+                with self._condition:
+                    self._pending.extendleft(reversed(batch))
+            if closing:
+                return
+    
+    def _commit(self, batch: list) -> bool:
+        """
+        Scrie un grup de înregistrări și îl sincronizează pe disc
+        
+        Returns:
+            False dacă scrierea a eșuat; jurnalul este adus înapoi la ultimul
+            grup complet, iar starea și contoarele rămân neschimbate
+        """
+        data = "".join(json.dumps(record, ensure_ascii=False) + "\n" for record in batch)
+        try:
+            self._file.write(data)
+            self._file.flush()
+            os.fsync(self._file.fileno())
+        except (OSError, ValueError) as e:
+            # ValueError: fișierul a rămas închis după o refacere eșuată
+            print(f"Eroare scriere jurnal sesiune: {e}")
+            self._rollback()
+            with self._condition:
+                self._failures += 1
+            return False
+        self._durable_bytes = self._file.tell()
+        
+        with self._condition:
+            for record in batch:
+                apply_record(self._state, record)
+                self._applied = record['seq']
+            self._written += len(batch)
+            self._commits += 1
+            self._since_snapshot += len(batch)
+        
+        if self._since_snapshot >= self.snapshot_every:
+            self._write_snapshot()
+        return True
+    
+    def _rollback(self) -> None:
+        """
+        Elimină o scriere parțială și redeschide jurnalul
+        
+        O linie ruptă ar opri reluarea la pornire și ar șterge tot ce a fost
+        scris după ea.
+        """
+        try:
+            self._file.close()
+        except OSError:
+            pass
+        try:
+            os.truncate(self.path, self._durable_bytes)
+            self._file = open(self.path, 'a', encoding='utf-8')
+        except OSError as e:
+            print(f"Eroare refacere jurnal sesiune: {e}")
+    
+    def _write_snapshot(self) -> None:
+        """Salvează starea completă și golește jurnalul"""
+        with self._condition:
+            snapshot = {'sequence': self._applied, 'state': _state_to_dict(self._state)}
+        temporary = f"{self.snapshot_path}.tmp"
+        try:
+            with open(temporary, 'w', encoding='utf-8') as f:
+                json.dump(snapshot, f, ensure_ascii=False)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temporary, self.snapshot_path)
+            # Înregistrările rămase în jurnal au seq <= instantaneu și ar fi ignorate oricum
+            self._file.truncate(0)
+            self._file.seek(0)
+            self._durable_bytes = 0
+        except OSError as e:
+            print(f"Eroare salvare instantaneu sesiune: {e}")
+            return
+        self._since_snapshot = 0
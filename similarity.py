@@ -0,0 +1,260 @@
+# similarity.py
+"""
+Motoare de similaritate pentru compararea cuvintelor
+"""
+from abc import ABC, abstractmethod
+from difflib import SequenceMatcher
+from typing import Dict, Iterable, List, Sequence, Tuple, Type
+from phonetics import Phonemes, phoneme_similarity, to_phonemes
+
+class SimilarityEngine(ABC):
+    """Interfață abstractă pentru motoarele de similaritate"""
+    
+    name = ""
+    # Dacă verificatorul trebuie să compare și variațiile scrise ale cuvântului
+    uses_variations = True
+    
+    def prepare(self, word: str) -> None:
+        """Pregătește un cuvânt țintă (apelat la încărcarea categoriei)"""
+        pass
+    
+    @abstractmethod
+    def similarity(self, a: str, b: str, min_score: float = 0.0) -> float:
+        """
+        Calculează similaritatea dintre două texte
+        
+        Args:
+            a: Primul text
+            b: Al doilea text
+            min_score: Scorul minim care interesează; motorul poate returna
+                0.0 de îndată ce știe că scorul nu îl mai poate atinge
+            
+        Returns:
+            Scor între 0.0 și 1.0
+        """
+        pass
+    
+    def similarity_many(self, a: str, texts: Sequence[str], min_score: float = 0.0) -> List[float]:
+        """Similaritatea lui `a` cu fiecare text, în ordine (un singur apel pentru un lot)"""
+        return [self.similarity(a, b, min_score) for b in texts]
+
+class SequenceMatcherEngine(SimilarityEngine):
+    """Similaritate calculată cu difflib.SequenceMatcher (comportamentul inițial)"""
+    
+    name = "sequence_matcher"
+    
+    def similarity(self, a: str, b: str, min_score: float = 0.0) -> float:
+        """Returnează SequenceMatcher.ratio(), fără oprire timpurie"""
+        return SequenceMatcher(None, a, b).ratio()
+
+class LevenshteinEngine(SimilarityEngine):
+    """Similaritate bazată pe distanța Levenshtein, calculată pe o bandă limitată"""
+    
+    name = "levenshtein"
+    
+    def similarity(self, a: str, b: str, min_score: float = 0.0) -> float:
+        """Returnează 1 - distanță / lungime_maximă, sau 0.0 dacă pragul nu poate fi atins"""
+        longest = max(len(a), len(b))
+        if longest == 0:
+            return 1.0
+        
+        max_distance = int((1.0 - min_score) * longest + 1e-9) if min_score > 0 else longest
+        distance = bounded_distance(a, b, max_distance)
+        if distance > max_distance:
+            return 0.0
+        return 1.0 - distance / longest
+    
+    def similarity_many(self, a: str, texts: Sequence[str], min_score: float = 0.0) -> List[float]:
+        """Compilează `a` o singură dată și îl compară pe biți cu fiecare text"""
+        masks = pattern_masks(a)
+        scores = []
+        for b in texts:
+            longest = max(len(a), len(b))
+            if longest == 0:
+                scores.append(1.0)
+                continue
+            
+            max_distance = int((1.0 - min_score) * longest + 1e-9) if min_score > 0 else longest
+            if abs(len(a) - len(b)) > max_distance:
+                scores.append(0.0)
+                continue
+            distance = bit_parallel_distance(masks, len(a), b)
+            scores.append(0.0 if distance > max_distance else 1.0 - distance / longest)
+        return scores
+
+class PhoneticEngine(SimilarityEngine):
+    """
+    Similaritate după pronunție: distanța de editare ponderată între foneme
+    
+    Diacriticele omise, perechile surdă-sonoră și vocalele apropiate costă mai
+    puțin decât o literă greșită, deci variațiile scrise nu mai sunt necesare.
+    Fonemele cuvintelor țintă sunt calculate o dată, în prepare().
+    """
+    
+    name = "phonetic"
+    uses_variations = False
+    
+    def __init__(self):
+        self._prepared: Dict[str, Phonemes] = {}
+    
+    def prepare(self, word: str) -> None:
+        if word not in self._prepared:
+            self._prepared[word] = to_phonemes(word)
+    
+    def phonemes(self, word: str) -> Phonemes:
+        """Fonemele unui cuvânt pregătit sau, altfel, din cache-ul transcrierilor"""
+        phonemes = self._prepared.get(word)
+        return phonemes if phonemes is not None else to_phonemes(word)
+    
+    def similarity(self, a: str, b: str, min_score: float = 0.0) -> float:
+        return self.similarity_many(a, [b], min_score)[0]
+    
+    def similarity_many(self, a: str, texts: Sequence[str], min_score: float = 0.0) -> List[float]:
+        """Pentru transcrierile din mai multe cuvinte contează și cel mai apropiat cuvânt"""
+        target = self.phonemes(a)
+        scores = []
+        for b in texts:
+            score = phoneme_similarity(target, to_phonemes(b), min_score)
+            words = b.split()
+            if len(words) > 1:
+                score = max([score] + [phoneme_similarity(target, to_phonemes(word), min_score) for word in words])
+            scores.append(score)
+        return scores
+
+def bounded_distance(a: str, b: str, max_distance: int) -> int:
+    """
+    Distanța Levenshtein limitată la max_distance
+    
+    Calculează doar diagonalele aflate la cel mult max_distance de diagonala
+    principală și se oprește când niciun rând nu mai poate coborî sub limită.
+    
+    Returns:
+        Distanța exactă dacă este <= max_distance, altfel max_distance + 1
+    """
+    if len(a) > len(b):
+        a, b = b, a
+    len_a, len_b = len(a), len(b)
+    over = max_distance + 1
+    
+    if len_b - len_a > max_distance:
+        return over
+    if len_a == 0:
+        return len_b
+    
+    previous = [j if j <= max_distance else over for j in range(len_b + 1)]
+    for i in range(1, len_a + 1):
+        low = max(1, i - max_distance)
+        high = min(len_b, i + max_distance)
+        current = [over] * (len_b + 1)
+        if low == 1:
+            current[0] = i if i <= max_distance else over
+        row_min = current[low - 1]
+        char_a = a[i - 1]
+        
+        for j in range(low, high + 1):
+            cost = 0 if char_a == b[j - 1] else 1
+            value = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+            current[j] = value
+            if value < row_min:
+                row_min = value
+        
+        if row_min > max_distance:
+            return over
+        previous = current
+    
+    distance = previous[len_b]
+    return distance if distance <= max_distance else over
+
+def pattern_masks(pattern: str) -> Dict[str, int]:
+    """Măștile de biți ale caracterelor din tipar, pentru bit_parallel_distance"""
+    masks: Dict[str, int] = {}
+    for i, char in enumerate(pattern):
+        masks[char] = masks.get(char, 0) | (1 << i)
+    return masks
+
+def bit_parallel_distance(masks: Dict[str, int], pattern_length: int, text: str) -> int:
+    """
+    Distanța Levenshtein exactă calculată pe biți (algoritmul lui Myers)
+    
+    Tiparul este precompilat o singură dată cu pattern_masks(), apoi poate fi
+    comparat rapid cu multe texte, câte o iterație pe caracter.
+    """
+    if pattern_length == 0:
+        return len(text)
+    
+    full = (1 << pattern_length) - 1
+    last = 1 << (pattern_length - 1)
+    positive, negative = full, 0
+    distance = pattern_length
+    
+    for char in text:
+        equal = masks.get(char, 0)
+        vertical = equal | negative
+        horizontal = (((equal & positive) + positive) ^ positive) | equal
+        horizontal_positive = negative | (~(horizontal | positive) & full)
+        horizontal_negative = positive & horizontal
+        
+        if horizontal_positive & last:
+            distance += 1
+        elif horizontal_negative & last:
+            distance -= 1
+        
+        horizontal_positive = ((horizontal_positive << 1) | 1) & full
+        horizontal_negative = (horizontal_negative << 1) & full
+        positive = horizontal_negative | (~(vertical | horizontal_positive) & full)
+        negative = horizontal_positive & vertical
+    return distance
+
+ENGINES: Dict[str, Type[SimilarityEngine]] = {
+    SequenceMatcherEngine.name: SequenceMatcherEngine,
+    LevenshteinEngine.name: LevenshteinEngine,
+    PhoneticEngine.name: PhoneticEngine,
+}
+
+def create_engine(name: str) -> SimilarityEngine:
+    """Creează un motor de similaritate după nume"""
+    try:
+        return ENGINES[name]()
+    except KeyError:
+        raise ValueError(f"Motor de similaritate necunoscut: {name}") from None
+
+def compare_engines(pairs: Iterable[Tuple[str, str]], threshold: float,
+                    reference: str = SequenceMatcherEngine.name,
+                    candidate: str = LevenshteinEngine.name) -> List[dict]:
+    """
+    Compară două motoare pe aceleași perechi și returnează diferențele de decizie
+    
+    Returns:
+        Lista perechilor pentru care motoarele iau decizii diferite față de prag
+    """
+    reference_engine = create_engine(reference)
+    candidate_engine = create_engine(candidate)
+    differences = []
+    
+    for a, b in pairs:
+        reference_score = reference_engine.similarity(a, b)
+        candidate_score = candidate_engine.similarity(a, b)
+        if (reference_score >= threshold) != (candidate_score >= threshold):
+            differences.append({
+                'a': a,
+                'b': b,
+                reference: round(reference_score, 3),
+                candidate: round(candidate_score, 3)
+            })
+    return differences
+
+if __name__ == "__main__":
+    from config import AppConfig
+    from word_manager import WordCategoryManager
+    
+    manager = WordCategoryManager()
+    words = sorted({
+        word for name in manager.get_category_names()
+        for word in manager.get_category(name).words
+    })
+    pairs = [(a, b) for a in words for b in words if a != b]
+    differences = compare_engines(pairs, AppConfig.SIMILARITY_THRESHOLD)
+    
+    print(f"Perechi comparate: {len(pairs)}, decizii diferite: {len(differences)}")
+    for diff in differences:
+        print(diff)
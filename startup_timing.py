@@ -0,0 +1,48 @@
+# startup_timing.py
+"""
+Măsurarea duratei etapelor de pornire a aplicației
+"""
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Iterator
+
+class StartupTimings:
+    """Colectează durata fiecărei etape de pornire (importuri, TTS, microfon, UI)"""
+    
+    def __init__(self):
+        self._started = time.perf_counter()
+        self._phases: "OrderedDict[str, float]" = OrderedDict()
+        self._lock = threading.Lock()
+    
+    @contextmanager
+    def measure(self, phase: str) -> Iterator[None]:
+        """Măsoară durata unui bloc de cod"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(phase, time.perf_counter() - start)
+    
+    def record(self, phase: str, seconds: float) -> None:
+        """Înregistrează (sau adaugă la) durata unei etape"""
+        with self._lock:
+            self._phases[phase] = self._phases.get(phase, 0.0) + seconds
+    
+    def get_report(self) -> dict:
+        """Duratele etapelor în milisecunde"""
+        with self._lock:
+            report = {phase: seconds * 1000 for phase, seconds in self._phases.items()}
+        report['since_start'] = (time.perf_counter() - self._started) * 1000
+        return report
+    
+    def format_report(self) -> str:
+        """Raportul de pornire ca text"""
+        lines = ["Timpi de pornire:"]
+        for phase, milliseconds in self.get_report().items():
+            lines.append(f"  {phase:<20} {milliseconds:8.1f} ms")
+        return "\n".join(lines)
+
+# Instanța folosită de toate modulele în timpul pornirii
+startup_timings = StartupTimings()
@@ -0,0 +1,101 @@
+# test_similarity.py
+"""
+Paritatea motorului Levenshtein cu SequenceMatcher și scorurile înregistrate
+"""
+import unittest
+from config import AppConfig
+from pronunciation_checker import PronunciationChecker
+from similarity import LevenshteinEngine, SequenceMatcherEngine, compare_engines
+from vocabulary_store import VocabularyStore
+from word_manager import WordCategoryManager
+
+THRESHOLD = AppConfig.SIMILARITY_THRESHOLD
+# Cât de departe de prag poate fi un scor când motoarele decid diferit
+PARITY_MARGIN = 0.2
+_PLAIN = str.maketrans("ăâîșț", "aaist")
+
+def reference_distance(a: str, b: str) -> int:
+    """Distanța Levenshtein calculată pe tabelul complet"""
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, 1):
+        current = [i]
+        for j, char_b in enumerate(b, 1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (char_a != char_b)))
+        previous = current
+    return previous[-1]
+
+def vocabulary_pairs():
+    """Perechile dintre cuvintele implicite, plus greșeli tipice de transcriere"""
+    manager = WordCategoryManager(VocabularyStore(":memory:"))
+    words = sorted({
+        word for name in manager.get_category_names()
+        for word in manager.get_category(name).words
+    })
+    pairs = [(a, b) for a in words for b in words if a != b]
+    for word in words:
+        pairs += [(word, word.translate(_PLAIN)), (word, word[:-1]), (word, word + "a")]
+    return pairs
+
+class LevenshteinParityTest(unittest.TestCase):
+    
+    @classmethod
+    def setUpClass(cls):
+        cls.pairs = vocabulary_pairs()
+    
+    def test_score_is_exact_distance(self):
+        engine = LevenshteinEngine()
+        for a, b in self.pairs[::7]:
+            expected = 1.0 - reference_distance(a, b) / max(len(a), len(b))
+            self.assertAlmostEqual(engine.similarity(a, b), expected, msg=(a, b))
+            self.assertAlmostEqual(engine.similarity_many(a, [b])[0], expected, msg=(a, b))
+    
+    def test_cutoff_never_changes_decision(self):
+        engine = LevenshteinEngine()
+        for a, b in self.pairs[::7]:
+            exact = engine.similarity(a, b)
+            for score in (engine.similarity(a, b, THRESHOLD), engine.similarity_many(a, [b], THRESHOLD)[0]):
+                self.assertEqual(score >= THRESHOLD, exact >= THRESHOLD, msg=(a, b))
+    
+    def test_decisions_match_sequence_matcher_away_from_threshold(self):
+        differences = compare_engines(self.pairs, THRESHOLD)
+        self.assertLess(len(differences), len(self.pairs) * 0.01)
+        for diff in differences:
+            for name in (SequenceMatcherEngine.name, LevenshteinEngine.name):
+                self.assertLessEqual(abs(diff[name] - THRESHOLD), PARITY_MARGIN, msg=diff)
+    
+    def test_checker_decisions_match(self):
+        reference = PronunciationChecker(engine=SequenceMatcherEngine.name)
+        candidate = PronunciationChecker(engine=LevenshteinEngine.name)
+        expected = reference.check_many(self.pairs)
+        actual = candidate.check_many(self.pairs)
+        disagreements = [
+            (pair, old[1], new[1]) for pair, old, new in zip(self.pairs, expected, actual)
+            if old[0] != new[0]
+        ]
+        self.assertLess(len(disagreements), len(self.pairs) * 0.01)
+        for pair, old, new in disagreements:
+            self.assertLessEqual(abs(old - THRESHOLD), PARITY_MARGIN, msg=pair)
+            self.assertLessEqual(abs(new - THRESHOLD), PARITY_MARGIN, msg=pair)
+
+class RecordedScoreTest(unittest.TestCase):
+    
+    def test_rejected_attempt_keeps_exact_score(self):
+        checker = PronunciationChecker(engine=LevenshteinEngine.name)
+        is_correct, similarity = checker.check_pronunciation("pisică", "pisa")
+        compiled = checker.compile_word("pisică")
+        expected = max(
+            1.0 - reference_distance(form, "pisa") / max(len(form), 4)
+            for form in (compiled.normalized,) + compiled.variations
+        )
+        self.assertFalse(is_correct)
+        self.assertGreater(similarity, 0.0)
+        self.assertAlmostEqual(similarity, expected)
+    
+    def test_hypotheses_report_exact_score(self):
+        checker = PronunciationChecker(engine=LevenshteinEngine.name)
+        is_correct, similarity, _ = checker.check_hypotheses("cățel", ["mașină", "câte"])
+        self.assertFalse(is_correct)
+        self.assertGreater(similarity, 0.0)
+
+if __name__ == "__main__":
+    unittest.main()
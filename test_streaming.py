@@ -0,0 +1,62 @@
+# test_streaming.py
+"""
+Acceptarea timpurie pe rezultate parțiale, cu serviciul audio local
+"""
+import unittest
+from unittest import mock
+from config import AppConfig
+from fake_audio import FakeAudioService
+from game_controller import GameController
+from models import Hypothesis
+from scheduler import CommandScheduler, ManualClock
+from vocabulary_store import VocabularyStore
+from word_manager import WordCategoryManager
+
+CATEGORY = "test"
+WORD = "pisică"
+
+class StreamingAcceptTest(unittest.TestCase):
+    
+    def setUp(self):
+        patcher = mock.patch.object(AppConfig, 'STREAMING_RECOGNITION', True)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.word_manager = WordCategoryManager(VocabularyStore(":memory:", seed_file=None))
+        self.word_manager.add_category(CATEGORY, [WORD])
+    
+    def run_attempt(self, partials):
+        """Pornește categoria și rulează o încercare cu rezultatele parțiale date"""
+        audio = FakeAudioService(partials=[partials])
+        scheduler = CommandScheduler(ManualClock(), max_workers=0, threaded=False)
+        controller = GameController(audio_service=audio, scheduler=scheduler,
+                                    word_manager=self.word_manager)
+        self.addCleanup(controller.shutdown)
+        controller.start_new_category(CATEGORY)
+        scheduler.run_pending()
+        self.assertEqual(controller.state.current_word, WORD)
+        
+        controller.start_listening()
+        scheduler.run_pending()
+        return controller, audio
+    
+    def test_accepts_exact_partial_early(self):
+        controller, audio = self.run_attempt(["p", "pi", "pisi", WORD, f"{WORD} mică"])
+        self.assertEqual(audio.early_accepts, 1)
+        self.assertEqual(controller.state.score, 1)
+        self.assertEqual(controller.state.total_attempts, 1)
+        self.assertEqual(controller.last_match_rank, 0)
+    
+    def test_prefix_is_not_accepted(self):
+        controller, audio = self.run_attempt(["pi", "pis", "masă"])
+        self.assertEqual(audio.early_accepts, 0)
+        self.assertEqual(controller.state.score, 0)
+        self.assertEqual(controller.state.total_attempts, 1)
+    
+    def test_accept_partial_rejects_prefix(self):
+        controller, _ = self.run_attempt([WORD])
+        self.assertFalse(controller._accept_partial(WORD, [Hypothesis("pis")]))
+        self.assertFalse(controller._accept_partial(WORD, [Hypothesis("pisi")]))
+        self.assertTrue(controller._accept_partial(WORD, [Hypothesis(WORD)]))
+
+if __name__ == "__main__":
+    unittest.main()
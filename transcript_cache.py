@@ -0,0 +1,119 @@
+# transcript_cache.py
+"""
+Cache pentru rezultatele recunoașterii, indexat după amprenta audio-ului
+"""
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from typing import Optional
+from audio_preprocessing import resample, to_float, to_pcm16
+from config import AppConfig
+
+# Transcrierea salvată pentru audio în care nu s-a înțeles nimic
+UNRECOGNIZED = ""
+# Directorul stă lângă cod, deci nu depinde de directorul curent
+DEFAULT_CACHE_DIR = (
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), AppConfig.TRANSCRIPT_CACHE_DIR)
+    if AppConfig.TRANSCRIPT_CACHE_DIR else None
+)
+
+class TranscriptCache:
+    """
+    Transcrieri deja obținute, cu un nivel în memorie (LRU) și unul opțional pe disc
+    
+    Cheia este un hash BLAKE2 al PCM-ului normalizat (16 kHz, 16 biți), plus
+    limba și motorul de recunoaștere, deci aceeași înregistrare are aceeași
+    cheie indiferent de rata la care a fost capturată sau salvată.
+    """
+    
+    SAMPLE_RATE = 16000
+    
+    def __init__(self, memory_items: int = AppConfig.TRANSCRIPT_CACHE_SIZE,
+                 directory: Optional[str] = DEFAULT_CACHE_DIR):
+        self.memory_items = memory_items
+        self.directory = directory
+        self._memory: "OrderedDict[str, str]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._memory_hits = 0
+        self._disk_hits = 0
+        self._misses = 0
+        self._stores = 0
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+    
+    @classmethod
+    def make_key(cls, pcm: bytes, sample_rate: int, sample_width: int,
+                 language: str, backend: str) -> str:
+        """Amprenta audio-ului pentru limba și motorul date"""
+        if sample_width != 2 or sample_rate != cls.SAMPLE_RATE:
+            pcm = to_pcm16(resample(to_float(pcm, sample_width), sample_rate, cls.SAMPLE_RATE))
+        
+        digest = hashlib.blake2b(pcm, digest_size=16)
+        digest.update(f"\x00{language}\x00{backend}".encode('utf-8'))
+        return digest.hexdigest()
+    
+    def _path_for(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.txt")
+    
+    def get(self, key: str) -> Optional[str]:
+        """Transcrierea salvată pentru cheie, ori None dacă lipsește"""
+        with self._lock:
+            text = self._memory.get(key)
+            if text is not None:
+                self._memory.move_to_end(key)
+                self._memory_hits += 1
+                return text
+        
+        if self.directory:
+            try:
+                with open(self._path_for(key), 'r', encoding='utf-8') as f:
+                    text = f.read()
+            except OSError:
+                text = None
+            if text is not None:
+                self._remember(key, text)
+                with self._lock:
+                    self._disk_hits += 1
+                return text
+        
+        with self._lock:
+            self._misses += 1
+        return None
+    
+    def put(self, key: str, text: str) -> None:
+        """Salvează transcrierea în memorie și, dacă există, pe disc"""
+        self._remember(key, text)
+        with self._lock:
+            self._stores += 1
+        if not self.directory:
+            return
+        
+        path = self._path_for(key)
+        temporary = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            with open(temporary, 'w', encoding='utf-8') as f:
+                f.write(text)
+            os.replace(temporary, path)
+        except OSError as e:
+            print(f"Eroare salvare transcriere în cache: {e}")
+    
+    def _remember(self, key: str, text: str) -> None:
+        with self._lock:
+            self._memory[key] = text
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.memory_items:
+                self._memory.popitem(last=False)
+    
+    def get_stats(self) -> dict:
+        """Returnează statistici despre cache"""
+        with self._lock:
+            lookups = self._memory_hits + self._disk_hits + self._misses
+            return {
+                'memory_hits': self._memory_hits,
+                'disk_hits': self._disk_hits,
+                'misses': self._misses,
+                'stores': self._stores,
+                'hit_rate': (self._memory_hits + self._disk_hits) / lookups if lookups else 0.0,
+                'memory_items': len(self._memory)
+            }
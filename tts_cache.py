@@ -0,0 +1,187 @@
+# tts_cache.py
+"""
+Cache pe disc pentru audio-ul TTS pre-generat
+"""
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Optional, Tuple
+from config import AppConfig
+
+# Directorul stă lângă cod, deci nu depinde de directorul curent
+DEFAULT_TTS_CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), AppConfig.TTS_CACHE_DIR)
+
+class TTSCache:
+    """
+    Cache de fișiere WAV generate de TTS, indexat după (text, voce, viteză)
+    
+    Fișierele sunt păstrate pe disc cu evacuare LRU după dimensiunea totală;
+    cuvintele care urmează pot fi aduse în avans într-un cache mic în memorie.
+    """
+    
+    def __init__(self, directory: str = DEFAULT_TTS_CACHE_DIR,
+                 max_bytes: int = AppConfig.TTS_CACHE_MAX_BYTES,
+                 memory_items: int = AppConfig.TTS_MEMORY_CACHE_SIZE):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.memory_items = memory_items
+        self._memory: "OrderedDict[str, bytes]" = OrderedDict()
+        self._lock = threading.Lock()
+        # Dimensiunea fiecărui fișier, ca o regenerare să nu fie numărată de două ori;
+        # serverul generează audio pe mai multe fire, deci contabilizarea are lacătul ei
+        self._disk_lock = threading.Lock()
+        os.makedirs(self.directory, exist_ok=True)
+        self._sizes: Dict[str, int] = {}
+        self._disk_bytes = 0
+        self._load_sizes(self._disk_entries())
+    
+    @staticmethod
+    def make_key(text: str, voice: str, rate: int) -> str:
+        """Cheia de cache pentru un text rostit cu o anumită voce și viteză"""
+        raw = f"{voice}\x00{rate}\x00{text}".encode('utf-8')
+        return hashlib.sha1(raw).hexdigest()
+    
+    def path_for(self, key: str) -> str:
+        """Calea fișierului WAV pentru o cheie"""
+        return os.path.join(self.directory, f"{key}.wav")
+    
+    def contains(self, key: str) -> bool:
+        """Verifică dacă audio-ul pentru cheie există deja"""
+        return key in self._memory or os.path.exists(self.path_for(key))
+    
+    def get(self, key: str) -> Optional[bytes]:
+        """Returnează audio-ul din memorie sau de pe disc, ori None"""
+        with self._lock:
+            data = self._memory.get(key)
+            if data is not None:
+                self._memory.move_to_end(key)
+                return data
+        
+        path = self.path_for(key)
+        try:
+            with open(path, 'rb') as f:
+                data = f.read()
+            os.utime(path)
+        except OSError:
+            return None
+        
+        self._remember(key, data)
+        return data
+    
+    def register(self, key: str) -> None:
+        """Înregistrează fișierul nou scris la path_for(key) și aplică limita de dimensiune"""
+        try:
+            size = os.path.getsize(self.path_for(key))
+        except OSError:
+            return
+        with self._disk_lock:
+            self._disk_bytes += size - self._sizes.get(key, 0)
+            self._sizes[key] = size
+            if self._disk_bytes > self.max_bytes:
+                self._evict()
+    
+    def prefetch(self, keys: Iterable[str]) -> None:
+        """Aduce în memorie audio-ul pentru cheile date"""
+        for key in keys:
+            if key not in self._memory:
+                self.get(key)
+    
+    def _remember(self, key: str, data: bytes) -> None:
+        """Adaugă audio în cache-ul din memorie"""
+        with self._lock:
+            self._memory[key] = data
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.memory_items:
+                self._memory.popitem(last=False)
+    
+    def _disk_entries(self) -> List[Tuple[float, int, str]]:
+        """Fișierele din cache ca (ultima folosire, dimensiune, cale)"""
+        entries = []
+        for name in os.listdir(self.directory):
+            if not name.endswith('.wav'):
+                continue
+            path = os.path.join(self.directory, name)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        return entries
+    
+    def _load_sizes(self, entries: List[Tuple[float, int, str]]) -> None:
+        """Reface dimensiunile din lista fișierelor de pe disc"""
+        self._sizes = {os.path.basename(path)[:-len('.wav')]: size for _, size, path in entries}
+        self._disk_bytes = sum(self._sizes.values())
+    
+    def _evict(self) -> None:
+        """
+        Șterge fișierele folosite cel mai demult până când cache-ul încape în max_bytes
+        
+        Apelată cu _disk_lock luat.
+        """
+        entries = sorted(self._disk_entries())
+        total = sum(size for _, size, _ in entries)
+        removed = set()
+        
+        for entry in entries:
+            if total <= self.max_bytes:
+                break
+            _, size, path = entry
+            try:
+                os.remove(path)
+                total -= size
+            except OSError:
+                continue
+            removed.add(entry)
+            with self._lock:
+                self._memory.pop(os.path.basename(path)[:-len('.wav')], None)
+        self._load_sizes([entry for entry in entries if entry not in removed])
+    
+    def get_stats(self) -> dict:
+        """Returnează statistici despre cache"""
+        return {
+            'files': len(self._disk_entries()),
+            'bytes': self._disk_bytes,
+            'memory_items': len(self._memory)
+        }
+
+def warm_up(words: Iterable[str]) -> List[str]:
+    """
+    Pre-generează audio-ul pentru toate cuvintele date
+    
+    Returns:
+        Lista cuvintelor care nu au putut fi generate
+    """
+    from audio_services import TTSService
+    
+    tts = TTSService()
+    failed = []
+    for word in words:
+        if not tts.render(word):
+            failed.append(word)
+    return failed
+
+def main():
+    """Comandă pentru pre-generarea vocabularului: python tts_cache.py [categorie ...]"""
+    import sys
+    from word_manager import WordCategoryManager
+    
+    manager = WordCategoryManager()
+    names = sys.argv[1:] or manager.get_category_names()
+    words = []
+    for name in names:
+        category = manager.get_category(name)
+        if not category:
+            print(f"Categorie necunoscută: {name}")
+            continue
+        words.extend(category.words)
+    
+    unique_words = list(dict.fromkeys(words))
+    failed = warm_up(unique_words)
+    print(f"Cuvinte pre-generate: {len(unique_words) - len(failed)}/{len(unique_words)}")
+    for word in failed:
+        print(f"  eșuat: {word}")
+
+if __name__ == "__main__":
+    main()
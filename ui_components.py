@@ -5,9 +5,8 @@ Componente pentru interfața utilizatorului
 import tkinter as tk
 from tkinter import ttk
 from typing import Callable, List, Optional
-from config import Colors, UIText
-import time
-import threading
+from config import AppConfig, Colors, UIText
+from animations import Animator, blink_steps, pulse_steps
 
 class WordDisplayComponent:
     """Componentă pentru afișarea cuvântului"""
@@ -23,33 +22,44 @@ class WordDisplayComponent:
             pady=40
         )
         self.label.pack()
+        self.animator = Animator(self.label)
     
     def set_word(self, word: str) -> None:
         """Setează cuvântul de afișat"""
+        self.animator.cancel()
         self.label.config(text=word)
         self.reset_appearance()
     
     def reset_appearance(self) -> None:
         """Resetează aspectul la normal"""
-        self.frame.config(bg=Colors.WHITE)
-        self.label.config(bg=Colors.WHITE, fg=Colors.TEXT_PRIMARY)
+        self._paint(Colors.WHITE, Colors.TEXT_PRIMARY)
     
     def show_success(self) -> None:
         """Afișează feedback de succes"""
-        self.frame.config(bg=Colors.SUCCESS_BG)
-        self.label.config(bg=Colors.SUCCESS_BG, fg=Colors.SUCCESS_FG)
+        success = lambda: self._paint(Colors.SUCCESS_BG, Colors.SUCCESS_FG)
+        steps = blink_steps(success, self.reset_appearance, 1, AppConfig.SUCCESS_FLASH_MS)
+        steps.append((AppConfig.SUCCESS_FLASH_MS, success))
+        self.animator.play(steps)
     
-    def blink_error(self, blink_count: int = 3, duration: float = 0.2) -> None:
+    def blink_error(self, blink_count: int = AppConfig.BLINK_COUNT,
+                    duration: float = AppConfig.BLINK_DURATION) -> None:
         """Afișează feedback de eroare cu blink"""
-        def blink():
-            for _ in range(blink_count):
-                self.frame.config(bg=Colors.ERROR_BG)
-                self.label.config(bg=Colors.ERROR_BG)
-                time.sleep(duration)
-                self.reset_appearance()
-                time.sleep(duration)
-        
-        threading.Thread(target=blink, daemon=True).start()
+        error = lambda: self._paint(Colors.ERROR_BG, Colors.TEXT_PRIMARY)
+        self.animator.play(blink_steps(error, self.reset_appearance, blink_count, int(duration * 1000)))
+    
+    def show_listening(self, is_listening: bool) -> None:
+        """Pulsează fundalul cât timp se ascultă"""
+        if is_listening:
+            listening = lambda: self._paint(Colors.LISTENING_BG, Colors.TEXT_PRIMARY)
+            self.animator.play(pulse_steps(listening, self.reset_appearance, AppConfig.LISTENING_PULSE_MS), loop=True)
+        elif self.animator.is_running and self.animator.loop:
+            self.animator.cancel()
+            self.reset_appearance()
+    
+    def _paint(self, bg: str, fg: str) -> None:
+        """Aplică culorile pe componentă"""
+        self.frame.config(bg=bg)
+        self.label.config(bg=bg, fg=fg)
     
     def pack(self, **kwargs) -> None:
         """Pack componenta"""
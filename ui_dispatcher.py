@@ -0,0 +1,121 @@
+# ui_dispatcher.py
+"""
+Dispecer pentru actualizările de UI venite de pe alte fire de execuție
+"""
+import itertools
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional, Tuple
+import tkinter as tk
+from config import AppConfig
+from latency_metrics import pipeline_metrics
+
+class UIDispatcher:
+    """
+    Aduce apelurile callback-urilor pe firul principal Tk
+    
+    Callback-urile controller-ului rulează pe alte fire, unde Tk nu poate fi
+    folosit. Dispecerul le pune într-o coadă golită periodic cu root.after().
+    Actualizările repetate ale aceluiași element din același cadru sunt
+    comasate: rămâne doar ultima, pe poziția ei din ordinea evenimentelor.
+    """
+    
+    def __init__(self, root: tk.Tk, frame_ms: int = AppConfig.UI_FRAME_MS):
+        self.root = root
+        self.frame_ms = frame_ms
+        self._pending: "OrderedDict[Hashable, Tuple[Callable, Tuple, Optional[float]]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._unique = itertools.count()
+        self._after_id: Optional[str] = None
+        self._running = False
+        
+        self._posted = 0
+        self._merged = 0
+        self._dropped = 0
+        self._executed = 0
+        self._frames = 0
+    
+    def start(self) -> None:
+        """Pornește golirea periodică a cozii (apelat de pe firul principal)"""
+        if self._running:
+            return
+        self._running = True
+        self._after_id = self.root.after(self.frame_ms, self._flush)
+    
+    def stop(self) -> None:
+        """Oprește dispecerul; actualizările ulterioare sunt ignorate"""
+        self._running = False
+        if self._after_id is not None:
+            try:
+                self.root.after_cancel(self._after_id)
+            except tk.TclError:
+                pass
+            self._after_id = None
+        with self._lock:
+            self._dropped += len(self._pending)
+            self._pending.clear()
+    
+    def post(self, key: Optional[Hashable], callback: Callable, *args: Any) -> None:
+        """
+        Programează un apel pe firul principal
+        
+        Args:
+            key: Cheia elementului actualizat; apelurile cu aceeași cheie din
+                același cadru sunt comasate. None pentru evenimente care
+                trebuie livrate fiecare.
+            callback: Funcția apelată pe firul principal
+        """
+        with self._lock:
+            self._posted += 1
+            if not self._running:
+                self._dropped += 1
+                return
+            
+            if key is None:
+                key = ('event', next(self._unique))
+            elif key in self._pending:
+                self._merged += 1
+                del self._pending[key]
+            posted_at = time.perf_counter() if pipeline_metrics.enabled else None
+            self._pending[key] = (callback, args, posted_at)
+    
+    def wrap(self, callback: Callable, key: Optional[Hashable] = None) -> Callable:
+        """Returnează o funcție care trimite apelul prin dispecer"""
+        def dispatch(*args: Any) -> None:
+            self.post(key, callback, *args)
+        return dispatch
+    
+    def get_stats(self) -> dict:
+        """Returnează câte actualizări au fost primite, comasate, ignorate și executate"""
+        with self._lock:
+            return {
+                'posted': self._posted,
+                'merged': self._merged,
+                'dropped': self._dropped,
+                'executed': self._executed,
+                'pending': len(self._pending),
+                'frames': self._frames
+            }
+    
+    def _flush(self) -> None:
+        """Execută actualizările din coadă (pe firul principal)"""
+        with self._lock:
+            batch = list(self._pending.values())
+            self._pending.clear()
+        
+        for callback, args, posted_at in batch:
+            try:
+                callback(*args)
+            except Exception as e:
+                print(f"Eroare la actualizarea interfeței: {e}")
+            if posted_at is not None:
+                pipeline_metrics.record('dispatch', time.perf_counter() - posted_at)
+        
+        with self._lock:
+            self._executed += len(batch)
+            if batch:
+                self._frames += 1
+        
+        if self._running:
+            self._after_id = self.root.after(self.frame_ms, self._flush)
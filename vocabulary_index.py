@@ -0,0 +1,166 @@
+# vocabulary_index.py
+"""
+Index fuzzy peste vocabular pentru căutarea celor mai apropiate cuvinte
+"""
+import heapq
+from itertools import chain
+from typing import Dict, Iterable, List, Optional, Tuple
+from config import AppConfig
+from similarity import bit_parallel_distance, pattern_masks
+
+class VocabularyIndex:
+    """
+    Index fuzzy peste vocabular
+    
+    Vecinii la distanța 1 sunt găsiți direct printr-un index de ștergeri
+    (fiecare cuvânt cu câte un caracter eliminat). Pentru distanțe mai mari
+    se folosește un index inversat de bigrame, partiționat după lungime:
+    un cuvânt aflat la distanța d de text păstrează cel puțin
+    |bigrame| - 2·d bigrame comune, deci trebuie să apară în una dintre cele
+    mai rare 2·d + 1 liste de bigrame ale textului. Dintre acești candidați,
+    cu lungimea în banda permisă, doar cei care trec filtrul de numărare a
+    bigramelor sunt comparați cu distanța pe biți.
+    """
+    
+    GRAM_SIZE = 2
+    
+    def __init__(self, words: Iterable[str] = (),
+                 max_distance: int = AppConfig.NEAREST_WORD_MAX_DISTANCE):
+        self.max_distance = max_distance
+        self._words: List[str] = []
+        self._originals: List[str] = []
+        self._ids: Dict[str, int] = {}
+        self._gram_sets: List[frozenset] = []
+        self._by_length: Dict[int, List[int]] = {}
+        self._postings: Dict[Tuple[str, int], List[int]] = {}
+        self._deletes: Dict[str, List[int]] = {}
+        self.add_words(words)
+    
+    def __len__(self) -> int:
+        return len(self._words)
+    
+    def __contains__(self, word: str) -> bool:
+        return word.lower().strip() in self._ids
+    
+    def add_words(self, words: Iterable[str]) -> None:
+        """Adaugă mai multe cuvinte în index"""
+        for word in words:
+            self.add_word(word)
+    
+    def add_word(self, word: str) -> None:
+        """Adaugă un cuvânt în index (duplicatele sunt ignorate)"""
+        normalized = word.lower().strip()
+        if not normalized or normalized in self._ids:
+            return
+        
+        word_id = len(self._words)
+        length = len(normalized)
+        self._ids[normalized] = word_id
+        self._words.append(normalized)
+        self._originals.append(word)
+        grams = frozenset(_grams(normalized))
+        self._gram_sets.append(grams)
+        self._by_length.setdefault(length, []).append(word_id)
+        for gram in grams:
+            self._postings.setdefault((gram, length), []).append(word_id)
+        for deleted in _deletions(normalized):
+            self._deletes.setdefault(deleted, []).append(word_id)
+    
+    def nearest(self, text: str, k: int = 1,
+                max_distance: Optional[int] = None) -> List[Tuple[str, int]]:
+        """
+        Caută cele mai apropiate cuvinte din vocabular
+        
+        Args:
+            text: Textul recunoscut
+            k: Numărul maxim de rezultate
+            max_distance: Distanța Levenshtein maximă (implicit self.max_distance)
+            
+        Returns:
+            Lista de (cuvânt, distanță) ordonată crescător după distanță
+        """
+        normalized = text.lower().strip()
+        if not self._words or k <= 0 or not normalized:
+            return []
+        
+        exact_id = self._ids.get(normalized)
+        if k == 1 and exact_id is not None:
+            return [(self._originals[exact_id], 0)]
+        
+        limit = self.max_distance if max_distance is None else max_distance
+        query_length = len(normalized)
+        masks = pattern_masks(normalized)
+        words = self._words
+        
+        # Heap de maxim (distanțe negate) cu cei mai buni k candidați
+        best: List[Tuple[int, int]] = []
+        
+        def consider(word_id: int) -> int:
+            distance = bit_parallel_distance(masks, query_length, words[word_id])
+            if distance <= limit:
+                entry = (-distance, -word_id)
+                if len(best) < k:
+                    heapq.heappush(best, entry)
+                elif entry > best[0]:
+                    heapq.heapreplace(best, entry)
+                if len(best) == k:
+                    return -best[0][0]
+            return limit
+        
+        # Pasul 1: vecinii la distanța 1 se găsesc direct prin indexul de ștergeri
+        keys = {normalized, *_deletions(normalized)}
+        neighbours = set(chain.from_iterable(self._deletes.get(key, ()) for key in keys))
+        neighbours.update(self._ids[key] for key in keys if key in self._ids)
+        for word_id in neighbours:
+            limit = consider(word_id)
+        
+        if limit <= 1 or (len(best) == k and -best[0][0] <= 1):
+            return self._results(best)
+        
+        # Pasul 2: filtrul de bigrame pentru distanțe mai mari
+        best.clear()
+        query_grams = set(_grams(normalized))
+        gram_sets = self._gram_sets
+        
+        # Lungimile apropiate de text sunt verificate primele, ca limita să scadă repede
+        lengths = sorted(range(max(1, query_length - limit), query_length + limit + 1),
+                         key=lambda length: abs(length - query_length))
+        
+        for length in lengths:
+            if abs(length - query_length) > limit:
+                break
+            
+            required = len(query_grams) - self.GRAM_SIZE * limit
+            if required <= 0:
+                candidates: Iterable[int] = self._by_length.get(length, ())
+            else:
+                postings = sorted(
+                    (self._postings.get((gram, length), ()) for gram in query_grams),
+                    key=len
+                )
+                candidates = set(chain.from_iterable(postings[:len(postings) - required + 1]))
+            
+            for word_id in candidates:
+                if len(query_grams & gram_sets[word_id]) >= required:
+                    limit = consider(word_id)
+        
+        return self._results(best)
+    
+    def _results(self, best: List[Tuple[int, int]]) -> List[Tuple[str, int]]:
+        """Transformă heap-ul de candidați în rezultate ordonate"""
+        results = sorted((-neg_distance, -neg_id) for neg_distance, neg_id in best)
+        return [(self._originals[word_id], distance) for distance, word_id in results]
+    
+    def closest_word(self, text: str, max_distance: Optional[int] = None) -> Optional[str]:
+        """Returnează cel mai apropiat cuvânt din vocabular sau None"""
+        matches = self.nearest(text, k=1, max_distance=max_distance)
+        return matches[0][0] if matches else None
+
+def _deletions(word: str) -> List[str]:
+    """Toate variantele cuvântului cu un singur caracter șters"""
+    return [word[:i] + word[i + 1:] for i in range(len(word))]
+
+def _grams(word: str) -> List[str]:
+    """Bigramele cuvântului, cu marcaje de început și sfârșit"""
+    padded = f"^{word}$"
+    return [padded[i:i + VocabularyIndex.GRAM_SIZE] for i in range(len(padded) - 1)]
@@ -0,0 +1,254 @@
+# vocabulary_store.py
+"""
+Depozit SQLite pentru categoriile de cuvinte, cu import în flux și deduplicare
+"""
+import argparse
+import csv
+import os
+import sqlite3
+import threading
+import unicodedata
+from dataclasses import dataclass, field
+from typing import Iterable, Iterator, List, Optional, Tuple
+from config import AppConfig
+
+# Variantele cu sedilă (ş, ţ) sunt aduse la forma corectă, cu virgulă (ș, ț)
+_CEDILLA_FIX = str.maketrans("şţŞŢ", "șțȘȚ")
+_ALLOWED_PUNCTUATION = {" ", "-", "'"}
+# Pachetul implicit și baza de date stau lângă cod, deci nu depind de directorul curent
+_MODULE_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_SEED_FILE = os.path.join(_MODULE_DIR, AppConfig.VOCABULARY_SEED_FILE)
+DEFAULT_DB_FILE = os.path.join(_MODULE_DIR, AppConfig.VOCABULARY_DB)
+
+@dataclass
+class ImportReport:
+    """Rezultatul unui import de cuvinte"""
+    added: int = 0
+    duplicates: int = 0
+    invalid: List[str] = field(default_factory=list)
+    categories: List[str] = field(default_factory=list)
+
+def normalize_word(word: str) -> Optional[str]:
+    """
+    Aduce un cuvânt la forma din depozit sau returnează None dacă nu e valid
+    
+    Forma normalizată: NFC, diacritice cu virgulă, litere mici, spații comasate.
+    Sunt acceptate doar litere, spații, cratime și apostrof.
+    """
+    word = unicodedata.normalize("NFC", word).translate(_CEDILLA_FIX)
+    word = " ".join(word.lower().split())
+    if not word or len(word) > AppConfig.VOCABULARY_MAX_WORD_LENGTH:
+        return None
+    if not all(char.isalpha() or char in _ALLOWED_PUNCTUATION for char in word):
+        return None
+    return word
+
+class VocabularyStore:
+    """
+    Categoriile și cuvintele, păstrate într-o bază SQLite
+    
+    La pornire se citește doar lista categoriilor; cuvintele unei categorii
+    sunt citite abia când sunt cerute. Ordinea cuvintelor este cea de import.
+    """
+    
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS categories (
+            id INTEGER PRIMARY KEY,
+            name TEXT NOT NULL UNIQUE
+        );
+        CREATE TABLE IF NOT EXISTS words (
+            id INTEGER PRIMARY KEY,
+            category_id INTEGER NOT NULL REFERENCES categories(id) ON DELETE CASCADE,
+            word TEXT NOT NULL,
+            UNIQUE (category_id, word)
+        );
+        CREATE INDEX IF NOT EXISTS words_by_word ON words (word);
+    """
+    
+    def __init__(self, path: str = DEFAULT_DB_FILE,
+                 seed_file: Optional[str] = DEFAULT_SEED_FILE):
+        self.path = path
+        self._lock = threading.Lock()
+        # Conexiunea e folosită atât de firul Tk cât și de planificator
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.execute("PRAGMA foreign_keys = ON")
+        self._connection.executescript(self.SCHEMA)
+        
+        if seed_file and self.is_empty():
+            self.import_file(seed_file)
+    
+    def is_empty(self) -> bool:
+        """Verifică dacă depozitul nu are nicio categorie"""
+        with self._lock:
+            return self._connection.execute("SELECT 1 FROM categories LIMIT 1").fetchone() is None
+    
+    def list_categories(self) -> List[str]:
+        """Numele categoriilor, în ordinea în care au fost create"""
+        with self._lock:
+            rows = self._connection.execute("SELECT name FROM categories ORDER BY id").fetchall()
+        return [name for (name,) in rows]
+    
+    def get_words(self, category: str) -> Optional[List[str]]:
+        """Cuvintele unei categorii, sau None dacă ea nu există"""
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT id FROM categories WHERE name = ?", (category,)
+            ).fetchone()
+            if row is None:
+                return None
+            rows = self._connection.execute(
+                "SELECT word FROM words WHERE category_id = ? ORDER BY id", row
+            ).fetchall()
+        return [word for (word,) in rows]
+    
+    def iter_words(self, batch_size: int = AppConfig.VOCABULARY_IMPORT_BATCH) -> Iterator[str]:
+        """Toate cuvintele distincte din depozit, citite pe bucăți"""
+        last = ""
+        while True:
+            with self._lock:
+                rows = self._connection.execute(
+                    "SELECT DISTINCT word FROM words WHERE word > ? ORDER BY word LIMIT ?",
+                    (last, batch_size)
+                ).fetchall()
+            if not rows:
+                return
+            for (word,) in rows:
+                yield word
+            last = rows[-1][0]
+    
+    def import_pairs(self, pairs: Iterable[Tuple[str, str]],
+                     batch_size: int = AppConfig.VOCABULARY_IMPORT_BATCH) -> ImportReport:
+        """
+        Importă perechi (categorie, cuvânt) în flux, pe tranzacții de câte batch_size
+        
+        Cuvintele invalide sunt raportate, iar duplicatele din aceeași
+        categorie sunt ignorate (inclusiv cele care diferă doar prin
+        majuscule, spații sau forma diacriticelor).
+        """
+        report = ImportReport()
+        category_ids = {}
+        batch: List[Tuple[int, str]] = []
+        
+        for category, word in pairs:
+            category = " ".join(category.split())
+            normalized = normalize_word(word)
+            if not category or normalized is None:
+                report.invalid.append(word)
+                continue
+            
+            if category not in category_ids:
+                category_ids[category] = self._ensure_category(category)
+                report.categories.append(category)
+            batch.append((category_ids[category], normalized))
+            
+            if len(batch) >= batch_size:
+                self._insert_batch(batch, report)
+                batch = []
+        
+        if batch:
+            self._insert_batch(batch, report)
+        return report
+    
+    def import_file(self, path: str) -> ImportReport:
+        """
+        Importă un fișier CSV cu rânduri categorie,cuvânt
+        
+        Rândurile goale și cele care încep cu # sunt ignorate.
+        """
+        def rows() -> Iterator[Tuple[str, str]]:
+            with open(path, 'r', encoding='utf-8-sig', newline='') as f:
+                for row in csv.reader(f):
+                    if not row or row[0].lstrip().startswith('#'):
+                        continue
+                    if len(row) != 2:
+                        report_invalid.append(",".join(row))
+                        continue
+                    yield row[0], row[1]
+        
+        report_invalid: List[str] = []
+        try:
+            report = self.import_pairs(rows())
+        except OSError as e:
+            print(f"Eroare citire fișier vocabular {path}: {e}")
+            return ImportReport(invalid=report_invalid)
+        report.invalid.extend(report_invalid)
+        return report
+    
+    def replace_category(self, category: str, words: Iterable[str]) -> ImportReport:
+        """Înlocuiește toate cuvintele unei categorii; cuvintele respinse sunt în raport"""
+        self.delete_category(category)
+        self._ensure_category(" ".join(category.split()))
+        return self.import_pairs((category, word) for word in words)
+    
+    def delete_category(self, category: str) -> bool:
+        """Șterge o categorie împreună cu cuvintele ei"""
+        with self._lock, self._connection:
+            cursor = self._connection.execute("DELETE FROM categories WHERE name = ?", (category,))
+        return cursor.rowcount > 0
+    
+    def close(self) -> None:
+        """Închide conexiunea la baza de date"""
+        with self._lock:
+            self._connection.close()
+    
+    def _ensure_category(self, category: str) -> int:
+        """Returnează id-ul categoriei, creând-o dacă lipsește"""
+        with self._lock, self._connection:
+            self._connection.execute("INSERT OR IGNORE INTO categories (name) VALUES (?)", (category,))
+            (category_id,) = self._connection.execute(
+                "SELECT id FROM categories WHERE name = ?", (category,)
+            ).fetchone()
+        return category_id
+    
+    def _insert_batch(self, batch: List[Tuple[int, str]], report: ImportReport) -> None:
+        """Inserează un lot de cuvinte într-o singură tranzacție"""
+        with self._lock, self._connection:
+            before = self._connection.total_changes
+            self._connection.executemany(
+                "INSERT OR IGNORE INTO words (category_id, word) VALUES (?, ?)", batch
+            )
+            added = self._connection.total_changes - before
+        report.added += added
+        report.duplicates += len(batch) - added
+
+def main():
+    """Punctul de intrare în linia de comandă"""
+    parser = argparse.ArgumentParser(description="Gestionarea vocabularului din depozitul SQLite")
+    parser.add_argument('--db', default=DEFAULT_DB_FILE, help="Fișierul bazei de date")
+    commands = parser.add_subparsers(dest='command', required=True)
+    
+    import_parser = commands.add_parser('import', help="Importă fișiere CSV categorie,cuvânt")
+    import_parser.add_argument('files', nargs='+')
+    import_parser.add_argument('--replace', action='store_true',
+                               help="Înlocuiește categoriile existente din fișiere")
+    commands.add_parser('list', help="Afișează categoriile și numărul de cuvinte")
+    delete_parser = commands.add_parser('delete', help="Șterge o categorie")
+    delete_parser.add_argument('category')
+    args = parser.parse_args()
+    
+    store = VocabularyStore(args.db, seed_file=None)
+    try:
+        if args.command == 'import':
+            for path in args.files:
+                if args.replace:
+                    with open(path, 'r', encoding='utf-8-sig', newline='') as f:
+                        names = {row[0].strip() for row in csv.reader(f)
+                                 if len(row) == 2 and not row[0].lstrip().startswith('#')}
+                    for name in names:
+                        store.delete_category(name)
+                report = store.import_file(path)
+                print(f"{path}: {report.added} adăugate, {report.duplicates} duplicate, "
+                      f"{len(report.invalid)} invalide")
+                for entry in report.invalid[:20]:
+                    print(f"  invalid: {entry!r}")
+        elif args.command == 'list':
+            for name in store.list_categories():
+                print(f"{name}: {len(store.get_words(name))} cuvinte")
+        elif args.command == 'delete':
+            if not store.delete_category(args.category):
+                print(f"Categorie necunoscută: {args.category}")
+    finally:
+        store.close()
+
+if __name__ == "__main__":
+    main()
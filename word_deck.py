@@ -0,0 +1,217 @@
+# word_deck.py
+"""
+Pachete de cuvinte: ordinea în care sunt prezentate cuvintele unei categorii
+"""
+import collections
+import heapq
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Deque, Dict, Iterable, List, Optional, Tuple
+from config import AppConfig
+
+class WordDeck(ABC):
+    """Interfață pentru pachetul de cuvinte al unei categorii"""
+    
+    mode = ""
+    
+    @abstractmethod
+    def next_word(self) -> Optional[str]:
+        """Următorul cuvânt, sau None când pachetul s-a terminat"""
+        pass
+    
+    def record_result(self, word: str, correct: bool) -> None:
+        """Rezultatul unei încercări pentru cuvântul curent"""
+        pass
+    
+    @abstractmethod
+    def upcoming(self, count: int) -> List[str]:
+        """Cuvintele care urmează (pentru pregătirea audio), fără a le scoate"""
+        pass
+    
+    @abstractmethod
+    def remaining(self) -> List[str]:
+        """Toate cuvintele rămase, în ordinea în care ar urma"""
+        pass
+    
+    @abstractmethod
+    def __len__(self) -> int:
+        pass
+    
+    @abstractmethod
+    def to_dict(self) -> dict:
+        """Starea pachetului, serializabilă JSON"""
+        pass
+
+class SequentialDeck(WordDeck):
+    """Fiecare cuvânt o singură dată, în ordinea dată"""
+    
+    mode = "sequential"
+    
+    def __init__(self, words: Iterable[str] = ()):
+        self._words: Deque[str] = collections.deque(words)
+    
+    def next_word(self) -> Optional[str]:
+        return self._words.popleft() if self._words else None
+    
+    def upcoming(self, count: int) -> List[str]:
+        return [self._words[i] for i in range(min(count, len(self._words)))]
+    
+    def remaining(self) -> List[str]:
+        return list(self._words)
+    
+    def __len__(self) -> int:
+        return len(self._words)
+    
+    def to_dict(self) -> dict:
+        return {'mode': self.mode, 'words': list(self._words)}
+    
+    @classmethod
+    def from_dict(cls, data: dict) -> "SequentialDeck":
+        return cls(data['words'])
+
+@dataclass
+class Card:
+    """Progresul unui cuvânt în pachetul cu repetiție spațiată"""
+    streak: int = 0
+    missed: bool = False
+    presentations: int = 0
+
+class SpacedRepetitionDeck(WordDeck):
+    """
+    Pachet cu repetiție spațiată, ținut într-o coadă de priorități (heapq)
+    
+    Prioritatea este pasul (numărul de prezentări) la care cuvântul devine
+    scadent. Un cuvânt greșit sau sărit revine după retry_gap alte cuvinte;
+    unul reușit după o greșeală revine la intervale care se dublează, până la
+    mastery_streak reușite la rând. Cuvintele reușite din prima, cele
+    stăpânite și cele prezentate de max_presentations ori sunt retrase.
+    Alegerea cuvântului următor costă O(log n).
+    """
+    
+    mode = "spaced"
+    
+    def __init__(self, words: Iterable[str] = (),
+                 retry_gap: int = AppConfig.SPACED_RETRY_GAP,
+                 base_interval: int = AppConfig.SPACED_BASE_INTERVAL,
+                 mastery_streak: int = AppConfig.SPACED_MASTERY_STREAK,
+                 max_presentations: int = AppConfig.SPACED_MAX_PRESENTATIONS):
+        self.retry_gap = retry_gap
+        self.base_interval = base_interval
+        self.mastery_streak = mastery_streak
+        self.max_presentations = max_presentations
+        
+        unique_words = list(dict.fromkeys(words))
+        # Intrări (pas scadent, ordine de inserare, cuvânt); ordinea inițială se păstrează
+        self._heap: List[Tuple[int, int, str]] = [(0, order, word) for order, word in enumerate(unique_words)]
+        self._next_order = len(unique_words)
+        self._cards: Dict[str, Card] = {word: Card() for word in unique_words}
+        self._step = 0
+        self._current: Optional[str] = None
+        self._current_correct = False
+        self._current_missed = False
+        self.retired: List[str] = []
+    
+    def next_word(self) -> Optional[str]:
+        self._settle_current()
+        if not self._heap:
+            return None
+        
+        due, _, word = heapq.heappop(self._heap)
+        self._step = max(self._step, due) + 1
+        self._cards[word].presentations += 1
+        self._current = word
+        self._current_correct = False
+        self._current_missed = False
+        return word
+    
+    def record_result(self, word: str, correct: bool) -> None:
+        if word != self._current:
+            return
+        if correct:
+            self._current_correct = True
+        else:
+            self._current_missed = True
+    
+    def _settle_current(self) -> None:
+        """Reprogramează sau retrage cuvântul curent, după rezultatele lui"""
+        word = self._current
+        if word is None:
+            return
+        self._current = None
+        card = self._cards[word]
+        
+        if self._current_correct and not self._current_missed:
+            card.streak += 1
+            if not card.missed or card.streak >= self.mastery_streak:
+                self.retired.append(word)
+                return
+            delay = self.base_interval * 2 ** (card.streak - 1)
+        else:
+            card.missed = True
+            card.streak = 0
+            if card.presentations >= self.max_presentations:
+                self.retired.append(word)
+                return
+            delay = self.retry_gap
+        
+        heapq.heappush(self._heap, (self._step + delay, self._next_order, word))
+        self._next_order += 1
+    
+    def upcoming(self, count: int) -> List[str]:
+        """Cele mai apropiate `count` cuvinte, în O(count log count)"""
+        result = []
+        candidates = [(self._heap[0], 0)] if self._heap else []
+        while candidates and len(result) < count:
+            entry, index = heapq.heappop(candidates)
+            result.append(entry[2])
+            for child in (2 * index + 1, 2 * index + 2):
+                if child < len(self._heap):
+                    heapq.heappush(candidates, (self._heap[child], child))
+        return result
+    
+    def remaining(self) -> List[str]:
+        return [word for _, _, word in sorted(self._heap)]
+    
+    def __len__(self) -> int:
+        return len(self._heap)
+    
+    def to_dict(self) -> dict:
+        return {
+            'mode': self.mode,
+            'settings': [self.retry_gap, self.base_interval, self.mastery_streak, self.max_presentations],
+            'heap': [list(entry) for entry in self._heap],
+            'next_order': self._next_order,
+            'cards': {word: [card.streak, card.missed, card.presentations] for word, card in self._cards.items()},
+            'step': self._step,
+            'current': [self._current, self._current_correct, self._current_missed],
+            'retired': list(self.retired)
+        }
+    
+    @classmethod
+    def from_dict(cls, data: dict) -> "SpacedRepetitionDeck":
+        deck = cls((), *data['settings'])
+        # Lista salvată respectă deja invariantul de heap
+        deck._heap = [tuple(entry) for entry in data['heap']]
+        deck._next_order = data['next_order']
+        deck._cards = {word: Card(*values) for word, values in data['cards'].items()}
+        deck._step = data['step']
+        deck._current, deck._current_correct, deck._current_missed = data['current']
+        deck.retired = list(data['retired'])
+        return deck
+
+DECKS = {
+    SequentialDeck.mode: SequentialDeck,
+    SpacedRepetitionDeck.mode: SpacedRepetitionDeck
+}
+
+def create_deck(words: Iterable[str], mode: str = AppConfig.DECK_MODE) -> WordDeck:
+    """Creează pachetul de tipul cerut"""
+    deck_class = DECKS.get(mode)
+    if deck_class is None:
+        print(f"Mod pachet necunoscut '{mode}', se folosește '{SequentialDeck.mode}'")
+        deck_class = SequentialDeck
+    return deck_class(words)
+
+def deck_from_dict(data: dict) -> WordDeck:
+    """Reconstruiește un pachet salvat cu to_dict()"""
+    return DECKS[data['mode']].from_dict(data)
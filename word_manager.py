@@ -4,75 +4,60 @@ Manager pentru gestionarea categoriilor de cuvinte
 """
 from typing import Dict, List, Optional
 from models import WordCategory
+from vocabulary_index import VocabularyIndex
+from vocabulary_store import ImportReport, VocabularyStore
 
 class WordCategoryManager:
     """Manager pentru categoriile de cuvinte"""
     
-    def __init__(self):
-        self._categories = self._load_categories()
-    
-    def _load_categories(self) -> Dict[str, WordCategory]:
-        """Încarcă toate categoriile de cuvinte"""
-        categories_data = {
-            "Animale": [
-                "pisică", "câine", "cal", "vacă", "porc", "oaie", "capră",
-                "iepure", "găină", "rață", "gâscă", "leu", "tigru", "elefant",
-                "maimuță", "urs", "vulpe", "lup", "șoarece", "pasăre"
-            ],
-            "Obiecte Casă": [
-                "masă", "scaun", "pat", "dulap", "televizor", "frigider",
-                "cuptor", "fereastră", "ușă", "oglindă", "canapea", "fotoliu",
-                "lampă", "ceas", "carte", "pahar", "farfurie", "lingură", "furculiță", "cuțit"
-            ],
-            "Corpul Uman": [
-                "cap", "față", "ochi", "nas", "gură", "ureche", "păr",
-                "gât", "umăr", "braț", "mână", "deget", "piept", "spate",
-                "picior", "genunchi", "picior", "deget de la picior", "inimă", "stomac"
-            ],
-            "Mâncare": [
-                "pâine", "lapte", "apă", "mere", "banane", "portocale",
-                "roșii", "cartofi", "ceapă", "morcovi", "salată", "carne",
-                "pește", "ou", "brânză", "unt", "zahăr", "sare", "orez", "paste"
-            ],
-            "Culori": [
-                "roșu", "albastru", "verde", "galben", "negru", "alb",
-                "portocaliu", "violet", "roz", "maro", "gri", "turcoaz"
-            ],
-            "Familie": [
-                "mamă", "tată", "fiu", "fiică", "bunic", "bunică",
-                "frate", "soră", "unchi", "mătușă", "verișor", "verișoară",
-                "soț", "soție", "copil", "bebeluș", "nepot", "nepoată"
-            ],
-            "Numere": [
-                "unu", "doi", "trei", "patru", "cinci", "șase", "șapte",
-                "opt", "nouă", "zece", "unsprezece", "doisprezece"
-            ],
-            "Verbe Simple": [
-                "merg", "vin", "mănânc", "beau", "dorm", "vorbesc",
-                "citesc", "scriu", "ascult", "privesc", "iau", "dau"
-            ]
-        }
-        
-        return {
-            name: WordCategory(name, words) 
-            for name, words in categories_data.items()
-        }
+    def __init__(self, store: Optional[VocabularyStore] = None):
+        self.store = store or VocabularyStore()
+        # La pornire se citește doar lista categoriilor; cuvintele la prima cerere
+        self._category_names = self.store.list_categories()
+        self._categories: Dict[str, WordCategory] = {}
+        self._vocabulary_index: Optional[VocabularyIndex] = None
     
     def get_category_names(self) -> List[str]:
         """Returnează numele tuturor categoriilor"""
-        return list(self._categories.keys())
+        return list(self._category_names)
     
     def get_category(self, name: str) -> Optional[WordCategory]:
-        """Returnează o categorie specifică"""
-        return self._categories.get(name)
+        """Returnează o categorie specifică (încărcată din depozit la prima cerere)"""
+        category = self._categories.get(name)
+        if category is None and name in self._category_names:
+            words = self.store.get_words(name)
+            if words is None:
+                return None
+            category = self._categories[name] = WordCategory(name, words)
+        return category
     
-    def add_category(self, name: str, words: List[str]) -> None:
-        """Adaugă o categorie nouă"""
-        self._categories[name] = WordCategory(name, words)
+    def get_vocabulary_index(self) -> VocabularyIndex:
+        """Returnează indexul fuzzy peste toate cuvintele (construit la prima cerere)"""
+        if self._vocabulary_index is None:
+            self._vocabulary_index = VocabularyIndex(self.store.iter_words())
+        return self._vocabulary_index
+    
+    def add_category(self, name: str, words: List[str]) -> ImportReport:
+        """
+        Adaugă (sau înlocuiește) o categorie în depozit
+        
+        Returns:
+            Raportul importului; cuvintele invalide nu sunt adăugate și apar în report.invalid
+        """
+        report = self.store.replace_category(name, words)
+        if report.invalid:
+            print(f"Categoria {name}: {len(report.invalid)} cuvinte invalide ignorate")
+        self._categories.pop(name, None)
+        if name not in self._category_names:
+            self._category_names.append(name)
+        self._vocabulary_index = None
+        return report
     
     def remove_category(self, name: str) -> bool:
         """Șterge o categorie"""
-        if name in self._categories:
-            del self._categories[name]
-            return True
-        return False
\ No newline at end of file
+        if not self.store.delete_category(name):
+            return False
+        self._categories.pop(name, None)
+        self._category_names.remove(name)
+        self._vocabulary_index = None
+        return True
\ No newline at end of file